@@ -9,15 +9,31 @@ profile facts used in conversational AI systems.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Dict
+import sys
+from typing import Dict, Tuple
 
 from .types import ExtractedFact
 
+# pyahocorasick is optional; without it the technical-vocabulary scan falls
+# back to a single regex alternation
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 _WS_RE = re.compile(r"\s+")
 
 
+# One alternation for every separator: Oxford-comma "and"/"or" (tried first
+# so the comma and connector are consumed together), standalone "and"/"or",
+# and the single-character separators.
+_SEP_RE = re.compile(r"(?:,\s+|\s+)(?:and|or)(?:\s+(?:and|or))*\s+|[,;/]", re.IGNORECASE)
+_BULLET_RE = re.compile(r'[•\-\*]\s*')
+
+
 def split_compound_values(text: str) -> list[str]:
     """Split compound values into individual claims.
     
@@ -58,27 +74,19 @@ def split_compound_values(text: str) -> list[str]:
             result.extend(split_compound_values(line))
         return result
     
-    # Replace multiple separators with commas for uniform splitting
-    # Order matters: process "and"/"or" before other separators
-    normalized = text
-    
-    # Handle "X, Y, and Z" pattern (Oxford comma)
-    normalized = re.sub(r',\s+and\s+', ', ', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r',\s+or\s+', ', ', normalized, flags=re.IGNORECASE)
-    
-    # Handle standalone "and"/"or"
-    normalized = re.sub(r'\s+and\s+', ', ', normalized, flags=re.IGNORECASE)
-    normalized = re.sub(r'\s+or\s+', ', ', normalized, flags=re.IGNORECASE)
-    
-    # Handle slashes and semicolons
-    normalized = normalized.replace('/', ', ')
-    normalized = normalized.replace(';', ', ')
+    # Most values are a single item; skip the split when no separator
+    # character or connector word can be present.
+    lowered = text.lower()
+    if ("and" not in lowered and "or" not in lowered
+            and "," not in text and ";" not in text and "/" not in text):
+        parts = [text]
+    else:
+        # Split on all separators in one pass
+        parts = _SEP_RE.split(text)
     
     # Handle bullets (•, -, *)
-    normalized = re.sub(r'[•\-\*]\s*', '', normalized)
-    
-    # Split on commas and clean
-    parts = [p.strip() for p in normalized.split(',')]
+    if '-' in text or '*' in text or '•' in text:
+        parts = [_BULLET_RE.sub('', part) for part in parts]
     
     # Filter out empty strings and common list artifacts
     cleaned = []
@@ -102,6 +110,87 @@ _NAME_STOPWORDS = {
 }
 
 
+# Literal keywords that every pattern in an extractor group requires.  A
+# group whose keywords never occur cannot match and is skipped.  ASCII text is
+# lower-cased once and searched with one case-sensitive alternation per group;
+# other text goes through a single IGNORECASE scan, where each alternative
+# sits in a lookahead so overlapping keywords from different groups are seen.
+_GROUP_TRIGGERS = {
+    "education": ("undergrad", "master", "graduated", "studied", "degree", "major", "minor"),
+    "personal": (
+        "sibling", "language", "named", "roast", "hobby", "enjoy", "love", "like",
+        "taken up", "reading", "kid", "child", "wife", "husband", "partner",
+        "spouse", "phone", "cell", "mobile", "mail",
+    ),
+    "professional": (
+        "project", "favorite", "prefer", "use", "know", "work", "previously",
+        "formerly", "promoted", "expert", "proficient", "skilled", "experienced",
+    ),
+}
+_TRIGGER_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>{'|'.join(map(re.escape, words))})"
+        for group, words in _GROUP_TRIGGERS.items()
+    ) + ")",
+    re.IGNORECASE,
+)
+_TRIGGER_GROUP_RES = {
+    group: re.compile("|".join(map(re.escape, words)))
+    for group, words in _GROUP_TRIGGERS.items()
+}
+
+
+def _triggered_groups(text: str) -> set:
+    """Return the extractor groups whose trigger keywords occur in *text*."""
+    # Case-insensitive alternations are slow in ``re``; for ASCII text,
+    # lower-casing first gives the same answer with plain literal searches.
+    if text.isascii():
+        lowered = text.lower()
+        return {group for group, pat in _TRIGGER_GROUP_RES.items() if pat.search(lowered)}
+    groups = set()
+    for m in _TRIGGER_RE.finditer(text):
+        groups.add(m.lastgroup)
+        if len(groups) == len(_GROUP_TRIGGERS):
+            break
+    return groups
+
+
+_WORD_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+@functools.lru_cache(maxsize=8)
+def _text_words(text: str) -> frozenset:
+    """Lower-cased ``\\w`` tokens of an ASCII *text*."""
+    return frozenset(_WORD_TOKEN_RE.findall(text.lower()))
+
+
+class _WordGatedPattern:
+    """A compiled pattern that is only run when one of its key words occurs.
+
+    Many patterns are specialised to one sentence shape ("I work at X",
+    "I think X") and cannot match unless a particular word is present.
+    Each of ``words`` must appear as a whole word, bounded by ``\\b`` or
+    whitespace, in every match.  For ASCII text the word set of the text
+    is checked first; other text always runs the pattern, since
+    ``str.lower()`` and IGNORECASE matching can disagree there.
+    """
+
+    __slots__ = ("pattern", "words")
+
+    def __init__(self, pattern: str, flags: int = 0, *, words):
+        self.pattern = re.compile(pattern, flags)
+        self.words = frozenset(words)
+
+    def _may_match(self, text: str) -> bool:
+        return not text.isascii() or not self.words.isdisjoint(_text_words(text))
+
+    def search(self, text: str):
+        return self.pattern.search(text) if self._may_match(text) else None
+
+    def finditer(self, text: str):
+        return self.pattern.finditer(text) if self._may_match(text) else iter(())
+
+
 def _norm_text(value: str) -> str:
     """Normalize text for comparison."""
     value = _WS_RE.sub(" ", value.strip())
@@ -126,12 +215,207 @@ def is_question(text: str) -> bool:
 def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
     """Extract a small set of personal-profile fact slots from free text.
     
+    Results are memoized per input string (the same memory texts are
+    re-extracted on every verify() call); each call returns a fresh dict
+    that the caller may modify.
+    
     Args:
         text: Input text to extract facts from
         
     Returns:
         Dictionary mapping slot names to ExtractedFact objects
     """
+    return dict(_extract_fact_slots_cached(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_fact_slots_cached(text: str) -> Tuple[Tuple[str, ExtractedFact], ...]:
+    """Immutable, cached form of :func:`extract_fact_slots`."""
+    # Slot names built from matched text (FACT: keys, "my X is Y" subjects)
+    # are fresh strings; interning them lets the verifier's slot-keyed dict
+    # and set lookups short-circuit on identity like the literal slot names.
+    items = []
+    for slot, fact in _extract_fact_slots(text).items():
+        slot = sys.intern(slot)
+        if fact.slot == slot:
+            fact.slot = slot
+        items.append((slot, fact))
+    return tuple(items)
+
+
+# Name extraction patterns
+# Stop at coordinating conjunctions and punctuation
+_NAME_PAT = r"([A-Za-z][A-Za-z'-]{1,40}(?:\s+[A-Za-z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)"
+_NAME_PAT_TITLE = r"([A-Z][A-Za-z'-]{1,40}(?:\s+[A-Z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)"
+
+_STRUCTURED_FACT_RE = _WordGatedPattern(
+    r"\b(?:FACT|PREF):\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(.+?)\s*$",
+    re.IGNORECASE,
+    words=("fact", "pref"),
+)
+_OTHER_NAME_RE = _WordGatedPattern(
+    r"\b(?:your|user'?s) name is\s+([A-Z][A-Za-z'-]{1,40}(?:\s+[A-Z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)",
+    re.IGNORECASE,
+    words=("name",),
+)
+_GREETING_NAME_RE = re.compile(
+    r"(?:^|\.\s+)(?:Hi|Hey|Hello|Yo|Howdy|Sup|Greetings)\s+([A-Z][A-Za-z'-]{1,40})(?:\s*[!,.\s]|$)",
+)
+_CALL_ME_RE = _WordGatedPattern(
+    r"\bcall me\s+" + _NAME_PAT,
+    re.IGNORECASE,
+    words=("call",),
+)
+_NAME_CORRECTION_RE = re.compile(
+    r"^\s*([A-Z][A-Za-z'-]{1,40})\s+not\s+([A-Z][A-Za-z'-]{1,40})\s*[\.!?]?\s*$",
+)
+_MY_NAME_IS_RE = re.compile(r"\bmy name is\s+" + _NAME_PAT + r"\b", re.IGNORECASE)
+_IM_NAME_RE = _WordGatedPattern(
+    r"\bi\s*['']?m\s+" + _NAME_PAT_TITLE,
+    words=("im", "m"),
+)
+_I_AM_NAME_RE = _WordGatedPattern(
+    r"\bi\s+am\s+" + _NAME_PAT_TITLE,
+    re.IGNORECASE,
+    words=("am",),
+)
+_IM_LOWERCASE_NAME_RE = re.compile(
+    r"^\s*i\s*['']?m\s+([a-z][a-z'-]{1,40})\s*[\.!?]?\s*$",
+    re.IGNORECASE,
+)
+_COMPOUND_INTRO_RE = _WordGatedPattern(
+    r"\bI (?:am|'m) (?:a |an )?(?P<occupation>[^,]+?)\s+(?:from|in)\s+(?P<location>.+?)(?:\.|$|,)",
+    re.IGNORECASE,
+    words=("am", "m"),
+)
+_SELF_EMPLOYED_RE = re.compile(
+    r"\b(?:i work for myself|i'm self[- ]?employed|i am self[- ]?employed)",
+    re.IGNORECASE,
+)
+_I_RUN_RE = _WordGatedPattern(
+    r"\bi run (?:a |an )?([^\n\r\.;,]+?)(?:\s+(?:called|and|but|,|\.|;)|\s*$)",
+    re.IGNORECASE,
+    words=("run",),
+)
+_CALLED_NAME_RE = re.compile(
+    r"called\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+(?:and|but|,|\.|;\()|\s*$)",
+)
+_WORK_AT_RE = _WordGatedPattern(
+    r"\b(?:i|you|user|he|she|they) (?:currently )?(?:work(?:s)? (?:at|for)|(?:is|am|are) employed by)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|\s+in|\s+on|\s+for|\s+with|\s+where|\s*,|\.|;|\s+previously)|\s*$)",
+    re.IGNORECASE,
+    words=("work", "works", "employed"),
+)
+_AND_WORK_AT_RE = _WordGatedPattern(
+    r"\band\s+work(?:s)? (?:at|for)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|\s+in|,|\.|;)|\s*$)",
+    re.IGNORECASE,
+    words=("work", "works"),
+)
+_YOURE_WORKING_AT_RE = _WordGatedPattern(
+    r"\byou're working (?:at|for)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|,|\.|;)|\s*$)",
+    re.IGNORECASE,
+    words=("working",),
+)
+_TITLE_AT_COMPANY_RE = _WordGatedPattern(
+    r"\b(?:user|he|she|they|i|you)\s+(?:is|am|are|was|were)\s+a\s+[A-Z][A-Za-z\s]+?\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+in|,|\.|;|\s*$)",
+    re.IGNORECASE,
+    words=("at",),
+)
+_NAMED_TITLE_AT_COMPANY_RE = _WordGatedPattern(
+    r"\b[A-Z][a-z]+\s+(?:is|was)\s+a\s+[A-Z][A-Za-z\s]+?\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+in|,|\.|;|\s*$)",
+    re.IGNORECASE,
+    words=("at",),
+)
+_ROLE_AT_COMPANY_RE = _WordGatedPattern(
+    r"\b(?:my|your|the|their|his|her)\s+(?:role|position|job|career|work|time|gig|stint|things)\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+but|\s+in|\s+is|\s+was|\s+has|,|\.|;|\?|!|\s*$)",
+    re.IGNORECASE,
+    words=("role", "position", "job", "career", "work", "time", "gig", "stint", "things"),
+)
+_JOINED_COMPANY_RE = _WordGatedPattern(
+    r"\b(?:started|joined|left|quit|resigned from|hired at|employed at|interning at|interned at)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+but|\s+in|\s+as|,|\.|;|\s*$)",
+    re.IGNORECASE,
+    words=(
+        "started", "joined", "left", "quit", "resigned", "hired", "employed",
+        "interning", "interned",
+    ),
+)
+_EMPLOYER_TRIM_RE = re.compile(
+    r"\b(?:as|and|but|in|though|however|previously)\b|[,\.;]",
+    re.IGNORECASE,
+)
+_AS_TITLE_RE = _WordGatedPattern(
+    r"\bas\s+(?:a\s+)?([A-Z][A-Za-z\s]+?)(?:\s+(?:and|but|in|at|graduated)|\s*$)",
+    re.IGNORECASE,
+    words=("as",),
+)
+_MY_TITLE_IS_RE = _WordGatedPattern(
+    r"\bmy (?:role|job title|title) is\s+([^\n\r\.;,]+)",
+    re.IGNORECASE,
+    words=("role", "title"),
+)
+_I_AM_A_TITLE_RE = _WordGatedPattern(
+    r"\b(?:i am a|i'm a)\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:by|at|for|and)|\s*$)",
+    words=("am", "m"),
+)
+_THIRD_PERSON_TITLE_RE = _WordGatedPattern(
+    r"\b(?:user|he|she|they)\s+(?:is|was)\s+a\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|for|in|and|with)|\.|,|;|\s*$)",
+    re.IGNORECASE,
+    words=("user", "he", "she", "they"),
+)
+_BY_TRADE_TITLE_RE = _WordGatedPattern(
+    r"\b([A-Z][A-Za-z\s]+?)\s+by\s+(?:degree|trade|profession)",
+    words=("by",),
+)
+_TITLE_TRIM_RE = re.compile(r"\b(?:at|for|in|by)\b", re.IGNORECASE)
+_LIVES_IN_RE = _WordGatedPattern(
+    r"\b(?:i|you|user|he|she|they) (?:lives?|resides?|moved to) in\s+(?:a\s+)?(?:\d+-bedroom\s+apartment\s+in\s+)?([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)",
+    re.IGNORECASE,
+    words=("live", "lives", "reside", "resides", "moved"),
+)
+_MOVED_TO_RE = _WordGatedPattern(
+    r"\b(?:i|you|user|he|she|they) moved to\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)",
+    re.IGNORECASE,
+    words=("moved",),
+)
+_BASED_IN_RE = _WordGatedPattern(
+    r"\b(?:life|based|living|located|settling|settled)\s+in\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\s+is|\s+has|\.|,|;|\?|!|\s*$)",
+    re.IGNORECASE,
+    words=("life", "based", "living", "located", "settling", "settled"),
+)
+_WORKS_IN_LOCATION_RE = re.compile(
+    r"\bworks? (?:at|for)\s+[A-Za-z0-9\s&\-\.]+?\s+in\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_LEADING_IN_RE = re.compile(r'^\s*in\s+', re.IGNORECASE)
+_NEAR_WITH_RE = re.compile(r'\s+(?:near|with)\s+', re.IGNORECASE)
+_LOCATION_TRIM_RE = re.compile(r"\s+(?:and|last|this|on|during)\s+|\.|,")
+_PROGRAMMING_YEARS_RE = re.compile(
+    r"\b(?:i'?ve been programming for|i have been programming for)\s+(\d{1,3})\s+years\b",
+    re.IGNORECASE,
+)
+_FIRST_LANGUAGE_RE = _WordGatedPattern(
+    r"\b(?:starting with|started with|my first (?:programming )?language was)\s+([A-Z][A-Za-z0-9+_.#-]{1,40})\b",
+    re.IGNORECASE,
+    words=("starting", "started", "first"),
+)
+_TEAM_OF_RE = _WordGatedPattern(
+    r"\bteam of\s+(\d{1,3})\b",
+    re.IGNORECASE,
+    words=("team",),
+)
+_TEAM_IS_RE = _WordGatedPattern(
+    r"\bteam is\s+(\d{1,3})\b",
+    re.IGNORECASE,
+    words=("team",),
+)
+_FAVORITE_COLOR_RE = re.compile(
+    r"\bmy\s+favou?rite\s+colou?r\s+is\s+([^\n\r\.;,!\?]{2,60})",
+    re.IGNORECASE,
+)
+_COLOR_TRIM_RE = re.compile(r"\b(?:and|but|though|however)\b", re.IGNORECASE)
+
+
+def _extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
+    """Uncached implementation of :func:`extract_fact_slots`."""
     facts: Dict[str, ExtractedFact] = {}
 
     if not text or not text.strip():
@@ -141,11 +425,7 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
     # Examples:
     # - "FACT: name = Nick"
     # - "PREF: communication_style = concise"
-    structured = re.search(
-        r"\b(?:FACT|PREF):\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(.+?)\s*$",
-        text.strip(),
-        flags=re.IGNORECASE,
-    )
+    structured = _STRUCTURED_FACT_RE.search(text.strip())
     if structured:
         slot = structured.group(1).strip().lower()
         value_raw = structured.group(2).strip()
@@ -155,15 +435,10 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
             facts[slot] = ExtractedFact(slot, value_raw, _norm_text(value_raw))
             return facts
 
-    # Name extraction patterns
-    # Stop at coordinating conjunctions and punctuation  
-    name_pat = r"([A-Za-z][A-Za-z'-]{1,40}(?:\s+[A-Za-z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)"
-    name_pat_title = r"([A-Z][A-Za-z'-]{1,40}(?:\s+[A-Z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)"
-    
     # Also extract from second and third person patterns
     # "Your name is X", "User's name is X"
     if "name" not in facts:
-        m_other = re.search(r"\b(?:your|user'?s) name is\s+([A-Z][A-Za-z'-]{1,40}(?:\s+[A-Z][A-Za-z'-]{1,40}){0,2})(?:(?:\s+and|\s+or|,|\.|;)|\s*$)", text, flags=re.IGNORECASE)
+        m_other = _OTHER_NAME_RE.search(text)
         if m_other:
             name = m_other.group(1).strip()
             if name and name.lower() not in _NAME_STOPWORDS:
@@ -172,10 +447,7 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
     # Greeting pattern: "Hi Mike!", "Hey Sarah,", "Hello Dr. Jones"
     # Only match when the greeting is near the start of the text (first 50 chars)
     if "name" not in facts:
-        m_greet = re.search(
-            r"(?:^|\.\s+)(?:Hi|Hey|Hello|Yo|Howdy|Sup|Greetings)\s+([A-Z][A-Za-z'-]{1,40})(?:\s*[!,.\s]|$)",
-            text[:80],
-        )
+        m_greet = _GREETING_NAME_RE.search(text[:80])
         if m_greet:
             greet_name = m_greet.group(1).strip()
             if greet_name.lower() not in _NAME_STOPWORDS and greet_name.lower() not in {"there", "all", "everyone", "everybody", "folks", "team", "guys", "dear"}:
@@ -183,41 +455,38 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
 
     # Very explicit "call me" pattern
     if "name" not in facts:
-        m = re.search(r"\bcall me\s+" + name_pat, text, flags=re.IGNORECASE)
+        m = _CALL_ME_RE.search(text)
     else:
         m = None
     if m:
         name = m.group(1).strip()
-        tokens = [t for t in re.split(r"\s+", name) if t]
+        tokens = [t for t in _WS_RE.split(name) if t]
         token_lowers = [t.lower() for t in tokens]
         if tokens and not any(t in _NAME_STOPWORDS for t in token_lowers):
             facts["name"] = ExtractedFact("name", name, _norm_text(name))
 
     # Short correction pattern: "Nick not Ben"
     if "name" not in facts:
-        m = re.match(
-            r"^\s*([A-Z][A-Za-z'-]{1,40})\s+not\s+([A-Z][A-Za-z'-]{1,40})\s*[\.!?]?\s*$",
-            text,
-        )
+        m = _NAME_CORRECTION_RE.match(text)
         if m:
             cand = m.group(1).strip()
             if cand and cand.lower() not in _NAME_STOPWORDS:
                 facts["name"] = ExtractedFact("name", cand, _norm_text(cand))
 
     # "My name is X" pattern
-    m = re.search(r"\bmy name is\s+" + name_pat + r"\b", text, flags=re.IGNORECASE)
+    m = _MY_NAME_IS_RE.search(text)
     if not m:
         # Prefer TitleCase names for the generic "I'm X" pattern
-        m = re.search(r"\bi\s*['']?m\s+" + name_pat_title, text)
+        m = _IM_NAME_RE.search(text)
         if not m:
             # Also try "I am" pattern
-            m = re.search(r"\bi\s+am\s+" + name_pat_title, text, flags=re.IGNORECASE)
+            m = _I_AM_NAME_RE.search(text)
         if not m:
             # Allow single-token lowercase name, but only when it appears as a direct name declaration
-            m = re.search(r"^\s*i\s*['']?m\s+([a-z][a-z'-]{1,40})\s*[\.!?]?\s*$", text, flags=re.IGNORECASE)
+            m = _IM_LOWERCASE_NAME_RE.search(text)
     if m:
         name = m.group(1).strip()
-        tokens = [t for t in re.split(r"\s+", name) if t]
+        tokens = [t for t in _WS_RE.split(name) if t]
         token_lowers = [t.lower() for t in tokens]
 
         # Filter obvious non-name phrases like "I'm trying to build ..."
@@ -229,11 +498,7 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
             facts["name"] = ExtractedFact("name", name, _norm_text(name))
 
     # Compound introduction: "I am a Web Developer from Milwaukee Wisconsin"
-    compound_intro = re.search(
-        r"\bI (?:am|'m) (?:a |an )?(?P<occupation>[^,]+?)\s+(?:from|in)\s+(?P<location>.+?)(?:\.|$|,)",
-        text,
-        re.IGNORECASE
-    )
+    compound_intro = _COMPOUND_INTRO_RE.search(text)
     if compound_intro:
         occ = compound_intro.group("occupation").strip()
         loc = compound_intro.group("location").strip()
@@ -244,15 +509,15 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
             facts["location"] = ExtractedFact("location", loc, loc.lower())
 
     # Employer extraction
-    if re.search(r"\b(?:i work for myself|i'm self[- ]?employed|i am self[- ]?employed)", text, flags=re.IGNORECASE):
+    if _SELF_EMPLOYED_RE.search(text):
         facts["employer"] = ExtractedFact("employer", "self-employed", "self-employed")
     
     # "I run [business]" pattern
-    m = re.search(r"\bi run (?:a |an )?([^\n\r\.;,]+?)(?:\s+(?:called|and|but|,|\.|;)|\s*$)", text, flags=re.IGNORECASE)
+    m = _I_RUN_RE.search(text)
     if m and "employer" not in facts:
         business = m.group(1).strip()
         # Extract business name if "called X" follows
-        m2 = re.search(r"called\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+(?:and|but|,|\.|;\()|\s*$)", text)
+        m2 = _CALLED_NAME_RE.search(text)
         if m2:
             business = m2.group(1).strip()
         if business:
@@ -261,42 +526,38 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
     # "I work at/for X" pattern (first, second, and third person)
     if "employer" not in facts:
         # Primary pattern with subject pronoun
-        m = re.search(
-            r"\b(?:i|you|user|he|she|they) (?:currently )?(?:work(?:s)? (?:at|for)|(?:is|am|are) employed by)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|\s+in|\s+on|\s+for|\s+with|\s+where|\s*,|\.|;|\s+previously)|\s*$)",
-            text,
-            flags=re.IGNORECASE,
-        )
+        m = _WORK_AT_RE.search(text)
         if not m:
             # Pattern for continuation after "and" (e.g., "lives in X and works at Y")
-            m = re.search(r"\band\s+work(?:s)? (?:at|for)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|\s+in|,|\.|;)|\s*$)", text, flags=re.IGNORECASE)
+            m = _AND_WORK_AT_RE.search(text)
         if not m:
             # Try "you're working at/for X" pattern
-            m = re.search(r"\byou're working (?:at|for)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:(?:\s+as|\s+and|\s+but|,|\.|;)|\s*$)", text, flags=re.IGNORECASE)
+            m = _YOURE_WORKING_AT_RE.search(text)
         if not m:
             # Try "User is a [title] at [company]" pattern
-            m = re.search(r"\b(?:user|he|she|they|i|you)\s+(?:is|am|are|was|were)\s+a\s+[A-Z][A-Za-z\s]+?\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+in|,|\.|;|\s*$)", text, flags=re.IGNORECASE)
+            m = _TITLE_AT_COMPANY_RE.search(text)
         if not m:
             # Try "[Name] is a [title] at [company]" pattern (for third-person references)
-            m = re.search(r"\b[A-Z][a-z]+\s+(?:is|was)\s+a\s+[A-Z][A-Za-z\s]+?\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+in|,|\.|;|\s*$)", text, flags=re.IGNORECASE)
+            m = _NAMED_TITLE_AT_COMPANY_RE.search(text)
         if not m:
             # Try "role/position/job/career/things at [company]" pattern
             # Catches: "your role at Disney", "things at PayPal", "my position at Google"
-            m = re.search(r"\b(?:my|your|the|their|his|her)\s+(?:role|position|job|career|work|time|gig|stint|things)\s+at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+but|\s+in|\s+is|\s+was|\s+has|,|\.|;|\?|!|\s*$)", text, flags=re.IGNORECASE)
+            m = _ROLE_AT_COMPANY_RE.search(text)
         if not m:
             # Try "[verb] at [company]" with contextual verbs
             # Catches: "started at Google", "joined Netflix", "left Amazon"
-            m = re.search(r"\b(?:started|joined|left|quit|resigned from|hired at|employed at|interning at|interned at)\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+and|\s+but|\s+in|\s+as|,|\.|;|\s*$)", text, flags=re.IGNORECASE)
+            m = _JOINED_COMPANY_RE.search(text)
         if m:
             employer_raw = m.group(1)
             # Trim at common continuations (redundant now but kept for safety)
-            employer_raw = re.split(r"\b(?:as|and|but|in|though|however|previously)\b|[,\.;]", employer_raw, maxsplit=1, flags=re.IGNORECASE)[0]
+            employer_raw = _EMPLOYER_TRIM_RE.split(employer_raw, maxsplit=1)[0]
             employer_raw = employer_raw.strip()
             if employer_raw:
                 facts["employer"] = ExtractedFact("employer", employer_raw, _norm_text(employer_raw))
 
     # Job title / role / occupation
     # Try to extract from "as X" patterns first
-    m = re.search(r"\bas\s+(?:a\s+)?([A-Z][A-Za-z\s]+?)(?:\s+(?:and|but|in|at|graduated)|\s*$)", text, flags=re.IGNORECASE)
+    m = _AS_TITLE_RE.search(text)
     if m:
         title_raw = m.group(1).strip()
         # Avoid capturing company names as titles
@@ -304,88 +565,80 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
             facts["title"] = ExtractedFact("title", title_raw, _norm_text(title_raw))
     
     if "title" not in facts:
-        m = re.search(r"\bmy (?:role|job title|title) is\s+([^\n\r\.;,]+)", text, flags=re.IGNORECASE)
+        m = _MY_TITLE_IS_RE.search(text)
         if not m:
-            m = re.search(r"\b(?:i am a|i'm a)\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:by|at|for|and)|\s*$)", text)
+            m = _I_AM_A_TITLE_RE.search(text)
             if not m:
                 # Try "User is a [title]" pattern
-                m = re.search(r"\b(?:user|he|she|they)\s+(?:is|was)\s+a\s+([A-Z][A-Za-z\s]+?)(?:\s+(?:at|for|in|and|with)|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+                m = _THIRD_PERSON_TITLE_RE.search(text)
             if not m:
-                m = re.search(r"\b([A-Z][A-Za-z\s]+?)\s+by\s+(?:degree|trade|profession)", text)
+                m = _BY_TRADE_TITLE_RE.search(text)
         if m:
             title_raw = m.group(1).strip()
-            title_raw = re.split(r"\b(?:at|for|in|by)\b", title_raw, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+            title_raw = _TITLE_TRIM_RE.split(title_raw, maxsplit=1)[0].strip()
             if title_raw and len(title_raw.split()) <= 4:  # Keep it reasonable (1-4 words)
                 facts["title"] = ExtractedFact("title", title_raw, _norm_text(title_raw))
 
     # Location (first, second, and third person)
     # Try explicit location patterns first
-    m = re.search(r"\b(?:i|you|user|he|she|they) (?:lives?|resides?|moved to) in\s+(?:a\s+)?(?:\d+-bedroom\s+apartment\s+in\s+)?([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+    m = _LIVES_IN_RE.search(text)
     if not m:
-        m = re.search(r"\b(?:i|you|user|he|she|they) moved to\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+        m = _MOVED_TO_RE.search(text)
     if not m:
         # "life in X", "based in X", "living in X", "located in X"
         # Catches: "life in Miami", "how's life in Austin", "I'm based in NYC"
-        m = re.search(r"\b(?:life|based|living|located|settling|settled)\s+in\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\s+is|\s+has|\.|,|;|\?|!|\s*$)", text, flags=re.IGNORECASE)
+        m = _BASED_IN_RE.search(text)
     if not m and "employer" in facts:
         # Check for "work at [company] in [location]" pattern
-        m = re.search(r"\bworks? (?:at|for)\s+[A-Za-z0-9\s&\-\.]+?\s+in\s+([A-Z][a-zA-Z .'-]+?)(?:\s+near|\s+with|\s+and|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+        m = _WORKS_IN_LOCATION_RE.search(text)
     if m:
         loc_value = m.group(1).strip()
         # Remove "in" prefix if present
-        loc_value = re.sub(r'^\s*in\s+', '', loc_value, flags=re.IGNORECASE).strip()
+        loc_value = _LEADING_IN_RE.sub('', loc_value).strip()
         # Trim at common spatial modifiers (safety)
-        loc_value = re.split(r'\s+(?:near|with)\s+', loc_value, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+        loc_value = _NEAR_WITH_RE.split(loc_value, maxsplit=1)[0].strip()
         # Split on temporal markers or punctuation and take first part
-        loc_value = re.split(r"\s+(?:and|last|this|on|during)\s+|\.|,", loc_value, maxsplit=1)[0].strip()
+        loc_value = _LOCATION_TRIM_RE.split(loc_value, maxsplit=1)[0].strip()
         if loc_value:
             facts["location"] = ExtractedFact("location", loc_value, _norm_text(loc_value))
 
     # Years programming experience
-    m = re.search(
-        r"\b(?:i'?ve been programming for|i have been programming for)\s+(\d{1,3})\s+years\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _PROGRAMMING_YEARS_RE.search(text)
     if m:
         years = int(m.group(1))
         facts["programming_years"] = ExtractedFact("programming_years", years, str(years))
 
     # First programming language
-    m = re.search(
-        r"\b(?:starting with|started with|my first (?:programming )?language was)\s+([A-Z][A-Za-z0-9+_.#-]{1,40})\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _FIRST_LANGUAGE_RE.search(text)
     if m:
         lang = m.group(1).strip()
         facts["first_language"] = ExtractedFact("first_language", lang, _norm_text(lang))
 
     # Team size
-    m = re.search(r"\bteam of\s+(\d{1,3})\b", text, flags=re.IGNORECASE)
+    m = _TEAM_OF_RE.search(text)
     if not m:
-        m = re.search(r"\bteam is\s+(\d{1,3})\b", text, flags=re.IGNORECASE)
+        m = _TEAM_IS_RE.search(text)
     if m:
         size = int(m.group(1))
         facts["team_size"] = ExtractedFact("team_size", size, str(size))
 
     # Favorite color
-    m = re.search(
-        r"\bmy\s+favou?rite\s+colou?r\s+is\s+([^\n\r\.;,!\?]{2,60})",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _FAVORITE_COLOR_RE.search(text)
     if m:
         color_raw = m.group(1).strip()
         # Trim at common continuations
-        color_raw = re.split(r"\b(?:and|but|though|however)\b", color_raw, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+        color_raw = _COLOR_TRIM_RE.split(color_raw, maxsplit=1)[0].strip()
         if color_raw:
             facts["favorite_color"] = ExtractedFact("favorite_color", color_raw, _norm_text(color_raw))
 
     # Additional facts from original implementation
-    _extract_education_facts(text, facts)
-    _extract_personal_facts(text, facts)
-    _extract_professional_facts(text, facts)
+    triggered = _triggered_groups(text)
+    if "education" in triggered:
+        _extract_education_facts(text, facts)
+    if "personal" in triggered:
+        _extract_personal_facts(text, facts)
+    if "professional" in triggered:
+        _extract_professional_facts(text, facts)
 
     # General-purpose extraction — catches facts beyond the profile-specific
     # patterns above.  These run last so specific extractors take priority.
@@ -398,32 +651,66 @@ def extract_fact_slots(text: str) -> Dict[str, ExtractedFact]:
     return facts
 
 
+_BOTH_SCHOOLS_RE = re.compile(
+    r"\bboth\s+my\s+(?:undergrad|undergraduate)(?:\s+degree)?\s+and\s+(?:my\s+)?master'?s(?:\s+degree)?\s+(?:were|was)?\s*(?:from|at)\s+([A-Z][A-Za-z .'-]{2,60})\b",
+    re.IGNORECASE,
+)
+_UNDERGRAD_SCHOOL_RE = re.compile(
+    r"\bundergraduate (?:degree )?was from\s+([A-Z][A-Za-z .'-]{2,60})\b",
+    re.IGNORECASE,
+)
+_MASTERS_SCHOOL_RE = re.compile(
+    r"\bmaster'?s (?:degree )?.*?from\s+([A-Z][A-Za-z .'-]{2,60})\b",
+    re.IGNORECASE,
+)
+_GRADUATION_YEAR_RE = re.compile(
+    r"\b(?:i\s+)?graduated\s+(?:from.*)?(?:in|from.*in)\s+(19\d{2}|20\d{2})\b",
+    re.IGNORECASE,
+)
+_GRADUATED_FROM_RE = re.compile(
+    r"\b(?:i\s+|you\s+)?graduated from\s+([A-Z][A-Za-z\s.'-]{1,50}?)(?:\s+in\s+\d{4}|\s+with|\.|,|;|\s+and|\s*$)",
+    re.IGNORECASE,
+)
+_STUDIED_AT_RE = re.compile(
+    r"\b(?:i\s+|you\s+)?studied(?:\s+(?!at\b)[A-Za-z][A-Za-z\s]{0,40})?\s+at\s+([A-Z][A-Za-z\s.'-]{1,50}?)(?:\s+and|\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_DEGREE_IN_RE = re.compile(
+    r"\b(?:degree|major)\s+in\s+([A-Z][A-Za-z\s]{2,40}?)(?:\s+from|\s+and|\s+with|\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_STUDIED_MAJOR_RE = re.compile(
+    r"\bstudied\s+(?!at\b)([A-Z][A-Za-z\s]{2,40}?)(?:\s+at|\s*$)",
+    re.IGNORECASE,
+)
+_MINOR_IN_RE = re.compile(
+    r"\bminor\s+in\s+([A-Z][A-Za-z\s]{2,40}?)(?:\.|,|;|\s+and|\s*$)",
+    re.IGNORECASE,
+)
+
+
 def _extract_education_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
     """Extract education-related facts."""
     # Combined pattern: "both my undergrad and Master's were from MIT"
-    m = re.search(
-        r"\bboth\s+my\s+(?:undergrad|undergraduate)(?:\s+degree)?\s+and\s+(?:my\s+)?master'?s(?:\s+degree)?\s+(?:were|was)?\s*(?:from|at)\s+([A-Z][A-Za-z .'-]{2,60})\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    m = _BOTH_SCHOOLS_RE.search(text)
     if m:
         school = m.group(1).strip()
         if school:
             facts["undergrad_school"] = ExtractedFact("undergrad_school", school, _norm_text(school))
             facts["masters_school"] = ExtractedFact("masters_school", school, _norm_text(school))
 
-    m = re.search(r"\bundergraduate (?:degree )?was from\s+([A-Z][A-Za-z .'-]{2,60})\b", text, flags=re.IGNORECASE)
+    m = _UNDERGRAD_SCHOOL_RE.search(text)
     if m:
         school = m.group(1).strip()
         facts["undergrad_school"] = ExtractedFact("undergrad_school", school, _norm_text(school))
 
-    m = re.search(r"\bmaster'?s (?:degree )?.*?from\s+([A-Z][A-Za-z .'-]{2,60})\b", text, flags=re.IGNORECASE)
+    m = _MASTERS_SCHOOL_RE.search(text)
     if m:
         school = m.group(1).strip()
         facts["masters_school"] = ExtractedFact("masters_school", school, _norm_text(school))
     
     # Graduation year
-    m = re.search(r"\b(?:i\s+)?graduated\s+(?:from.*)?(?:in|from.*in)\s+(19\d{2}|20\d{2})\b", text, flags=re.IGNORECASE)
+    m = _GRADUATION_YEAR_RE.search(text)
     if m:
         year = m.group(1).strip()
         facts["graduation_year"] = ExtractedFact("graduation_year", year, year)
@@ -431,26 +718,18 @@ def _extract_education_facts(text: str, facts: Dict[str, ExtractedFact]) -> None
     # School (standalone "graduated from X" or "studied at X" patterns)
     if "school" not in facts:
         # Try "graduated from X" first
-        m = re.search(r"\b(?:i\s+|you\s+)?graduated from\s+([A-Z][A-Za-z\s.'-]{1,50}?)(?:\s+in\s+\d{4}|\s+with|\.|,|;|\s+and|\s*$)", text, flags=re.IGNORECASE)
+        m = _GRADUATED_FROM_RE.search(text)
         if not m:
             # Try "studied at X" pattern.
-            m = re.search(
-                r"\b(?:i\s+|you\s+)?studied(?:\s+(?!at\b)[A-Za-z][A-Za-z\s]{0,40})?\s+at\s+([A-Z][A-Za-z\s.'-]{1,50}?)(?:\s+and|\.|,|;|\s*$)",
-                text,
-                flags=re.IGNORECASE,
-            )
+            m = _STUDIED_AT_RE.search(text)
         if m:
             school = m.group(1).strip()
             facts["school"] = ExtractedFact("school", school, _norm_text(school))
     
     # Major/Degree field
-    m = re.search(r"\b(?:degree|major)\s+in\s+([A-Z][A-Za-z\s]{2,40}?)(?:\s+from|\s+and|\s+with|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+    m = _DEGREE_IN_RE.search(text)
     if not m:
-        m = re.search(
-            r"\bstudied\s+(?!at\b)([A-Z][A-Za-z\s]{2,40}?)(?:\s+at|\s*$)",
-            text,
-            flags=re.IGNORECASE,
-        )
+        m = _STUDIED_MAJOR_RE.search(text)
     if m:
         major = m.group(1).strip()
         # Filter out common false positives
@@ -460,17 +739,69 @@ def _extract_education_facts(text: str, facts: Dict[str, ExtractedFact]) -> None
             facts["major"] = ExtractedFact("major", major, _norm_text(major))
     
     # Minor
-    m = re.search(r"\bminor\s+in\s+([A-Z][A-Za-z\s]{2,40}?)(?:\.|,|;|\s+and|\s*$)", text, flags=re.IGNORECASE)
+    m = _MINOR_IN_RE.search(text)
     if m:
         minor = m.group(1).strip()
         facts["minor"] = ExtractedFact("minor", minor, _norm_text(minor))
 
 
 
+_SIBLINGS_RE = re.compile(
+    r"\bi have\s+(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+sibling",
+    re.IGNORECASE,
+)
+_LANGUAGES_SPOKEN_RE = re.compile(
+    r"\bi speak\s+(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+language",
+    re.IGNORECASE,
+)
+_PET_NAMED_RE = re.compile(
+    r"\bi have a\s+([a-z]+(?:\s+[a-z]+)?)\s+named\s+([A-Z][a-z]+)",
+    re.IGNORECASE,
+)
+_MY_PET_IS_RE = re.compile(r"\bmy (?:dog|cat|pet) is a\s+([a-z]+(?:\s+[a-z]+)?)", re.IGNORECASE)
+_PREFER_ROAST_RE = re.compile(r"\bi prefer\s+(dark|light|medium)\s+roast", re.IGNORECASE)
+_COFFEE_PREFERENCE_RE = re.compile(
+    r"\bmy coffee preference is\s+(dark|light|medium)\s+roast",
+    re.IGNORECASE,
+)
+_SWITCHED_ROAST_RE = re.compile(r"\bswitched to\s+(dark|light|medium)\s+roast", re.IGNORECASE)
+_MY_HOBBY_RE = re.compile(
+    r"\bmy (?:weekend )?hobby is\s+([a-z][a-z\s-]{2,40}?)(?:\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_ENJOYS_RE = re.compile(
+    r"\b(?:you|user|i) (?:enjoy|love|like)(?:s)?\s+([a-z][a-z\s,\-]+?)(?:\s+and\s+you|\.|,\s+and\s+you|$)",
+    re.IGNORECASE,
+)
+_I_ENJOY_RE = re.compile(r"\bi enjoy\s+([a-z][a-z\s-]{2,40}?)(?:\.|,|;|\s*$)", re.IGNORECASE)
+_TAKEN_UP_RE = re.compile(
+    r"\btaken up\s+([a-z][a-z\s-]{2,40}?)(?:\s+instead|\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_IM_READING_RE = re.compile(r"\bi'?m reading ['\"]([^'\"]{5,80})['\"]", re.IGNORECASE)
+_NOW_READING_RE = re.compile(r"\bnow reading ['\"]([^'\"]{5,80})['\"]", re.IGNORECASE)
+_CHILDREN_RE = re.compile(
+    r"\b(?:with|have|has)\s+(\d+|one|two|three|four|five)\s+(?:kid|child|children)s?",
+    re.IGNORECASE,
+)
+_RELATIONSHIP_RE = re.compile(
+    r"\b(?:my|married to|with my)\s+(wife|husband|partner|spouse)",
+    re.IGNORECASE,
+)
+_PHONE_RE = re.compile(
+    r"\b(?:phone number|phone|cell|mobile)(?:\s+is|\s+:)?\s+([0-9\-\(\)\s]{7,20})",
+    re.IGNORECASE,
+)
+_EMAIL_RE = re.compile(
+    r"\b(?:email|e-mail)(?:\s+is|\s+:)?\s+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+    re.IGNORECASE,
+)
+
+
 def _extract_personal_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
     """Extract personal facts like hobbies, pets, preferences."""
     # Siblings
-    m = re.search(r"\bi have\s+(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+sibling", text, flags=re.IGNORECASE)
+    m = _SIBLINGS_RE.search(text)
     if m:
         count_str = m.group(1).strip()
         word_to_num = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
@@ -479,7 +810,7 @@ def _extract_personal_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
         facts["siblings"] = ExtractedFact("siblings", count_normalized, count_normalized)
     
     # Languages spoken
-    m = re.search(r"\bi speak\s+(\d+|one|two|three|four|five|six|seven|eight|nine|ten)\s+language", text, flags=re.IGNORECASE)
+    m = _LANGUAGES_SPOKEN_RE.search(text)
     if m:
         count_str = m.group(1).strip()
         word_to_num = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
@@ -488,53 +819,53 @@ def _extract_personal_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
         facts["languages_spoken"] = ExtractedFact("languages_spoken", count_normalized, count_normalized)
     
     # Pet (type and name)
-    m = re.search(r"\bi have a\s+([a-z]+(?:\s+[a-z]+)?)\s+named\s+([A-Z][a-z]+)", text, flags=re.IGNORECASE)
+    m = _PET_NAMED_RE.search(text)
     if m:
         pet_type = m.group(1).strip()
         pet_name = m.group(2).strip()
         facts["pet"] = ExtractedFact("pet", pet_type, _norm_text(pet_type))
         facts["pet_name"] = ExtractedFact("pet_name", pet_name, _norm_text(pet_name))
     else:
-        m = re.search(r"\bmy (?:dog|cat|pet) is a\s+([a-z]+(?:\s+[a-z]+)?)", text, flags=re.IGNORECASE)
+        m = _MY_PET_IS_RE.search(text)
         # Note: Removed generic "[Name] is a [thing]" pattern that was matching
         # professional roles like "User is a Software Engineer". Only specific
         # pet-related patterns are used to avoid false positives.
     
     # Coffee preference
-    m = re.search(r"\bi prefer\s+(dark|light|medium)\s+roast", text, flags=re.IGNORECASE)
+    m = _PREFER_ROAST_RE.search(text)
     if not m:
-        m = re.search(r"\bmy coffee preference is\s+(dark|light|medium)\s+roast", text, flags=re.IGNORECASE)
+        m = _COFFEE_PREFERENCE_RE.search(text)
     if not m:
-        m = re.search(r"\bswitched to\s+(dark|light|medium)\s+roast", text, flags=re.IGNORECASE)
+        m = _SWITCHED_ROAST_RE.search(text)
     if m:
         coffee = m.group(1).strip() + " roast"
         facts["coffee"] = ExtractedFact("coffee", coffee, _norm_text(coffee))
     
     # Hobby (with compound value support)
-    m = re.search(r"\bmy (?:weekend )?hobby is\s+([a-z][a-z\s-]{2,40}?)(?:\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+    m = _MY_HOBBY_RE.search(text)
     if not m:
         # "you enjoy X and Y" or "you love X"
         # Capture hobby text up to terminators (handles compounds like "hiking and cooking")
-        m = re.search(r"\b(?:you|user|i) (?:enjoy|love|like)(?:s)?\s+([a-z][a-z\s,\-]+?)(?:\s+and\s+you|\.|,\s+and\s+you|$)", text, flags=re.IGNORECASE)
+        m = _ENJOYS_RE.search(text)
     if not m:
-        m = re.search(r"\bi enjoy\s+([a-z][a-z\s-]{2,40}?)(?:\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+        m = _I_ENJOY_RE.search(text)
     if not m:
-        m = re.search(r"\btaken up\s+([a-z][a-z\s-]{2,40}?)(?:\s+instead|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+        m = _TAKEN_UP_RE.search(text)
     if m:
         hobby = m.group(1).strip()
         facts["hobby"] = ExtractedFact("hobby", hobby, _norm_text(hobby))
     
     # Book currently reading
-    m = re.search(r"\bi'?m reading ['\"]([^'\"]{5,80})['\"]", text, flags=re.IGNORECASE)
+    m = _IM_READING_RE.search(text)
     if not m:
-        m = re.search(r"\bnow reading ['\"]([^'\"]{5,80})['\"]", text, flags=re.IGNORECASE)
+        m = _NOW_READING_RE.search(text)
     if m:
         book = m.group(1).strip()
         facts["book"] = ExtractedFact("book", book, _norm_text(book))
     
     # Children/family information
     # "with 2 kids", "have 3 children", "my son", "my daughter"
-    m = re.search(r"\b(?:with|have|has)\s+(\d+|one|two|three|four|five)\s+(?:kid|child|children)s?", text, flags=re.IGNORECASE)
+    m = _CHILDREN_RE.search(text)
     if m:
         count_str = m.group(1).strip()
         word_to_num = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5"}
@@ -542,41 +873,76 @@ def _extract_personal_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
         facts["children"] = ExtractedFact("children", count_normalized, count_normalized)
     
     # Relationships: "my wife", "my husband", "married to"
-    m = re.search(r"\b(?:my|married to|with my)\s+(wife|husband|partner|spouse)", text, flags=re.IGNORECASE)
+    m = _RELATIONSHIP_RE.search(text)
     if m:
         rel_type = m.group(1).strip()
         facts["relationship"] = ExtractedFact("relationship", rel_type, _norm_text(rel_type))
     
     # Phone number
-    m = re.search(r"\b(?:phone number|phone|cell|mobile)(?:\s+is|\s+:)?\s+([0-9\-\(\)\s]{7,20})", text, flags=re.IGNORECASE)
+    m = _PHONE_RE.search(text)
     if m:
         phone = m.group(1).strip()
         facts["phone"] = ExtractedFact("phone", phone, _norm_text(phone))
     
     # Email (already might be extracted elsewhere, but add for completeness)
     if "email" not in facts:
-        m = re.search(r"\b(?:email|e-mail)(?:\s+is|\s+:)?\s+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", text, flags=re.IGNORECASE)
+        m = _EMAIL_RE.search(text)
         if m:
             email = m.group(1).strip()
             facts["email"] = ExtractedFact("email", email, _norm_text(email))
 
 
+_MY_PROJECT_RE = re.compile(
+    r"\bmy (?:current )?project\s+(?:is\s+called|'?s\s+name\s+is|name\s+is|is\s+building)\s+(?:a\s+)?([A-Za-z][A-Za-z0-9+_.#\s-]{1,60}?)(?:\.|,|;|\s+for|\s+that|\s+to|\s*$)",
+    re.IGNORECASE,
+)
+_PROJECT_FOCUS_RE = re.compile(
+    r"\bmy project focus\s+(?:has\s+)?shifted to\s+([A-Za-z][A-Za-z0-9+_.#\s-]{1,60}?)(?:\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_FAVORITE_LANGUAGE_RE = re.compile(
+    r"\bmy favorite (?:programming )?language is\s+([A-Z][A-Za-z0-9+#]{1,20})\b",
+    re.IGNORECASE,
+)
+_LANGUAGE_IS_FAVORITE_RE = re.compile(
+    r"\b([A-Z][A-Za-z0-9+#]{1,20})\s+is (?:actually )?my favorite (?:programming )?language",
+    re.IGNORECASE,
+)
+_PREFER_LANGUAGE_RE = re.compile(r"\bi prefer\s+([A-Z][A-Za-z0-9+#]{1,20})\b", re.IGNORECASE)
+_USES_LANGUAGES_RE = re.compile(
+    r"\b(?:(?:i|you|user|he|she|they) (?:use|uses|know|knows|works? with)|user knows)\s+([A-Z][A-Za-z0-9+#,\s&-]+?)(?:\s*$|\.|\!)",
+    re.IGNORECASE,
+)
+_PREVIOUS_EMPLOYER_RE = re.compile(
+    r"\b(?:previously|formerly)\s+(?:at|worked at|employed by)\s+([A-Z][A-Za-z0-9\s&\-.]+?)(?:\s+and|\s+before|\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_PROMOTED_TO_RE = re.compile(
+    r"\bpromoted to\s+([A-Z][A-Za-z\s]{2,40}?)(?:\.|,|;|\s+at|\s*$)",
+    re.IGNORECASE,
+)
+_SKILL_RE = re.compile(
+    r"\b(?:expert|proficient|skilled|experienced)\s+(?:in|with)\s+([A-Z][A-Za-z0-9+#,\s&-]+?)(?:\s*$|\.|\!|,\s+and)",
+    re.IGNORECASE,
+)
+
+
 def _extract_professional_facts(text: str, facts: Dict[str, ExtractedFact]) -> None:
     """Extract professional/work-related facts."""
     # Project name/description
-    m = re.search(r"\bmy (?:current )?project\s+(?:is\s+called|'?s\s+name\s+is|name\s+is|is\s+building)\s+(?:a\s+)?([A-Za-z][A-Za-z0-9+_.#\s-]{1,60}?)(?:\.|,|;|\s+for|\s+that|\s+to|\s*$)", text, flags=re.IGNORECASE)
+    m = _MY_PROJECT_RE.search(text)
     if not m:
-        m = re.search(r"\bmy project focus\s+(?:has\s+)?shifted to\s+([A-Za-z][A-Za-z0-9+_.#\s-]{1,60}?)(?:\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+        m = _PROJECT_FOCUS_RE.search(text)
     if m:
         project = m.group(1).strip()
         facts["project"] = ExtractedFact("project", project, _norm_text(project))
     
     # Favorite programming language
-    m = re.search(r"\bmy favorite (?:programming )?language is\s+([A-Z][A-Za-z0-9+#]{1,20})\b", text, flags=re.IGNORECASE)
+    m = _FAVORITE_LANGUAGE_RE.search(text)
     if not m:
-        m = re.search(r"\b([A-Z][A-Za-z0-9+#]{1,20})\s+is (?:actually )?my favorite (?:programming )?language", text, flags=re.IGNORECASE)
+        m = _LANGUAGE_IS_FAVORITE_RE.search(text)
     if not m:
-        m = re.search(r"\bi prefer\s+([A-Z][A-Za-z0-9+#]{1,20})\b", text, flags=re.IGNORECASE)
+        m = _PREFER_LANGUAGE_RE.search(text)
     if m:
         lang = m.group(1).strip()
         facts["programming_language"] = ExtractedFact("programming_language", lang, _norm_text(lang))
@@ -585,24 +951,20 @@ def _extract_professional_facts(text: str, facts: Dict[str, ExtractedFact]) -> N
     # "You use Python, JavaScript, Ruby, and Go"
     # "User knows Python and JavaScript"
     if "programming_language" not in facts:
-        m = re.search(
-            r"\b(?:(?:i|you|user|he|she|they) (?:use|uses|know|knows|works? with)|user knows)\s+([A-Z][A-Za-z0-9+#,\s&-]+?)(?:\s*$|\.|\!)",
-            text,
-            flags=re.IGNORECASE
-        )
+        m = _USES_LANGUAGES_RE.search(text)
         if m:
             lang_str = m.group(1).strip()
             # Store as single value for now - will be split by verifier if needed
             facts["programming_language"] = ExtractedFact("programming_language", lang_str, _norm_text(lang_str))
     
     # Employment history: "previously at X", "worked at X"
-    m = re.search(r"\b(?:previously|formerly)\s+(?:at|worked at|employed by)\s+([A-Z][A-Za-z0-9\s&\-.]+?)(?:\s+and|\s+before|\.|,|;|\s*$)", text, flags=re.IGNORECASE)
+    m = _PREVIOUS_EMPLOYER_RE.search(text)
     if m:
         prev_employer = m.group(1).strip()
         facts["previous_employer"] = ExtractedFact("previous_employer", prev_employer, _norm_text(prev_employer))
     
     # Job title hierarchy: "Senior X", "Lead X", "promoted to X"
-    m = re.search(r"\bpromoted to\s+([A-Z][A-Za-z\s]{2,40}?)(?:\.|,|;|\s+at|\s*$)", text, flags=re.IGNORECASE)
+    m = _PROMOTED_TO_RE.search(text)
     if m:
         promoted_title = m.group(1).strip()
         # This is the new title after promotion
@@ -611,7 +973,7 @@ def _extract_professional_facts(text: str, facts: Dict[str, ExtractedFact]) -> N
     
     # Skills with proficiency levels
     # "expert in Python", "proficient in JavaScript"
-    m = re.search(r"\b(?:expert|proficient|skilled|experienced)\s+(?:in|with)\s+([A-Z][A-Za-z0-9+#,\s&-]+?)(?:\s*$|\.|\!|,\s+and)", text, flags=re.IGNORECASE)
+    m = _SKILL_RE.search(text)
     if m:
         skill_str = m.group(1).strip()
         facts["skill"] = ExtractedFact("skill", skill_str, _norm_text(skill_str))
@@ -632,16 +994,52 @@ _WORD_TO_NUM = {
 }
 
 
+# The age, date and measurement patterns below all capture a number, so
+# text without any digit skips them.
+_DIGIT_RE = re.compile(r"\d")
+_AGE_RE = re.compile(
+    r"\b(?:i'?m|i am|you are|you're|he is|she is|they are|user is|my age is|age[:\s]+is?)\s+(\d{1,3})\s*(?:years?\s*old)?(?:\b|$)",
+    re.IGNORECASE,
+)
+_BIRTHDAY_RE = _WordGatedPattern(
+    r"\b(?:my birthday is|born on|date of birth[:\s]+is?|dob[:\s]+is?)\s+"
+    r"([A-Za-z0-9,\s/-]{4,30}?)(?:\.|;|\s+and|\s+in\s+[A-Z]|\s*$)",
+    re.IGNORECASE,
+    words=("birthday", "born", "birth", "dob"),
+)
+_BIRTH_YEAR_RE = re.compile(r"\b(?:i was born|born)\s+in\s+(19\d{2}|20[0-2]\d)\b", re.IGNORECASE)
+_ANNIVERSARY_RE = _WordGatedPattern(
+    r"\b(?:our anniversary is|anniversary[:\s]+is?|married since|married in)\s+"
+    r"([A-Za-z0-9,\s/-]{3,30}?)(?:\.|;|\s*$)",
+    re.IGNORECASE,
+    words=("anniversary", "married"),
+)
+_START_DATE_RE = re.compile(
+    r"\b(?:i |we )?(?:started|joined|began|commenced)\s+(?:the\s+)?(?:\w+\s+)?in\s+"
+    r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|(?:19|20)\d{2})\b",
+    re.IGNORECASE,
+)
+_END_DATE_RE = re.compile(
+    r"\b(?:deadline|due date|end date|expires?|expir(?:es|ation)|ends)\s+(?:is\s+|on\s+|:?\s*)"
+    r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s*\d{4})?|"
+    r"\d{4}[-/]\d{2}[-/]\d{2}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\b",
+    re.IGNORECASE,
+)
+_DURATION_RE = re.compile(
+    r"\b(?:i'?ve been|been|i have been)\s+\w+(?:\s+\w+)?\s+for\s+"
+    r"(\d{1,3})\s+(years?|months?|weeks?|days?)\b",
+    re.IGNORECASE,
+)
+
+
 def _extract_age_and_date_facts(text: str, facts: dict) -> None:
     """Extract age, birthday, and date-related facts."""
+    has_digit = _DIGIT_RE.search(text) is not None
 
     # Age: "I'm 32", "I am 32 years old", "my age is 32", "age: 32"
     # Also second/third person: "You are 32", "User is 45 years old"
-    if "age" not in facts:
-        m = re.search(
-            r"\b(?:i'?m|i am|you are|you're|he is|she is|they are|user is|my age is|age[:\s]+is?)\s+(\d{1,3})\s*(?:years?\s*old)?(?:\b|$)",
-            text, flags=re.IGNORECASE,
-        )
+    if "age" not in facts and has_digit:
+        m = _AGE_RE.search(text)
         if m:
             age = m.group(1)
             facts["age"] = ExtractedFact("age", age, age)
@@ -649,110 +1047,109 @@ def _extract_age_and_date_facts(text: str, facts: dict) -> None:
     # Birthday: "my birthday is March 15", "born on Jan 5 1990",
     # "DOB is 1990-01-15", "date of birth: March 15"
     if "birthday" not in facts:
-        m = re.search(
-            r"\b(?:my birthday is|born on|date of birth[:\s]+is?|dob[:\s]+is?)\s+"
-            r"([A-Za-z0-9,\s/-]{4,30}?)(?:\.|;|\s+and|\s+in\s+[A-Z]|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _BIRTHDAY_RE.search(text)
         if m:
             bday = m.group(1).strip().rstrip(",")
             facts["birthday"] = ExtractedFact("birthday", bday, _norm_text(bday))
 
     # Birth year standalone: "I was born in 1992"
-    if "birth_year" not in facts:
-        m = re.search(r"\b(?:i was born|born)\s+in\s+(19\d{2}|20[0-2]\d)\b", text, flags=re.IGNORECASE)
+    if "birth_year" not in facts and has_digit:
+        m = _BIRTH_YEAR_RE.search(text)
         if m:
             year = m.group(1)
             facts["birth_year"] = ExtractedFact("birth_year", year, year)
 
     # Anniversary: "our anniversary is June 1", "married since 2015"
     if "anniversary" not in facts:
-        m = re.search(
-            r"\b(?:our anniversary is|anniversary[:\s]+is?|married since|married in)\s+"
-            r"([A-Za-z0-9,\s/-]{3,30}?)(?:\.|;|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _ANNIVERSARY_RE.search(text)
         if m:
             ann = m.group(1).strip().rstrip(",")
             facts["anniversary"] = ExtractedFact("anniversary", ann, _norm_text(ann))
 
     # Generic start/end dates: "started [the job/project/X] in YYYY"
-    if "start_date" not in facts:
-        m = re.search(
-            r"\b(?:i |we )?(?:started|joined|began|commenced)\s+(?:the\s+)?(?:\w+\s+)?in\s+"
-            r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|(?:19|20)\d{2})\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "start_date" not in facts and has_digit:
+        m = _START_DATE_RE.search(text)
         if m:
             sd = m.group(1).strip()
             facts["start_date"] = ExtractedFact("start_date", sd, _norm_text(sd))
 
-    if "end_date" not in facts:
-        m = re.search(
-            r"\b(?:deadline|due date|end date|expires?|expir(?:es|ation)|ends)\s+(?:is\s+|on\s+|:?\s*)"
-            r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s*\d{4})?|"
-            r"\d{4}[-/]\d{2}[-/]\d{2}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "end_date" not in facts and has_digit:
+        m = _END_DATE_RE.search(text)
         if m:
             ed = m.group(1).strip()
             facts["end_date"] = ExtractedFact("end_date", ed, _norm_text(ed))
 
     # Duration: "been doing X for N years/months"
-    if "duration" not in facts:
-        m = re.search(
-            r"\b(?:i'?ve been|been|i have been)\s+\w+(?:\s+\w+)?\s+for\s+"
-            r"(\d{1,3})\s+(years?|months?|weeks?|days?)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "duration" not in facts and has_digit:
+        m = _DURATION_RE.search(text)
         if m:
             dur = f"{m.group(1)} {m.group(2)}"
             facts["duration"] = ExtractedFact("duration", dur, _norm_text(dur))
 
 
+_SALARY_RE = re.compile(
+    r"\b(?:salary|income|pay|compensation|wage|i make|i earn)\s*(?:is|:|of)?\s*"
+    r"[\$€£]?\s*(\d[\d,]*\.?\d*)\s*[kK]?(?:\s*(?:/\s*(?:year|yr|month|mo|hour|hr|annum))|"
+    r"\s*(?:per|a)\s*(?:year|month|hour))?\b",
+    re.IGNORECASE,
+)
+_MONEY_AMOUNT_RE = re.compile(r"[\$€£]?\s*\d[\d,]*\.?\d*\s*[kK]?")
+_BUDGET_RE = re.compile(
+    r"\bbudget\s*(?:is|:)\s*([\$€£]?\s*\d[\d,]*\.?\d*\s*[kKmMbB]?)\b",
+    re.IGNORECASE,
+)
+_HEIGHT_RE = re.compile(
+    r"\b(?:height\s*(?:is|:)\s*|i'?m\s+)(\d{1,2}'\d{1,2}\"?|\d{1,3}\s*(?:cm|ft|feet|inches?))\b",
+    re.IGNORECASE,
+)
+_FEET_INCHES_RE = re.compile(r"\b(\d)'(\d{1,2})\"?\s*(?:tall)?\b")
+_WEIGHT_RE = re.compile(
+    r"\b(?:weight\s*(?:is|:)\s*|i?\s*weigh\s+)(\d{2,3})\s*(lbs?|kg|kilos?|pounds?|stone)?\b",
+    re.IGNORECASE,
+)
+_HAVE_COUNT_RE = _WordGatedPattern(
+    r"\b(?:i|we)\s+have\s+(\d{1,4}|"
+    + "|".join(_WORD_TO_NUM.keys())
+    + r")\s+([a-z][a-z\s]{1,30}?)(?:\s+(?:and|but|in|on|at|that|which|running)|\.|,|;|\s*$)",
+    re.IGNORECASE,
+    words=("have",),
+)
+_NON_SLOT_CHAR_RE = re.compile(r"[^a-z0-9_]")
+
+
 def _extract_quantitative_facts(text: str, facts: dict) -> None:
     """Extract general quantitative facts: salary, budget, measurements, counts."""
+    has_digit = _DIGIT_RE.search(text) is not None
 
     # Salary / income: "$150k", "salary is $200,000", "I make $80k/year"
-    if "salary" not in facts:
-        m = re.search(
-            r"\b(?:salary|income|pay|compensation|wage|i make|i earn)\s*(?:is|:|of)?\s*"
-            r"[\$€£]?\s*(\d[\d,]*\.?\d*)\s*[kK]?(?:\s*(?:/\s*(?:year|yr|month|mo|hour|hr|annum))|"
-            r"\s*(?:per|a)\s*(?:year|month|hour))?\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "salary" not in facts and has_digit:
+        m = _SALARY_RE.search(text)
         if m:
             sal = m.group(0).strip()
             # Normalize: extract ust the number portion
-            val = re.search(r"[\$€£]?\s*\d[\d,]*\.?\d*\s*[kK]?", sal)
+            val = _MONEY_AMOUNT_RE.search(sal)
             if val:
                 facts["salary"] = ExtractedFact("salary", val.group(0).strip(), _norm_text(val.group(0).strip()))
 
     # Budget: "budget is $50,000"
-    if "budget" not in facts:
-        m = re.search(
-            r"\bbudget\s*(?:is|:)\s*([\$€£]?\s*\d[\d,]*\.?\d*\s*[kKmMbB]?)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "budget" not in facts and has_digit:
+        m = _BUDGET_RE.search(text)
         if m:
             budget = m.group(1).strip()
             facts["budget"] = ExtractedFact("budget", budget, _norm_text(budget))
 
     # Height: "5'11", "5 feet 11 inches", "180 cm", "height is X"
-    if "height" not in facts:
-        m = re.search(r"\b(?:height\s*(?:is|:)\s*|i'?m\s+)(\d{1,2}'\d{1,2}\"?|\d{1,3}\s*(?:cm|ft|feet|inches?))\b", text, flags=re.IGNORECASE)
+    if "height" not in facts and has_digit:
+        m = _HEIGHT_RE.search(text)
         if not m:
-            m = re.search(r"\b(\d)'(\d{1,2})\"?\s*(?:tall)?\b", text)
+            m = _FEET_INCHES_RE.search(text)
         if m:
             height = m.group(0).strip()
             facts["height"] = ExtractedFact("height", height, _norm_text(height))
 
     # Weight: "180 lbs", "82 kg", "weigh 180"
-    if "weight" not in facts:
-        m = re.search(
-            r"\b(?:weight\s*(?:is|:)\s*|i?\s*weigh\s+)(\d{2,3})\s*(lbs?|kg|kilos?|pounds?|stone)?\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "weight" not in facts and has_digit:
+        m = _WEIGHT_RE.search(text)
         if m:
             weight = f"{m.group(1)} {m.group(2) or 'lbs'}".strip()
             facts["weight"] = ExtractedFact("weight", weight, _norm_text(weight))
@@ -760,12 +1157,7 @@ def _extract_quantitative_facts(text: str, facts: dict) -> None:
     # Generalized count: "I have N Xs" (for things beyond siblings/children)
     # Catches: "I have 3 monitors", "I have two dogs", "we have 5 servers"
     if True:
-        for m in re.finditer(
-            r"\b(?:i|we)\s+have\s+(\d{1,4}|"
-            + "|".join(_WORD_TO_NUM.keys())
-            + r")\s+([a-z][a-z\s]{1,30}?)(?:\s+(?:and|but|in|on|at|that|which|running)|\.|,|;|\s*$)",
-            text, flags=re.IGNORECASE,
-        ):
+        for m in _HAVE_COUNT_RE.finditer(text):
             count_raw = m.group(1).strip()
             thing = m.group(2).strip()
             count_val = _WORD_TO_NUM.get(count_raw.lower(), count_raw)
@@ -773,53 +1165,89 @@ def _extract_quantitative_facts(text: str, facts: dict) -> None:
             if thing.rstrip("s") in ("sibling", "child", "children", "kid", "language"):
                 continue
             # Derive a reasonable slot name
-            slot = re.sub(r"\s+", "_", thing.rstrip("s").strip())
-            slot = re.sub(r"[^a-z0-9_]", "", slot.lower())
+            slot = _WS_RE.sub("_", thing.rstrip("s").strip())
+            slot = _NON_SLOT_CHAR_RE.sub("", slot.lower())
             if slot and slot not in facts:
                 val_str = f"{count_val} {thing}"
                 facts[slot] = ExtractedFact(slot, val_str, _norm_text(val_str))
 
 
+_FAVORITE_RE = _WordGatedPattern(
+    r"\b(?:my|your|user'?s?|his|her|their)\s+favou?rite\s+"
+    r"([a-z][a-z\s]{0,20}?)\s+is\s+([^\n\r\.;,!\?]{2,60})",
+    re.IGNORECASE,
+    words=("favorite", "favourite"),
+)
+_FAVORITE_TRIM_RE = re.compile(r"\b(?:and|but|though|however|because)\b", re.IGNORECASE)
+_I_LIKE_RE = _WordGatedPattern(
+    r"\bi (?:like|love|enjoy|am into|am a fan of)\s+"
+    r"([^\n\r\.;!\?]{2,60}?)(?:\.|;|!|\s*$)",
+    re.IGNORECASE,
+    words=("like", "love", "enjoy", "am"),
+)
+_TO_VERB_RE = re.compile(r"^to\s+", re.IGNORECASE)
+_I_PREFER_RE = _WordGatedPattern(
+    r"\bi prefer\s+([^\n\r\.;!\?]{2,60}?)(?:\s+over\s+([^\n\r\.;!\?]{2,60}))?"
+    r"(?:\.|;|!|\s*$)",
+    re.IGNORECASE,
+    words=("prefer",),
+)
+_OPINION_RE = _WordGatedPattern(
+    r"\b(?:i think|i believe|in my opinion|i feel that|my view is)\s+"
+    r"([^\n\r\.;!\?]{5,120}?)(?:\.|;|!|\?|\s*$)",
+    re.IGNORECASE,
+    words=("think", "believe", "opinion", "feel", "view"),
+)
+_GOAL_RE = _WordGatedPattern(
+    r"\b(?:my goal is|i(?:'m| am) (?:trying|planning|working|aiming) to|"
+    r"i plan to|i want to|my plan is to|i aim to|working towards?)\s+"
+    r"([^\n\r\.;!\?]{3,120}?)(?:\.|;|!|\s*$)",
+    re.IGNORECASE,
+    words=("goal", "trying", "planning", "working", "aiming", "plan", "want", "aim"),
+)
+_DISLIKE_RE = _WordGatedPattern(
+    r"\b(?:i (?:don'?t|do not) like|i hate|i avoid|i can'?t stand|"
+    r"i'm allergic to|allergic to|i'?m intolerant to)\s+"
+    r"([^\n\r\.;!\?]{2,80}?)(?:\.|;|!|\s*$)",
+    re.IGNORECASE,
+    words=("like", "hate", "avoid", "stand", "allergic", "intolerant"),
+)
+_DIET_RE = _WordGatedPattern(
+    r"\b(?:i'?m|i am|i eat)\s+(vegan|vegetarian|pescatarian|keto|paleo|"
+    r"halal|kosher|gluten[- ]?free|dairy[- ]?free|lactose[- ]?free)\b",
+    re.IGNORECASE,
+    words=("im", "m", "am", "eat"),
+)
+
+
 def _extract_preference_and_opinion_facts(text: str, facts: dict) -> None:
     """Extract preferences, opinions, goals, and beliefs."""
 
     # General "my/your/user's favorite X is Y"
     # Handles: "my favorite color is blue", "your favorite food is pizza",
     # "User's favorite color is orange"
-    for m in re.finditer(
-        r"\b(?:my|your|user'?s?|his|her|their)\s+favou?rite\s+"
-        r"([a-z][a-z\s]{0,20}?)\s+is\s+([^\n\r\.;,!\?]{2,60})",
-        text, flags=re.IGNORECASE,
-    ):
+    for m in _FAVORITE_RE.finditer(text):
         subject = m.group(1).strip()
         value = m.group(2).strip()
         # Trim trailing conjunctions
-        value = re.split(r"\b(?:and|but|though|however|because)\b", value, maxsplit=1, flags=re.IGNORECASE)[0].strip()
-        slot = "favorite_" + re.sub(r"\s+", "_", subject.lower())
-        slot = re.sub(r"[^a-z0-9_]", "", slot)
+        value = _FAVORITE_TRIM_RE.split(value, maxsplit=1)[0].strip()
+        slot = "favorite_" + _WS_RE.sub("_", subject.lower())
+        slot = _NON_SLOT_CHAR_RE.sub("", slot)
         if slot not in facts and value:
             facts[slot] = ExtractedFact(slot, value, _norm_text(value))
 
     # "I like X" / "I love X" (for concrete things, not verbs)
     if "likes" not in facts:
-        m = re.search(
-            r"\bi (?:like|love|enjoy|am into|am a fan of)\s+"
-            r"([^\n\r\.;!\?]{2,60}?)(?:\.|;|!|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _I_LIKE_RE.search(text)
         if m:
             val = m.group(1).strip()
             # Skip verb phrases ("I like to code") — keep noun phrases
-            if not re.match(r"^to\s+", val, re.IGNORECASE):
+            if not _TO_VERB_RE.match(val):
                 facts["likes"] = ExtractedFact("likes", val, _norm_text(val))
 
     # "I prefer X" / "I prefer X over Y"
     if "preference" not in facts:
-        m = re.search(
-            r"\bi prefer\s+([^\n\r\.;!\?]{2,60}?)(?:\s+over\s+([^\n\r\.;!\?]{2,60}))?"
-            r"(?:\.|;|!|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _I_PREFER_RE.search(text)
         if m:
             preferred = m.group(1).strip()
             # Skip if already captured as coffee preference
@@ -830,191 +1258,279 @@ def _extract_preference_and_opinion_facts(text: str, facts: dict) -> None:
 
     # Opinions: "I think X", "I believe X", "in my opinion X"
     if "opinion" not in facts:
-        m = re.search(
-            r"\b(?:i think|i believe|in my opinion|i feel that|my view is)\s+"
-            r"([^\n\r\.;!\?]{5,120}?)(?:\.|;|!|\?|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _OPINION_RE.search(text)
         if m:
             opinion = m.group(1).strip()
             facts["opinion"] = ExtractedFact("opinion", opinion, _norm_text(opinion))
 
     # Goals / plans: "my goal is X", "I plan to X", "I'm trying to X"
     if "goal" not in facts:
-        m = re.search(
-            r"\b(?:my goal is|i(?:'m| am) (?:trying|planning|working|aiming) to|"
-            r"i plan to|i want to|my plan is to|i aim to|working towards?)\s+"
-            r"([^\n\r\.;!\?]{3,120}?)(?:\.|;|!|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _GOAL_RE.search(text)
         if m:
             goal = m.group(1).strip()
             facts["goal"] = ExtractedFact("goal", goal, _norm_text(goal))
 
     # Dislikes / avoidances: "I don't like X", "I hate X", "I avoid X"
     if "dislike" not in facts:
-        m = re.search(
-            r"\b(?:i (?:don'?t|do not) like|i hate|i avoid|i can'?t stand|"
-            r"i'm allergic to|allergic to|i'?m intolerant to)\s+"
-            r"([^\n\r\.;!\?]{2,80}?)(?:\.|;|!|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+        m = _DISLIKE_RE.search(text)
         if m:
             dislike = m.group(1).strip()
             facts["dislike"] = ExtractedFact("dislike", dislike, _norm_text(dislike))
 
     # Dietary restriction: "I'm vegan", "I'm vegetarian", "I eat halal", "I'm gluten-free"
     if "diet" not in facts:
-        m = re.search(
-            r"\b(?:i'?m|i am|i eat)\s+(vegan|vegetarian|pescatarian|keto|paleo|"
-            r"halal|kosher|gluten[- ]?free|dairy[- ]?free|lactose[- ]?free)\b",
-            text, flags=re.IGNORECASE,
-        )
+        m = _DIET_RE.search(text)
         if m:
             diet = m.group(1).strip()
             facts["diet"] = ExtractedFact("diet", diet, _norm_text(diet))
 
 
+# Technology versions: "using Python 3.11", "Node 18", "React 18.2.0",
+# "running Java 21", "on Ruby 3.2"
+_TECH_NAMES = (
+    r"(?:Python|Java|JavaScript|TypeScript|Node(?:\.?js)?|Ruby|Go|Rust|"
+    r"C\+\+|C#|Swift|Kotlin|PHP|Perl|Scala|Elixir|Dart|R|Julia|"
+    r"React|Angular|Vue|Svelte|Next\.?js|Django|Flask|FastAPI|"
+    r"Spring\s?Boot|Rails|Laravel|Express|NestJS|"
+    r"PostgreSQL|MySQL|MongoDB|Redis|SQLite|DynamoDB|"
+    r"Docker|Kubernetes|Terraform|Ansible|"
+    r"Ubuntu|Debian|CentOS|Fedora|macOS|Windows|Linux|"
+    r"AWS|GCP|Azure|Vercel|Netlify|Heroku|"
+    r"Nginx|Apache|Caddy|HAProxy|"
+    r"Git|GitHub|GitLab|Bitbucket|"
+    r"VS\s?Code|Vim|Neovim|Emacs|IntelliJ|PyCharm|WebStorm)"
+)
+
+# Conversational coding patterns:
+# "I code in Python", "I usually code in TypeScript", "I program in Rust",
+# "I write Python", "I mostly write Go"
+_LANG_LIST = (
+    r"Python|Java|JavaScript|TypeScript|Ruby|Go|Rust|"
+    r"C\+\+|C#|Swift|Kotlin|PHP|Perl|Scala|Elixir|Dart|Julia|"
+    r"Lua|Haskell|Clojure|F#|OCaml|Zig|Carbon|Mojo"
+)
+
+
+_TECH_VERSION_RE = re.compile(r"\b" + _TECH_NAMES + r"\s+v?(\d+(?:\.\d+){0,3})\b", re.IGNORECASE)
+_TRAILING_VERSION_RE = re.compile(r"\s+v?\d+(?:\.\d+){0,3}$")
+_TECH_SLOT_SEP_RE = re.compile(r"[\s.#+]+")
+_DATABASE_IS_RE = re.compile(
+    r"\b(?:our )?(?:database|db)\s+(?:is|:)\s+([A-Z][A-Za-z0-9\s+#]{1,30}?)(?:\.|,|;|\s*$)",
+    re.IGNORECASE,
+)
+_USING_DATABASE_RE = re.compile(
+    r"\busing\s+(PostgreSQL|MySQL|MongoDB|Redis|SQLite|"
+    r"DynamoDB|Cassandra|CouchDB|Neo4j|MariaDB|Oracle|"
+    r"SQL Server|Supabase|Firebase|ElasticSearch|ClickHouse)\b",
+    re.IGNORECASE,
+)
+_OS_RE = re.compile(
+    r"\b(?:running|on|i use|using|my (?:os|operating system) is)\s+"
+    r"(Ubuntu\s*\d*\.?\d*|Debian\s*\d*|CentOS\s*\d*|Fedora\s*\d*|"
+    r"Arch(?:\s*Linux)?|macOS(?:\s*\w+)?|Windows\s*\d*|Linux\s*\w*)\b",
+    re.IGNORECASE,
+)
+_EDITOR_RE = re.compile(
+    r"\b(?:my (?:editor|ide) is|i (?:use|prefer))\s+"
+    r"(VS\s?Code|Visual Studio(?:\s+Code)?|Vim|Neovim|Emacs|"
+    r"IntelliJ(?:\s+IDEA)?|PyCharm|WebStorm|Sublime(?:\s+Text)?|"
+    r"Atom|Cursor|Zed|Helix|Nano)\b",
+    re.IGNORECASE,
+)
+_FRAMEWORK_RE = re.compile(
+    r"\b(?:built with|framework is|stack is|using)\s+"
+    r"(React|Angular|Vue(?:\.?js)?|Svelte|Next\.?js|Nuxt|Remix|Astro|"
+    r"Django|Flask|FastAPI|Express(?:\.?js)?|NestJS|Rails|Laravel|"
+    r"Spring\s?Boot|ASP\.NET|Phoenix|Gin|Fiber|Actix|Rocket)\b",
+    re.IGNORECASE,
+)
+_CLOUD_RE = re.compile(
+    r"\b(?:deployed on|hosted on|running on|using|on)\s+"
+    r"(AWS|GCP|Google\s+Cloud|Azure|Vercel|Netlify|Heroku|"
+    r"DigitalOcean|Linode|Fly\.io|Railway|Render)\b",
+    re.IGNORECASE,
+)
+_CONFIG_VALUE_RE = re.compile(
+    r"\b(port|timeout|max[_\s]?retries|rate[_\s]?limit|"
+    r"batch[_\s]?size|workers?|threads?|ttl|interval|threshold|"
+    r"concurrency|buffer[_\s]?size|max[_\s]?connections)\s+"
+    r"(?:is|=|:)\s*(\d[\d.,]*\s*(?:s|ms|sec|seconds?|min|minutes?|hrs?|hours?|mb|gb|kb)?)\b",
+    re.IGNORECASE,
+)
+_API_URL_RE = _WordGatedPattern(
+    r"\b(?:api|endpoint|url|base[_\s]?url|server)\s+(?:is\s+(?:at\s+)?|(?:url\s+)?(?:is|:)\s*|at\s+)"
+    r"(https?://[^\s,;\"'<>]{5,120})",
+    re.IGNORECASE,
+    words=("api", "endpoint", "url", "base_url", "baseurl", "server"),
+)
+_CODES_IN_RE = re.compile(
+    r"\bi\s+(?:usually\s+|mostly\s+|primarily\s+|mainly\s+)?"
+    r"(?:code|program|develop|write)\s+(?:in\s+)?"
+    r"(" + _LANG_LIST + r")"
+    r"(?:\s+and\s+(" + _LANG_LIST + r"))?",
+    re.IGNORECASE,
+)
+_CODING_STYLE_RE = _WordGatedPattern(
+    r"\b(?:i (?:like|prefer|want)|keep it|use)\s+"
+    r"(concise|verbose|detailed|minimal|simple|clean|dry|"
+    r"functional|object[- ]?oriented|OOP|readable|pragmatic|"
+    r"strict|loose|explicit|implicit)\s*(?:code|style|approach)?",
+    re.IGNORECASE,
+    words=("like", "prefer", "want", "keep", "use"),
+)
+_DOCS_PREFERENCE_RE = _WordGatedPattern(
+    r"\b(?:always\s+(?:write|add|include)\s+(?:docs|documentation|docstrings)|"
+    r"(?:no|skip|don'?t need|don'?t want)\s+(?:docs|documentation|docstrings)|"
+    r"(?:docs|documentation)\s+(?:required|needed|not needed|optional|mandatory)|"
+    r"every\s+(?:function|method|class)\s+(?:needs?|should have)\s+(?:a\s+)?(?:docs?tring|documentation))",
+    re.IGNORECASE,
+    words=("always", "no", "skip", "need", "want", "docs", "documentation", "every"),
+)
+_TESTING_RE = re.compile(
+    r"\b(?:i use|we use|prefer|using)\s+"
+    r"(pytest|jest|mocha|vitest|cypress|playwright|selenium|"
+    r"unittest|rspec|minitest|junit|xunit|nunit|go test)\b",
+    re.IGNORECASE,
+)
+
+# Entity vocabulary of the technical extractor, keyed by the block it gates.
+# Every pattern in a block needs one of these (lower-cased) literals, so a
+# single pass over the text tells which blocks can match at all.
+_TECH_TRIGGERS = {
+    "database": (
+        "database", "db", "postgresql", "mysql", "mongodb", "redis", "sqlite",
+        "dynamodb", "cassandra", "couchdb", "neo4j", "mariadb", "oracle",
+        "sql server", "supabase", "firebase", "elasticsearch", "clickhouse",
+    ),
+    "os": ("ubuntu", "debian", "centos", "fedora", "arch", "macos", "windows", "linux"),
+    "editor": (
+        "vs", "visual studio", "vim", "emacs", "intellij", "pycharm", "webstorm",
+        "sublime", "atom", "cursor", "zed", "helix", "nano",
+    ),
+    "framework": (
+        "react", "angular", "vue", "svelte", "next", "nuxt", "remix", "astro",
+        "django", "flask", "fastapi", "express", "nestjs", "rails", "laravel",
+        "spring", "asp.net", "phoenix", "gin", "fiber", "actix", "rocket",
+    ),
+    "cloud": (
+        "aws", "gcp", "google", "azure", "vercel", "netlify", "heroku",
+        "digitalocean", "linode", "fly.io", "railway", "render",
+    ),
+    "programming_language": ("code", "program", "develop", "write"),
+    "testing": (
+        "pytest", "jest", "mocha", "vitest", "cypress", "playwright", "selenium",
+        "unittest", "rspec", "minitest", "junit", "xunit", "nunit", "go test",
+    ),
+}
+_TECH_TRIGGER_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<{group}>{'|'.join(map(re.escape, words))})"
+        for group, words in _TECH_TRIGGERS.items()
+    ) + ")",
+    re.IGNORECASE,
+)
+_TECH_AUTOMATON = None
+if ahocorasick is not None:
+    _TECH_AUTOMATON = ahocorasick.Automaton()
+    for _group, _words in _TECH_TRIGGERS.items():
+        for _word in _words:
+            _TECH_AUTOMATON.add_word(_word, _group)
+    _TECH_AUTOMATON.make_automaton()
+_TECH_GROUP_RES = {
+    group: re.compile("|".join(map(re.escape, words)))
+    for group, words in _TECH_TRIGGERS.items()
+}
+
+
+def _tech_groups(text: str) -> set:
+    """Return the technical blocks whose vocabulary occurs in *text*."""
+    # Both fast paths match lower-cased literals, which agrees with the
+    # IGNORECASE patterns only for ASCII text.
+    if text.isascii():
+        lowered = text.lower()
+        if _TECH_AUTOMATON is not None:
+            return {group for _, group in _TECH_AUTOMATON.iter(lowered)}
+        return {group for group, pat in _TECH_GROUP_RES.items() if pat.search(lowered)}
+    groups = set()
+    for m in _TECH_TRIGGER_RE.finditer(text):
+        groups.add(m.lastgroup)
+        if len(groups) == len(_TECH_TRIGGERS):
+            break
+    return groups
+
+
 def _extract_technical_facts(text: str, facts: dict) -> None:
     """Extract technical/programming/infrastructure facts."""
-
-    # Technology versions: "using Python 3.11", "Node 18", "React 18.2.0",
-    # "running Java 21", "on Ruby 3.2"
-    _tech_names = (
-        r"(?:Python|Java|JavaScript|TypeScript|Node(?:\.?js)?|Ruby|Go|Rust|"
-        r"C\+\+|C#|Swift|Kotlin|PHP|Perl|Scala|Elixir|Dart|R|Julia|"
-        r"React|Angular|Vue|Svelte|Next\.?js|Django|Flask|FastAPI|"
-        r"Spring\s?Boot|Rails|Laravel|Express|NestJS|"
-        r"PostgreSQL|MySQL|MongoDB|Redis|SQLite|DynamoDB|"
-        r"Docker|Kubernetes|Terraform|Ansible|"
-        r"Ubuntu|Debian|CentOS|Fedora|macOS|Windows|Linux|"
-        r"AWS|GCP|Azure|Vercel|Netlify|Heroku|"
-        r"Nginx|Apache|Caddy|HAProxy|"
-        r"Git|GitHub|GitLab|Bitbucket|"
-        r"VS\s?Code|Vim|Neovim|Emacs|IntelliJ|PyCharm|WebStorm)"
-    )
+    groups = _tech_groups(text)
+    has_digit = _DIGIT_RE.search(text) is not None
 
     # Versioned technology: "Python 3.11.4", "Node 18", "React 18.2"
-    for m in re.finditer(
-        r"\b" + _tech_names + r"\s+v?(\d+(?:\.\d+){0,3})\b",
-        text, flags=re.IGNORECASE,
-    ):
-        tech = m.group(0).strip()
-        # Normalize the tech name (strip version for slot name)
-        tech_name = re.sub(r"\s+v?\d+(?:\.\d+){0,3}$", "", tech).strip()
-        slot = re.sub(r"[\s.#+]+", "_", tech_name.lower()) + "_version"
-        slot = re.sub(r"[^a-z0-9_]", "", slot)
-        if slot not in facts:
-            version = m.group(1) if m.lastindex and m.lastindex >= 1 else tech
-            facts[slot] = ExtractedFact(slot, tech, _norm_text(tech))
+    # Every version needs a digit
+    if has_digit:
+        for m in _TECH_VERSION_RE.finditer(text):
+            tech = m.group(0).strip()
+            # Normalize the tech name (strip version for slot name)
+            tech_name = _TRAILING_VERSION_RE.sub("", tech).strip()
+            slot = _TECH_SLOT_SEP_RE.sub("_", tech_name.lower()) + "_version"
+            slot = _NON_SLOT_CHAR_RE.sub("", slot)
+            if slot not in facts:
+                version = m.group(1) if m.lastindex and m.lastindex >= 1 else tech
+                facts[slot] = ExtractedFact(slot, tech, _norm_text(tech))
 
     # Database: "our database is X", "using X as our db", "db is X"
-    if "database" not in facts:
-        m = re.search(
-            r"\b(?:our )?(?:database|db)\s+(?:is|:)\s+([A-Z][A-Za-z0-9\s+#]{1,30}?)(?:\.|,|;|\s*$)",
-            text, flags=re.IGNORECASE,
-        )
+    if "database" not in facts and "database" in groups:
+        m = _DATABASE_IS_RE.search(text)
         if not m:
-            m = re.search(
-                r"\busing\s+(PostgreSQL|MySQL|MongoDB|Redis|SQLite|"
-                r"DynamoDB|Cassandra|CouchDB|Neo4j|MariaDB|Oracle|"
-                r"SQL Server|Supabase|Firebase|ElasticSearch|ClickHouse)\b",
-                text, flags=re.IGNORECASE,
-            )
+            m = _USING_DATABASE_RE.search(text)
         if m:
             db = m.group(1).strip()
             facts["database"] = ExtractedFact("database", db, _norm_text(db))
 
     # Operating system: "running Ubuntu", "on macOS", "I use Windows 11"
-    if "os" not in facts:
-        m = re.search(
-            r"\b(?:running|on|i use|using|my (?:os|operating system) is)\s+"
-            r"(Ubuntu\s*\d*\.?\d*|Debian\s*\d*|CentOS\s*\d*|Fedora\s*\d*|"
-            r"Arch(?:\s*Linux)?|macOS(?:\s*\w+)?|Windows\s*\d*|Linux\s*\w*)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "os" not in facts and "os" in groups:
+        m = _OS_RE.search(text)
         if m:
             os_val = m.group(1).strip()
             facts["os"] = ExtractedFact("os", os_val, _norm_text(os_val))
 
     # Editor / IDE: "my editor is X", "I use VS Code"
-    if "editor" not in facts:
-        m = re.search(
-            r"\b(?:my (?:editor|ide) is|i (?:use|prefer))\s+"
-            r"(VS\s?Code|Visual Studio(?:\s+Code)?|Vim|Neovim|Emacs|"
-            r"IntelliJ(?:\s+IDEA)?|PyCharm|WebStorm|Sublime(?:\s+Text)?|"
-            r"Atom|Cursor|Zed|Helix|Nano)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "editor" not in facts and "editor" in groups:
+        m = _EDITOR_RE.search(text)
         if m:
             editor = m.group(1).strip()
             facts["editor"] = ExtractedFact("editor", editor, _norm_text(editor))
 
     # Framework / stack: "built with React", "our stack is X", "using Django"
-    if "framework" not in facts:
-        m = re.search(
-            r"\b(?:built with|framework is|stack is|using)\s+"
-            r"(React|Angular|Vue(?:\.?js)?|Svelte|Next\.?js|Nuxt|Remix|Astro|"
-            r"Django|Flask|FastAPI|Express(?:\.?js)?|NestJS|Rails|Laravel|"
-            r"Spring\s?Boot|ASP\.NET|Phoenix|Gin|Fiber|Actix|Rocket)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "framework" not in facts and "framework" in groups:
+        m = _FRAMEWORK_RE.search(text)
         if m:
             fw = m.group(1).strip()
             facts["framework"] = ExtractedFact("framework", fw, _norm_text(fw))
 
     # Cloud provider: "deployed on AWS", "hosted on GCP", "running on Azure"
-    if "cloud" not in facts:
-        m = re.search(
-            r"\b(?:deployed on|hosted on|running on|using|on)\s+"
-            r"(AWS|GCP|Google\s+Cloud|Azure|Vercel|Netlify|Heroku|"
-            r"DigitalOcean|Linode|Fly\.io|Railway|Render)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "cloud" not in facts and "cloud" in groups:
+        m = _CLOUD_RE.search(text)
         if m:
             cloud = m.group(1).strip()
             facts["cloud"] = ExtractedFact("cloud", cloud, _norm_text(cloud))
 
     # Configuration values: "port is 8080", "timeout is 30s", "max retries is 3"
-    for m in re.finditer(
-        r"\b(port|timeout|max[_\s]?retries|rate[_\s]?limit|"
-        r"batch[_\s]?size|workers?|threads?|ttl|interval|threshold|"
-        r"concurrency|buffer[_\s]?size|max[_\s]?connections)\s+"
-        r"(?:is|=|:)\s*(\d[\d.,]*\s*(?:s|ms|sec|seconds?|min|minutes?|hrs?|hours?|mb|gb|kb)?)\b",
-        text, flags=re.IGNORECASE,
-    ):
-        config_key = re.sub(r"\s+", "_", m.group(1).strip().lower())
-        config_val = m.group(2).strip()
-        if config_key not in facts:
-            facts[config_key] = ExtractedFact(config_key, config_val, _norm_text(config_val))
+    if has_digit:
+        for m in _CONFIG_VALUE_RE.finditer(text):
+            config_key = _WS_RE.sub("_", m.group(1).strip().lower())
+            config_val = m.group(2).strip()
+            if config_key not in facts:
+                facts[config_key] = ExtractedFact(config_key, config_val, _norm_text(config_val))
 
     # API URL / endpoint: "the API is at X", "endpoint is X", "API URL: X"
     if "api_url" not in facts:
-        m = re.search(
-            r"\b(?:api|endpoint|url|base[_\s]?url|server)\s+(?:is\s+(?:at\s+)?|(?:url\s+)?(?:is|:)\s*|at\s+)"
-            r"(https?://[^\s,;\"'<>]{5,120})",
-            text, flags=re.IGNORECASE,
-        )
+        m = _API_URL_RE.search(text)
         if m:
             url = m.group(1).strip()
             facts["api_url"] = ExtractedFact("api_url", url, _norm_text(url))
 
-    # Conversational coding patterns:
-    # "I code in Python", "I usually code in TypeScript", "I program in Rust",
-    # "I write Python", "I mostly write Go"
-    _lang_list = (
-        r"Python|Java|JavaScript|TypeScript|Ruby|Go|Rust|"
-        r"C\+\+|C#|Swift|Kotlin|PHP|Perl|Scala|Elixir|Dart|Julia|"
-        r"Lua|Haskell|Clojure|F#|OCaml|Zig|Carbon|Mojo"
-    )
-    if "programming_language" not in facts:
-        m = re.search(
-            r"\bi\s+(?:usually\s+|mostly\s+|primarily\s+|mainly\s+)?"
-            r"(?:code|program|develop|write)\s+(?:in\s+)?"
-            r"(" + _lang_list + r")"
-            r"(?:\s+and\s+(" + _lang_list + r"))?",
-            text, flags=re.IGNORECASE,
-        )
+    if "programming_language" not in facts and "programming_language" in groups:
+        m = _CODES_IN_RE.search(text)
         if m:
             lang = m.group(1).strip()
             lang2 = m.group(2).strip() if m.group(2) else None
@@ -1026,13 +1542,7 @@ def _extract_technical_facts(text: str, facts: dict) -> None:
     # Communication / coding style: "I prefer concise code",
     # "I like detailed comments", "keep it simple"
     if "coding_style" not in facts:
-        m = re.search(
-            r"\b(?:i (?:like|prefer|want)|keep it|use)\s+"
-            r"(concise|verbose|detailed|minimal|simple|clean|dry|"
-            r"functional|object[- ]?oriented|OOP|readable|pragmatic|"
-            r"strict|loose|explicit|implicit)\s*(?:code|style|approach)?",
-            text, flags=re.IGNORECASE,
-        )
+        m = _CODING_STYLE_RE.search(text)
         if m:
             style = m.group(1).strip()
             facts["coding_style"] = ExtractedFact(
@@ -1042,13 +1552,7 @@ def _extract_technical_facts(text: str, facts: dict) -> None:
     # Documentation preference: "I need docs", "no docs needed",
     # "always document", "skip documentation"
     if "docs_preference" not in facts:
-        m = re.search(
-            r"\b(?:always\s+(?:write|add|include)\s+(?:docs|documentation|docstrings)|"
-            r"(?:no|skip|don'?t need|don'?t want)\s+(?:docs|documentation|docstrings)|"
-            r"(?:docs|documentation)\s+(?:required|needed|not needed|optional|mandatory)|"
-            r"every\s+(?:function|method|class)\s+(?:needs?|should have)\s+(?:a\s+)?(?:docs?tring|documentation))",
-            text, flags=re.IGNORECASE,
-        )
+        m = _DOCS_PREFERENCE_RE.search(text)
         if m:
             pref = m.group(0).strip()
             facts["docs_preference"] = ExtractedFact(
@@ -1056,13 +1560,8 @@ def _extract_technical_facts(text: str, facts: dict) -> None:
             )
 
     # Testing preference: "I use pytest", "we use jest", "prefer unit tests"
-    if "testing" not in facts:
-        m = re.search(
-            r"\b(?:i use|we use|prefer|using)\s+"
-            r"(pytest|jest|mocha|vitest|cypress|playwright|selenium|"
-            r"unittest|rspec|minitest|junit|xunit|nunit|go test)\b",
-            text, flags=re.IGNORECASE,
-        )
+    if "testing" not in facts and "testing" in groups:
+        m = _TESTING_RE.search(text)
         if m:
             test_tool = m.group(1).strip()
             facts["testing"] = ExtractedFact(
@@ -1070,6 +1569,161 @@ def _extract_technical_facts(text: str, facts: dict) -> None:
             )
 
 
+# Verb keywords of the general-knowledge patterns, one entry per keyword
+# class.  Every pattern needs one of its keywords as a whitespace-delimited
+# word, so looking up a clause's words tells which patterns can possibly
+# match it.
+_CLAUSE_VERBS = {
+    "copula": ("is", "are", "was", "were"),
+    "action": (
+        "use", "uses", "handle", "handles", "support", "supports", "run", "runs",
+        "provide", "provides", "utilize", "utilizes", "leverage", "leverages",
+        "relies", "powered", "built",
+    ),
+    "require": (
+        "require", "requires", "demand", "demands", "mandate", "mandates",
+        "expect", "expects",
+    ),
+    "need": ("need", "needs"),
+    "decision": ("agreed", "decided", "chose", "committed", "opted"),
+    "modal": ("should", "must", "has", "ought"),
+    "config": ("set", "configured", "currently"),
+    "via": ("handled", "managed", "done", "performed", "implemented", "achieved", "provided"),
+    "equals": ("equal", "equals", "=", "=="),
+}
+
+# Keyword class -> numbers of the patterns it can trigger
+_CLAUSE_VERB_PATTERNS = {
+    "copula": (1, 2),
+    "action": (3,),
+    "require": (4,),
+    "need": (4, 6),
+    "decision": (5,),
+    "modal": (6,),
+    "config": (7,),
+    "via": (8,),
+    "equals": (9,),
+}
+
+# Lower-cased keyword -> pattern numbers, for the word lookup
+_CLAUSE_VERB_INDEX = {
+    word: _CLAUSE_VERB_PATTERNS[verb_class]
+    for verb_class, words in _CLAUSE_VERBS.items()
+    for word in words
+}
+
+# Equivalent scan for non-ASCII clauses, where str.lower() and the patterns'
+# IGNORECASE matching can disagree
+_CLAUSE_VERB_RE = re.compile(
+    r"(?<!\S)(?:" + "|".join(
+        f"(?P<{verb_class}>{'|'.join(map(re.escape, words))})"
+        for verb_class, words in _CLAUSE_VERBS.items()
+    ) + r")(?!\S)",
+    re.IGNORECASE,
+)
+
+
+def _clause_patterns(clause: str) -> set:
+    """Numbers of the general-knowledge patterns that can match *clause*."""
+    patterns = set()
+    if clause.isascii():
+        for word in clause.lower().split():
+            triggered = _CLAUSE_VERB_INDEX.get(word)
+            if triggered:
+                patterns.update(triggered)
+    else:
+        for m in _CLAUSE_VERB_RE.finditer(clause):
+            patterns.update(_CLAUSE_VERB_PATTERNS[m.lastgroup])
+    return patterns
+
+
+# Blocklist: subjects that are too generic or cause false positives
+_SUBJECT_BLOCKLIST = frozenset({
+    "thing", "stuff", "problem", "issue", "point", "question", "answer",
+    "fact", "truth", "reason", "way", "idea",
+    "it", "this", "that", "he", "she", "they", "we", "you",
+    "name", "age", "job", "role",  # Already handled by specific extractors
+    # Question words (prevent false extraction from interrogative sentences)
+    "how", "what", "where", "when", "why", "who", "which",
+})
+
+# ── Shared regex fragments ─────────────────────────────────────
+# Value capture: any char except newline/CR/semicolon/exclamation/question
+# Periods are allowed WITHIN values (e.g. "99.9%", "v3.11", "api.example.com")
+_VAL = r"[^\n\r;!\?]"
+# Sentence terminator: period NOT preceded by digit, or ;!? or end-of-string
+_END = r"(?:(?<!\d)\.|;|!|\?|\s*$)"
+
+
+_SUBJECT_DETERMINER_RE = re.compile(r"^(?:my|your|our|his|her|their|the)\s+", re.IGNORECASE)
+_SUBJECT_SEP_RE = re.compile(r"['\s]+")
+_CONTINUATION_WORD_RE = re.compile(
+    r"^(?:that|not|also|just|still|always|never|really|very)\b",
+    re.IGNORECASE,
+)
+_VALUE_TRIM_RE = re.compile(r"\b(?:and|but|so|though|because|however|which)\b", re.IGNORECASE)
+_CLAUSE_SPLIT_RE = re.compile(r"[;]|\s*,\s+(?=[a-z])", re.IGNORECASE)
+_DETERMINER_COPULA_RE = re.compile(
+    r"\b(?:my|the|our|his|her|their)\s+"
+    r"([a-z][a-z\s']{0,30}?)\s+(?:is|are|was|were)\s+"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_BARE_COPULA_RE = re.compile(
+    r"(?:^|\.\s+)"
+    r"([A-Za-z][a-z]+(?:\s+[a-z]+){0,2})\s+(?:is|are|was|were)\s+"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_ACTION_VERB_RE = re.compile(
+    r"\b(?:the|our|my|their)?\s*"
+    r"([a-z][a-z\s']{0,30}?)\s+"
+    r"(?:uses?|handles?|supports?|runs?|provides?|utilizes?|leverages?|relies on|is powered by|is built (?:with|on|using))\s+"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_REQUIREMENT_RE = re.compile(
+    r"\b(?:the|our|my|their)?\s*"
+    r"([a-z][a-z\s']{0,30}?)\s+"
+    r"(?:requires?|needs?|demands?|mandates?|expects?)\s+"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_DECISION_RE = re.compile(
+    r"\b(?:we|they|the team|I)\s+"
+    r"(?:agreed|decided|chose|committed|opted)\s+"
+    r"(?:to\s+)?(?:use\s+|go with\s+|adopt\s+|implement\s+|switch to\s+)?"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_API_STYLE_RE = re.compile(r"REST|GraphQL|SOAP|gRPC", re.IGNORECASE)
+_ARCHITECTURE_RE = re.compile(r"arch|pattern|micro|mono", re.IGNORECASE)
+_PRESCRIPTIVE_RE = re.compile(
+    r"\b(?:the|our|my|their)?\s*"
+    r"([a-z][a-z_\s]{1,25}?)\s+"
+    r"(?:should\s+be|must\s+be|needs?\s+to\s+be|has\s+to\s+be|ought\s+to\s+be)\s+"
+    rf"({_VAL}{{1,60}}?){_END}",
+    re.IGNORECASE,
+)
+_SET_TO_RE = re.compile(
+    r"\b([a-z][a-z_\s]{1,25}?)\s+is\s+(?:set to|configured (?:as|to)|currently)\s+"
+    rf"({_VAL}{{1,60}}?){_END}",
+    re.IGNORECASE,
+)
+_HANDLED_BY_RE = re.compile(
+    r"\b([a-z][a-z\s']{0,30}?)\s+"
+    r"is\s+(?:handled|managed|done|performed|implemented|achieved|provided)\s+"
+    r"(?:via|by|through|using|with)\s+"
+    rf"({_VAL}{{1,80}}?){_END}",
+    re.IGNORECASE,
+)
+_EQUALS_RE = re.compile(
+    r"\b([a-z][a-z_\s]{1,25}?)\s+(?:equals?|==?)\s+"
+    rf"({_VAL}{{1,60}}?){_END}",
+    re.IGNORECASE,
+)
+
+
 def _extract_general_knowledge_facts(text: str, facts: dict) -> None:
     """Universal catch-all extraction for declarative claims.
 
@@ -1088,23 +1742,14 @@ def _extract_general_knowledge_facts(text: str, facts: dict) -> None:
     each clause is re-parsed to avoid losing secondary facts.
     """
 
-    # Blocklist: subjects that are too generic or cause false positives
-    _SUBJECT_BLOCKLIST = {
-        "thing", "stuff", "problem", "issue", "point", "question", "answer",
-        "fact", "truth", "reason", "way", "idea",
-        "it", "this", "that", "he", "she", "they", "we", "you",
-        "name", "age", "job", "role",  # Already handled by specific extractors
-        # Question words (prevent false extraction from interrogative sentences)
-        "how", "what", "where", "when", "why", "who", "which",
-    }
 
     def _try_store(subject: str, value: str) -> None:
         """Normalize and store a subject-value pair if it's valid."""
         # Strip leading possessive/article from subject before normalizing
-        subject = re.sub(r"^(?:my|your|our|his|her|their|the)\s+", "", subject, flags=re.IGNORECASE)
+        subject = _SUBJECT_DETERMINER_RE.sub("", subject)
         # Normalize slot name
-        slot = re.sub(r"['\s]+", "_", subject.lower()).strip("_")
-        slot = re.sub(r"[^a-z0-9_]", "", slot)
+        slot = _SUBJECT_SEP_RE.sub("_", subject.lower()).strip("_")
+        slot = _NON_SLOT_CHAR_RE.sub("", slot)
 
         if not slot or not value or len(slot) < 2:
             return
@@ -1113,123 +1758,81 @@ def _extract_general_knowledge_facts(text: str, facts: dict) -> None:
         if slot in _SUBJECT_BLOCKLIST:
             return
         # Reject if value starts with a common continuation word (likely not a fact)
-        if re.match(r"^(?:that|not|also|just|still|always|never|really|very)\b", value, re.IGNORECASE):
+        if _CONTINUATION_WORD_RE.match(value):
             return
         if len(value.strip()) < 1:
             return
 
         # Trim trailing conjunctions
-        value = re.split(r"\b(?:and|but|so|though|because|however|which)\b", value, maxsplit=1, flags=re.IGNORECASE)[0].strip()
+        value = _VALUE_TRIM_RE.split(value, maxsplit=1)[0].strip()
         if value:
             facts[slot] = ExtractedFact(slot, value, _norm_text(value))
 
-    # ── Shared regex fragments ─────────────────────────────────────
-    # Value capture: any char except newline/CR/semicolon/exclamation/question
-    # Periods are allowed WITHIN values (e.g. "99.9%", "v3.11", "api.example.com")
-    _VAL = r"[^\n\r;!\?]"
-    # Sentence terminator: period NOT preceded by digit, or ;!? or end-of-string
-    _END = r"(?:(?<!\d)\.|;|!|\?|\s*$)"
 
     # ── Clause splitting ─────────────────────────────────────────────
     # Split on commas and semicolons to handle compound sentences like
     # "The frontend is React, backend is FastAPI"
-    clauses = re.split(r"[;]|\s*,\s+(?=[a-z])", text, flags=re.IGNORECASE)
+    clauses = _CLAUSE_SPLIT_RE.split(text)
 
     for clause in clauses:
         clause = clause.strip()
         if not clause or len(clause) < 5:
             continue
+        candidates = _clause_patterns(clause)
+        if not candidates:
+            continue
 
         # ── Pattern 1: "[article/possessive] X is/are/was/were Y" ────
-        for m in re.finditer(
-            r"\b(?:my|the|our|his|her|their)\s+"
-            r"([a-z][a-z\s']{0,30}?)\s+(?:is|are|was|were)\s+"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 1 in candidates:
+            for m in _DETERMINER_COPULA_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 2: "X is/are Y" (bare subject, no article needed) ──
         # Accepts both capitalized starts and lowercase after clause split
-        for m in re.finditer(
-            r"(?:^|\.\s+)"
-            r"([A-Za-z][a-z]+(?:\s+[a-z]+){0,2})\s+(?:is|are|was|were)\s+"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 2 in candidates:
+            for m in _BARE_COPULA_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 3: "X uses/handles/supports/runs/provides Y" ──────
-        for m in re.finditer(
-            r"\b(?:the|our|my|their)?\s*"
-            r"([a-z][a-z\s']{0,30}?)\s+"
-            r"(?:uses?|handles?|supports?|runs?|provides?|utilizes?|leverages?|relies on|is powered by|is built (?:with|on|using))\s+"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 3 in candidates:
+            for m in _ACTION_VERB_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 4: "X requires/needs/demands/mandates Y" ──────────
-        for m in re.finditer(
-            r"\b(?:the|our|my|their)?\s*"
-            r"([a-z][a-z\s']{0,30}?)\s+"
-            r"(?:requires?|needs?|demands?|mandates?|expects?)\s+"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 4 in candidates:
+            for m in _REQUIREMENT_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 5: "We agreed/decided to X" / "We chose X" ────────
-        m = re.search(
-            r"\b(?:we|they|the team|I)\s+"
-            r"(?:agreed|decided|chose|committed|opted)\s+"
-            r"(?:to\s+)?(?:use\s+|go with\s+|adopt\s+|implement\s+|switch to\s+)?"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        )
-        if m:
-            value = m.group(1).strip()
-            # Try to infer a slot name from the context
-            if re.search(r"REST|GraphQL|SOAP|gRPC", value, re.IGNORECASE):
-                _try_store("api_style", value)
-            elif re.search(r"arch|pattern|micro|mono", value, re.IGNORECASE):
-                _try_store("architecture", value)
-            else:
-                _try_store("decision", value)
+        if 5 in candidates:
+            m = _DECISION_RE.search(clause)
+            if m:
+                value = m.group(1).strip()
+                # Try to infer a slot name from the context
+                if _API_STYLE_RE.search(value):
+                    _try_store("api_style", value)
+                elif _ARCHITECTURE_RE.search(value):
+                    _try_store("architecture", value)
+                else:
+                    _try_store("decision", value)
 
         # ── Pattern 6: "X should be / must be / needs to be Y" ────────
-        for m in re.finditer(
-            r"\b(?:the|our|my|their)?\s*"
-            r"([a-z][a-z_\s]{1,25}?)\s+"
-            r"(?:should\s+be|must\s+be|needs?\s+to\s+be|has\s+to\s+be|ought\s+to\s+be)\s+"
-            rf"({_VAL}{{1,60}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 6 in candidates:
+            for m in _PRESCRIPTIVE_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 7: "X is set to Y" / "X is configured as Y" ──────
-        for m in re.finditer(
-            r"\b([a-z][a-z_\s]{1,25}?)\s+is\s+(?:set to|configured (?:as|to)|currently)\s+"
-            rf"({_VAL}{{1,60}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 7 in candidates:
+            for m in _SET_TO_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 8: "X is handled/managed/done via/by/through Y" ──
-        for m in re.finditer(
-            r"\b([a-z][a-z\s']{0,30}?)\s+"
-            r"is\s+(?:handled|managed|done|performed|implemented|achieved|provided)\s+"
-            r"(?:via|by|through|using|with)\s+"
-            rf"({_VAL}{{1,80}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 8 in candidates:
+            for m in _HANDLED_BY_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
         # ── Pattern 9: "X equals Y" / "X = Y" ────────────────────────
-        for m in re.finditer(
-            r"\b([a-z][a-z_\s]{1,25}?)\s+(?:equals?|==?)\s+"
-            rf"({_VAL}{{1,60}}?){_END}",
-            clause, flags=re.IGNORECASE,
-        ):
-            _try_store(m.group(1).strip(), m.group(2).strip())
+        if 9 in candidates:
+            for m in _EQUALS_RE.finditer(clause):
+                _try_store(m.group(1).strip(), m.group(2).strip())
 
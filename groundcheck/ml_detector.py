@@ -17,11 +17,12 @@ from typing import Dict, Any, Optional, Set
 
 logger = logging.getLogger(__name__)
 
-# Optional sklearn/numpy imports
+# Optional sklearn/numpy imports (sklearn first, so a missing sklearn does
+# not leave numpy imported for nothing)
 try:
-    import numpy as np
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
+    import numpy as np
     _SKLEARN_AVAILABLE = True
 except ImportError:
     np = None  # type: ignore
@@ -1,20 +1,147 @@
 """Semantic matching for paraphrase detection."""
 
-from typing import List, Optional, Set, Tuple
-from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from pathlib import Path
+import contextlib
+import functools
+import os
 import re
+import sys
+import threading
 
-try:
-    import numpy as np
-    _HAS_NUMPY = True
-except ImportError:
-    np = None
-    _HAS_NUMPY = False
+from .utils import is_similar, optional_numpy, similarity_ratio
+
+# Opt-in ONNX Runtime backend: export the embedding model to ONNX with int8
+# dynamic quantization (requires sentence-transformers[onnx]).
+_USE_ONNX = os.environ.get("GROUNDCHECK_USE_ONNX", "") == "1"
+_ONNX_QUANT_CONFIG = "avx512_vnni"
+
+# Optional torch intra-op thread count for embedding inference ("0" = one per
+# logical CPU). Unset keeps torch's default.
+_TORCH_THREADS = os.environ.get("GROUNDCHECK_TORCH_THREADS", "")
+
+# Opt-in int8 storage for cached embeddings: a quarter of float32's memory,
+# at the cost of cosine scores drifting by up to about 0.01.
+_INT8_CACHE = os.environ.get("GROUNDCHECK_INT8_EMBEDDING_CACHE", "") == "1"
+# Unit-length vectors have components in [-1, 1]; one fixed scale keeps
+# every cached vector the same dtype with no per-vector metadata.
+_INT8_SCALE = 127.0
+
+# Serializes first-time model loads; lru_cache alone lets concurrent first
+# callers each run the loader.
+_MODEL_LOCK = threading.Lock()
+
+
+# Paraphrase canonicalization, applied in order by _normalize_text
+_CANONICAL_SUBS = [(re.compile(pattern), repl) for pattern, repl in (
+    # ── Employer / work patterns ──
+    (r'\b(employed by|employed at|works for|working for|working at|works at|job at|employee of|employed with)\b',
+     'work at'),
+    # ── Location / residence patterns ──
+    (r'\b(resides in|based in|located in|living in|moved to|relocated to)\b', 'live in'),
+    # ── Education / school patterns ──
+    (r'\b(graduated from|graduate from|studied at|study at|attended|went to|alumni of|alumnus of)\b',
+     'study at'),
+    # ── Name patterns ──
+    (r'\b(named|called|known as|goes by|my name is|name is)\b', 'named'),
+    # ── Occupation / role patterns ──
+    (r'\b(works as|working as|employed as|job is|role is|position is|title is)\b', 'role'),
+    # ── Age patterns ──
+    (r'\b(years old|year old|aged)\b', 'years old'),
+    # ── Possessive pronoun stripping ──
+    (r'\b(my|your|his|her|their|our|its)\b', ''),
+    # ── Article stripping ──
+    (r'\b(a|an|the)\b', ''),
+    # ── Educational suffix noise ──
+    (r'\buniversity\b', ''),
+)]
+
+# ── Common abbreviation expansion ──
+# Expanded BEFORE stripping punctuation so that "NYC" → "new york city"
+# matches "New York City" via exact.  Keys are whole words and no expansion
+# contains another key, so one alternation is equivalent to applying them
+# one at a time.
+_ABBREVIATIONS = {
+    'nyc': 'new york city',
+    'la': 'los angeles',
+    'sf': 'san francisco',
+    'dc': 'washington dc',
+    'uk': 'united kingdom',
+    'us': 'united states',
+    'usa': 'united states',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'swe': 'software engineer',
+    'pm': 'product manager',
+    'ds': 'data scientist',
+    'phd': 'doctorate',
+    'mit': 'massachusetts institute of technology',
+}
+_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(_ABBREVIATIONS) + r')\b')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# Longer normalized values are rarely repeated verbatim; don't intern them
+_INTERN_MAX = 64
+
+# Below this many texts, per-text normalization is faster than joining
+_BATCH_MIN = 64
+
+
+def _abbreviation_expansion(m: "re.Match") -> str:
+    return _ABBREVIATIONS[m.group(1)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Normalize text for comparison.
+    
+    Canonicalizes common paraphrase forms into stable templates so that
+    semantically equivalent phrases produce the same normalized string.
+    Memory values are re-normalized on every verify() call, so results are
+    memoized.
+    """
+    if not text:
+        return ""
+    t = text.lower().strip()
+    for pattern, repl in _CANONICAL_SUBS:
+        t = pattern.sub(repl, t)
+    t = _ABBREVIATION_RE.sub(_abbreviation_expansion, t)
+    
+    # ── Strip non-alphanumeric ──
+    t = _NON_ALNUM_RE.sub(' ', t)
+    return _intern(' '.join(t.split()))
+
+
+def _intern(norm: str) -> str:
+    """Intern short normalized values so repeats share one string object.
+    
+    The same values ("microsoft", "works at") recur across memories and
+    claims; interned copies compare by identity first and share storage in
+    the synonym index and caches.
+    """
+    return sys.intern(norm) if len(norm) < _INTERN_MAX else norm
+
+
+def _normalize_batch(texts: List[str]) -> List[str]:
+    """Normalize many texts with one pass of each regex.
+    
+    Equivalent to ``[_normalize_text(t) for t in texts]``.  The texts are
+    joined on newlines (no pattern matches across one) so every
+    substitution runs once over the whole batch instead of once per text;
+    that only pays off for large batches, so small ones are mapped.
+    """
+    if len(texts) < _BATCH_MIN or any('\n' in t for t in texts):
+        return list(map(_normalize_text, texts))
+    t = '\n'.join(texts).lower()
+    for pattern, repl in _CANONICAL_SUBS:
+        t = pattern.sub(repl, t)
+    t = _ABBREVIATION_RE.sub(_abbreviation_expansion, t)
+    t = _NON_ALNUM_RE.sub(' ', t)
+    return [_intern(' '.join(part.split())) for part in t.split('\n')]
 
-# Global cache: Intentionally shared across instances to avoid reloading heavy models.
-# This is standard practice in ML libraries to save memory and startup time.
-# Thread safety: SentenceTransformer models are thread-safe for encoding.
-_embedding_model = None
 
 class SemanticMatcher:
     """
@@ -23,7 +150,7 @@ class SemanticMatcher:
     Strategies (in order):
     1. Exact match (fastest)
     2. Normalized match (remove articles, lowercase)
-    3. Fuzzy match (SequenceMatcher)
+    3. Fuzzy match (difflib ratio, prefiltered by rapidfuzz when installed)
     4. Synonym expansion (hardcoded synonyms)
     5. Embedding similarity (slowest, most accurate)
     """
@@ -59,162 +186,185 @@ class SemanticMatcher:
         self,
         use_embeddings: bool = True,
         embedding_model: str = "all-MiniLM-L6-v2",
-        embedding_threshold: float = 0.85
+        embedding_threshold: float = 0.85,
+        embedding_cache_size: int = 4096
     ):
         self.use_embeddings = use_embeddings
         self.embedding_model_name = embedding_model
         self.embedding_threshold = embedding_threshold
+        self.embedding_cache_size = embedding_cache_size
         self._model = None
+        # text -> unit-length embedding; oldest entries are evicted first
+        self._embedding_cache = {}
+        self._cache_lock = threading.Lock()
+        self._synonym_index: Optional[Dict[str, Dict[str, FrozenSet[str]]]] = None
     
-    def _get_embedding_model(self):
-        """Lazy load embedding model."""
-        global _embedding_model
-        if _embedding_model is None and self.use_embeddings:
-            try:
-                from sentence_transformers import SentenceTransformer
-                _embedding_model = SentenceTransformer(self.embedding_model_name)
-            except ImportError:
-                print("Warning: sentence-transformers not installed")
-                self.use_embeddings = False
-            except Exception as e:
-                print(f"Warning: Could not load embedding model: {e}")
-                self.use_embeddings = False
-        return _embedding_model
-    
-    def _normalize(self, text: str) -> str:
-        """Normalize text for comparison.
+    @classmethod
+    def get(
+        cls,
+        use_embeddings: bool = True,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        embedding_threshold: float = 0.85
+    ) -> "SemanticMatcher":
+        """Return a process-wide shared matcher for the given settings.
         
-        Canonicalizes common paraphrase forms into stable templates so that
-        semantically equivalent phrases produce the same normalized string.
+        Matchers hold no per-call state, so callers that construct one per
+        request (or per test) can share a single instance instead.
         """
-        if not text:
-            return ""
-        t = text.lower().strip()
-        
-        # ── Employer / work patterns ──
-        t = re.sub(
-            r'\b(employed by|employed at|works for|working for|working at|works at|job at|employee of|employed with)\b',
-            'work at',
-            t,
-        )
-        
-        # ── Location / residence patterns ──
-        t = re.sub(
-            r'\b(resides in|based in|located in|living in|moved to|relocated to)\b',
-            'live in',
-            t,
-        )
-        
-        # ── Education / school patterns ──
-        t = re.sub(
-            r'\b(graduated from|graduate from|studied at|study at|attended|went to|alumni of|alumnus of)\b',
-            'study at',
-            t,
-        )
-        
-        # ── Name patterns ──
-        t = re.sub(
-            r'\b(named|called|known as|goes by|my name is|name is)\b',
-            'named',
-            t,
-        )
-        
-        # ── Occupation / role patterns ──
-        t = re.sub(
-            r'\b(works as|working as|employed as|job is|role is|position is|title is)\b',
-            'role',
-            t,
-        )
-        
-        # ── Age patterns ──
-        t = re.sub(
-            r'\b(years old|year old|aged)\b',
-            'years old',
-            t,
-        )
-        
-        # ── Possessive pronoun stripping ──
-        t = re.sub(r'\b(my|your|his|her|their|our|its)\b', '', t)
-        
-        # ── Article stripping ──
-        t = re.sub(r'\b(a|an|the)\b', '', t)
+        return _get_matcher(cls, use_embeddings, embedding_model, embedding_threshold)
+    
+    def _get_embedding_model(self):
+        """Lazy load embedding model (shared by every matcher using it).
         
-        # ── Educational suffix noise ──
-        t = re.sub(r'\buniversity\b', '', t)
+        Matchers from :meth:`get` are shared process-wide, so the first
+        load is serialized; threads arriving meanwhile wait for it instead
+        of loading a second copy.
+        """
+        if self._model is None and self.use_embeddings:
+            with _MODEL_LOCK:
+                if self._model is None and self.use_embeddings:
+                    try:
+                        self._model = _load_st_model(self.embedding_model_name)
+                    except ImportError:
+                        print("Warning: sentence-transformers not installed")
+                        self.use_embeddings = False
+                    except Exception as e:
+                        print(f"Warning: Could not load embedding model: {e}")
+                        self.use_embeddings = False
+        return self._model
+    
+    @staticmethod
+    def _load_onnx_model(model_name: str):
+        """Load the embedding model on ONNX Runtime with int8 weights.
         
-        # ── Common abbreviation expansion ──
-        # Expand well-known abbreviations BEFORE stripping punctuation so that
-        # "NYC" → "new york city" matches "New York City" via exact.
-        _ABBREVIATIONS = {
-            r'\bnyc\b': 'new york city',
-            r'\bla\b': 'los angeles',
-            r'\bsf\b': 'san francisco',
-            r'\bdc\b': 'washington dc',
-            r'\buk\b': 'united kingdom',
-            r'\bus\b': 'united states',
-            r'\busa\b': 'united states',
-            r'\bml\b': 'machine learning',
-            r'\bai\b': 'artificial intelligence',
-            r'\bjs\b': 'javascript',
-            r'\bts\b': 'typescript',
-            r'\bpy\b': 'python',
-            r'\bswe\b': 'software engineer',
-            r'\bpm\b': 'product manager',
-            r'\bds\b': 'data scientist',
-            r'\bphd\b': 'doctorate',
-            r'\bmit\b': 'massachusetts institute of technology',
-        }
-        for pattern, expansion in _ABBREVIATIONS.items():
-            t = re.sub(pattern, expansion, t)
+        The model is exported once with dynamic axes, dynamically quantized
+        for VNNI int8 dot products and saved under
+        ``~/.groundcheck/onnx/<model>``; later loads reuse the saved file.
+        Returns None (falling back to the PyTorch model) if the export
+        toolchain is unavailable.
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+            from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+        except ImportError:
+            print("Warning: ONNX backend requires sentence-transformers[onnx]")
+            return None
         
-        # ── Strip non-alphanumeric ──
-        t = re.sub(r'[^a-z0-9\s]', ' ', t)
-        t = ' '.join(t.split())
-        return t
+        local_dir = Path.home() / ".groundcheck" / "onnx" / model_name.replace("/", "--")
+        file_name = f"onnx/model_qint8_{_ONNX_QUANT_CONFIG}.onnx"
+        model_kwargs = {"file_name": file_name, "provider": "CPUExecutionProvider"}
+        try:
+            if not (local_dir / file_name).exists():
+                model = SentenceTransformer(model_name, backend="onnx")
+                model.save_pretrained(str(local_dir))
+                export_dynamic_quantized_onnx_model(model, _ONNX_QUANT_CONFIG, str(local_dir))
+            return SentenceTransformer(str(local_dir), backend="onnx", model_kwargs=model_kwargs)
+        except Exception as e:
+            print(f"Warning: Could not load ONNX embedding model: {e}")
+            return None
+    
+    def _normalize(self, text: str) -> str:
+        """Normalize text for comparison (see :func:`_normalize_text`)."""
+        return _normalize_text(text)
     
     def _fuzzy_match(self, a: str, b: str, threshold: float = 0.85) -> bool:
         """Fuzzy string matching."""
-        return SequenceMatcher(None, a, b).ratio() >= threshold
+        return is_similar(a, b, threshold)
+    
+    def _slot_synonyms(self, slot: str) -> Dict[str, FrozenSet[str]]:
+        """Normalized synonym table for *slot* (empty if it has none)."""
+        index = self._synonym_index
+        if index is None:
+            if self.SYNONYMS is SemanticMatcher.SYNONYMS:
+                index = _SYNONYM_INDEX
+            else:
+                # Subclass with its own table; built once per instance
+                index = _build_synonym_index(self.SYNONYMS)
+            self._synonym_index = index
+        return index.get(slot) or {}
     
     def _synonym_match(self, claimed: str, supported: str, slot: str) -> bool:
         """Check if claimed and supported are synonyms."""
-        claimed_norm = self._normalize(claimed)
-        supported_norm = self._normalize(supported)
-        
-        slot_synonyms = self.SYNONYMS.get(slot, {})
-        
-        for base, variants in slot_synonyms.items():
-            all_forms = [base] + variants
-            all_forms_norm = [self._normalize(f) for f in all_forms]
-            
-            if claimed_norm in all_forms_norm and supported_norm in all_forms_norm:
-                return True
-        
-        return False
+        slot_index = self._slot_synonyms(slot)
+        if not slot_index:
+            return False
+        return _normalize_text(supported) in slot_index.get(_normalize_text(claimed), ())
     
     def _embedding_match(self, claimed: str, supported: str) -> bool:
         """Check semantic similarity via embeddings."""
-        if not _HAS_NUMPY:
-            return False
+        best = self._embedding_best_match(claimed, [supported])
+        return best is not None and best[1] >= self.embedding_threshold
+    
+    def _embedding_best_match(
+        self,
+        claimed: str,
+        candidates: List[str]
+    ) -> Optional[Tuple[str, float]]:
+        """Find the candidate closest to *claimed* in embedding space.
+        
+        The claim and all candidates are encoded in a single batch and
+        scored with one matrix-vector product over unit-length embeddings.
+        
+        Returns:
+            (best_candidate, cosine_similarity), or None if embeddings
+            are unavailable
+        """
+        np = optional_numpy()
+        if np is None or not candidates:
+            return None
         model = self._get_embedding_model()
         if model is None:
-            return False
+            return None
         
         try:
-            embeddings = model.encode([claimed, supported])
-            # Use cosine similarity (normalized dot product)
-            emb1, emb2 = embeddings[0], embeddings[1]
-            norm1 = np.linalg.norm(emb1)
-            norm2 = np.linalg.norm(emb2)
-            
-            # Handle zero vectors
-            if norm1 == 0 or norm2 == 0:
-                return False
-            
-            similarity = float(np.dot(emb1, emb2) / (norm1 * norm2))
-            return similarity >= self.embedding_threshold
+            embeddings = self._encode(model, [claimed, *candidates])
+            scores = embeddings[1:] @ embeddings[0]
+            best = int(np.argmax(scores))
+            return candidates[best], float(scores[best])
         except Exception:
-            return False
+            return None
+    
+    def _encode(self, model, texts: List[str]):
+        """Encode *texts* to unit-length embeddings, reusing cached vectors.
+        
+        Only texts missing from the cache are sent to the model, in a
+        single batch. Memory values recur across verify() calls, so in
+        steady state most candidates are cache hits.
+        
+        Cached vectors are kept as float16, which halves cache memory and
+        keeps cosine scores within about 1e-3 (or as int8 with
+        ``GROUNDCHECK_INT8_EMBEDDING_CACHE=1``); the returned matrix is
+        float32 so scoring still runs through BLAS.
+        """
+        np = optional_numpy()
+        cache = self._embedding_cache
+        vectors = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            vec = cache.get(text)
+            if vec is None:
+                missing.append(text)
+            else:
+                vectors[text] = vec
+        
+        if missing:
+            # No pre-sorting here: SentenceTransformer.encode already orders
+            # each call's inputs by length so batches carry minimal padding.
+            with _inference_mode():
+                fresh = model.encode(
+                    missing,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                )
+            # Matchers are shared across threads (see get()), so writes and
+            # evictions are serialized; lookups need no lock
+            with self._cache_lock:
+                for text, vec in zip(missing, _to_cache_dtype(np, fresh)):
+                    vectors[text] = cache[text] = vec
+                while len(cache) > self.embedding_cache_size:
+                    del cache[next(iter(cache))]
+        
+        return _from_cache_dtype(np, [vectors[text] for text in texts])
     
     def is_match(
         self,
@@ -228,64 +378,304 @@ class SemanticMatcher:
         Returns:
             (is_match, method_used, matched_value)
         """
+        result = self._cheap_match(claimed, supported_values, slot)
+        if result[0]:
+            return result
+        
+        # Strategy 5: Embedding match (slowest, only if others fail).
+        # All candidates are scored in one batch; the closest one wins.
+        if self.use_embeddings and supported_values:
+            best = self._embedding_best_match(claimed, list(supported_values))
+            if best is not None and best[1] >= self.embedding_threshold:
+                return True, "embedding", best[0]
+        
+        return False, "none", None
+    
+    def _cheap_match(
+        self,
+        claimed: str,
+        supported_values: Set[str],
+        slot: str = ""
+    ) -> Tuple[bool, str, Optional[str]]:
+        """Run every is_match strategy except the embedding stage."""
+        candidates = list(supported_values)
         claimed_norm = self._normalize(claimed)
+        candidate_norms = _normalize_batch(candidates)
         
-        for supported in supported_values:
-            supported_norm = self._normalize(supported)
-
-            # Strategy 0: Slot-aware synonym match should take precedence over
-            # normalization-based exact matching so method attribution remains
-            # meaningful in diagnostics/tests.
-            if slot and self._synonym_match(claimed, supported, slot):
-                return True, "synonym", supported
-            
-            # Strategy 1: Exact match
-            if claimed_norm == supported_norm:
-                return True, "exact", supported
-            
-            # Strategy 2: Fuzzy match
+        # Each strategy is tried against every candidate before moving on to
+        # the next, so the cheapest and strongest evidence wins.
+        
+        # Strategy 0: Slot-aware synonym match should take precedence over
+        # normalization-based exact matching so method attribution remains
+        # meaningful in diagnostics/tests.
+        # Slots without synonym groups skip the stage with one lookup.
+        synonyms = self._slot_synonyms(slot).get(claimed_norm) if slot else None
+        if synonyms:
+            for supported, supported_norm in zip(candidates, candidate_norms):
+                if supported_norm in synonyms:
+                    return True, "synonym", supported
+        
+        # Strategy 1: Exact match (a single C-level scan)
+        if claimed_norm in candidate_norms:
+            return True, "exact", candidates[candidate_norms.index(claimed_norm)]
+        
+        # Strategy 2: Fuzzy match
+        for supported, supported_norm in zip(candidates, candidate_norms):
             if self._fuzzy_match(claimed_norm, supported_norm):
                 return True, "fuzzy", supported
-            
-            # Strategy 3: Substring (for compound values)
-            if claimed_norm in supported_norm or supported_norm in claimed_norm:
+        
+        # Strategy 3: Substring (for compound values)
+        if candidates:
+            # Claim inside a candidate: one find() over the joined candidates
+            # (normalized text never contains a newline).
+            joined = "\n".join(candidate_norms)
+            pos = joined.find(claimed_norm)
+            if pos >= 0:
+                return True, "substring", candidates[joined.count("\n", 0, pos)]
+        
+        # Candidate inside the claim
+        for supported, supported_norm in zip(candidates, candidate_norms):
+            if supported_norm in claimed_norm:
                 return True, "substring", supported
-            
-            # Strategy 4b: Term-overlap for short factual phrases.
-            claimed_terms = set(claimed_norm.split())
-            supported_terms = set(supported_norm.split())
-            if claimed_terms and supported_terms:
-                overlap = len(claimed_terms & supported_terms) / len(claimed_terms)
-                if overlap >= 0.67:
-                    return True, "term_overlap", supported
         
-        # Strategy 5: Embedding match (slowest, only if others fail)
-        if self.use_embeddings:
-            for supported in supported_values:
-                if self._embedding_match(claimed, supported):
-                    return True, "embedding", supported
+        # Strategy 4b: Term-overlap for short factual phrases.
+        claimed_terms = set(claimed_norm.split())
+        if claimed_terms:
+            for supported, supported_norm in zip(candidates, candidate_norms):
+                supported_terms = set(supported_norm.split())
+                if supported_terms:
+                    overlap = len(claimed_terms & supported_terms) / len(claimed_terms)
+                    if overlap >= 0.67:
+                        return True, "term_overlap", supported
         
         return False, "none", None
     
+    def prefetch_embeddings(
+        self,
+        queries: Iterable[Tuple[str, Set[str], str]]
+    ) -> None:
+        """Embed everything a series of is_match calls will need, in one batch.
+        
+        Each query is an ``(claimed, supported_values, slot)`` triple as
+        passed to :meth:`is_match`. Queries settled by the cheap strategies
+        are skipped, so the model is only loaded when some claim actually
+        reaches the embedding stage. The vectors land in the embedding
+        cache, where the later is_match calls find them.
+        """
+        if not (self.use_embeddings and optional_numpy() is not None):
+            return
+        texts = []
+        for claimed, supported_values, slot in queries:
+            if supported_values and not self._cheap_match(claimed, supported_values, slot)[0]:
+                texts.append(claimed)
+                texts.extend(supported_values)
+        if not texts:
+            return
+        model = self._get_embedding_model()
+        if model is None:
+            return
+        try:
+            self._encode(model, texts)
+        except Exception:
+            pass
+    
+    def save_embedding_cache(self, path) -> int:
+        """Write the in-memory embedding cache to an ``.npz`` file.
+        
+        The file records the model name and the backend the model actually
+        loaded on, so a later
+        :meth:`load_embedding_cache` only reuses vectors from the same
+        model. Vectors are written as float16 whatever the in-memory
+        storage dtype. The write goes to a temporary file that replaces *path*, so
+        concurrent writers never leave a torn file behind.
+        
+        Args:
+            path: Destination file (conventionally ending in ``.npz``)
+            
+        Returns:
+            Number of embeddings written (0 without numpy or an empty cache)
+        """
+        np = optional_numpy()
+        if np is None:
+            return 0
+        with self._cache_lock:
+            texts = list(self._embedding_cache)
+            vectors = [self._embedding_cache[text] for text in texts]
+        if not texts:
+            return 0
+        model = self._get_embedding_model()
+        if model is None:
+            return 0
+        
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                model=np.array(_embedding_model_key(self.embedding_model_name, model)),
+                texts=np.array(texts),
+                vectors=_from_cache_dtype(np, vectors).astype(np.float16),
+            )
+        os.replace(tmp_path, path)
+        return len(texts)
+    
+    def load_embedding_cache(self, path) -> int:
+        """Seed the embedding cache from a :meth:`save_embedding_cache` file.
+        
+        Lets a new process skip re-encoding strings a previous run already
+        embedded. The embedding model is loaded first to learn its backend.
+        Missing or unreadable files, and files written for a different model
+        or backend, are ignored.
+        
+        Args:
+            path: File written by :meth:`save_embedding_cache`
+            
+        Returns:
+            Number of embeddings loaded (0 when no embedding model is available)
+        """
+        np = optional_numpy()
+        if np is None or not Path(path).is_file():
+            return 0
+        model = self._get_embedding_model()
+        if model is None:
+            return 0
+        key = _embedding_model_key(self.embedding_model_name, model)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["model"]) != key:
+                    return 0
+                texts = data["texts"].tolist()
+                vectors = _to_cache_dtype(np, data["vectors"].astype(np.float32))
+        except (OSError, KeyError, ValueError):
+            return 0
+        
+        cache = self._embedding_cache
+        with self._cache_lock:
+            for text, vec in zip(texts, vectors):
+                cache[text] = vec
+            while len(cache) > self.embedding_cache_size:
+                del cache[next(iter(cache))]
+        return len(texts)
+    
     def similarity(self, text_a: str, text_b: str) -> float:
         """Compute similarity score between two texts.
         
         Uses embedding cosine similarity if available, falls back to
-        SequenceMatcher ratio on normalized text.
+        a fuzzy ratio on normalized text.
         
         Returns:
             Float between 0.0 and 1.0
         """
-        if self.use_embeddings and _HAS_NUMPY:
+        if self.use_embeddings and optional_numpy() is not None:
             model = self._get_embedding_model()
             if model is not None:
                 try:
-                    embeddings = model.encode([text_a, text_b])
-                    emb1, emb2 = embeddings[0], embeddings[1]
-                    n1, n2 = np.linalg.norm(emb1), np.linalg.norm(emb2)
-                    if n1 > 0 and n2 > 0:
-                        return float(np.dot(emb1, emb2) / (n1 * n2))
+                    # Unit-length embeddings: the dot product is the cosine
+                    emb = self._encode(model, [text_a, text_b])
+                    return float(emb[0] @ emb[1])
                 except Exception:
                     pass
         # Fallback: fuzzy ratio on normalized text
-        return SequenceMatcher(None, self._normalize(text_a), self._normalize(text_b)).ratio()
+        return similarity_ratio(self._normalize(text_a), self._normalize(text_b))
+
+
+def _to_cache_dtype(np, embeddings):
+    """Convert unit-length float embeddings to the cache's storage dtype."""
+    if _INT8_CACHE:
+        scaled = np.rint(np.asarray(embeddings, dtype=np.float32) * _INT8_SCALE)
+        return np.clip(scaled, -127, 127).astype(np.int8)
+    return np.asarray(embeddings, dtype=np.float16)
+
+
+def _from_cache_dtype(np, vectors):
+    """Stack cached vectors into a float32 matrix for scoring."""
+    # One allocation that upcasts while copying
+    matrix = np.array(vectors, dtype=np.float32)
+    if matrix.size and vectors[0].dtype == np.int8:
+        matrix *= 1.0 / _INT8_SCALE
+    return matrix
+
+
+def _embedding_model_key(model_name: str, model) -> str:
+    """Identify the model and the backend it actually loaded on.
+    
+    Taken from the loaded *model* rather than ``GROUNDCHECK_USE_ONNX``: an
+    ONNX load that fell back to torch must not share cached vectors with a
+    real ONNX model. Models without a ``backend`` attribute run on torch.
+    """
+    return f"{model_name}|{getattr(model, 'backend', 'torch')}"
+
+
+# Global cache: intentionally shared across instances to avoid reloading heavy
+# models. One load per model name; SentenceTransformer models are thread-safe
+# for encoding.
+@functools.lru_cache(maxsize=None)
+def _load_st_model(model_name: str):
+    """Load (once per process) the sentence-transformers model *model_name*."""
+    from sentence_transformers import SentenceTransformer
+    model = None
+    if _USE_ONNX:
+        model = SemanticMatcher._load_onnx_model(model_name)
+    if model is None:
+        model = SentenceTransformer(model_name)
+    _configure_torch()
+    # Pay one-time kernel/allocator setup while loading rather than on the
+    # first verify() that needs an embedding.
+    with _inference_mode():
+        model.encode(["warm up"], convert_to_numpy=True)
+    return model
+
+
+def _configure_torch() -> None:
+    """Apply GROUNDCHECK_TORCH_THREADS once, when the model is first loaded."""
+    if not _TORCH_THREADS:
+        return
+    try:
+        import torch
+        threads = int(_TORCH_THREADS) or os.cpu_count() or 1
+        torch.set_num_threads(threads)
+        # Only allowed before any inter-op parallel work has started
+        torch.set_num_interop_threads(1)
+    except (ImportError, ValueError, RuntimeError):
+        pass
+
+
+def _inference_mode():
+    """``torch.inference_mode()`` if torch is available, else a no-op."""
+    try:
+        import torch
+    except ImportError:
+        return contextlib.nullcontext()
+    return torch.inference_mode()
+
+
+def _build_synonym_index(
+    synonyms: Dict[str, Dict[str, List[str]]]
+) -> Dict[str, Dict[str, FrozenSet[str]]]:
+    """Map slot -> normalized form -> every normalized form it is synonymous with."""
+    index: Dict[str, Dict[str, FrozenSet[str]]] = {}
+    for slot, groups in synonyms.items():
+        slot_index = index.setdefault(slot, {})
+        for base, variants in groups.items():
+            forms = frozenset(_normalize_text(f) for f in [base, *variants])
+            for form in forms:
+                slot_index[form] = slot_index.get(form, frozenset()) | forms
+    return index
+
+
+_SYNONYM_INDEX = _build_synonym_index(SemanticMatcher.SYNONYMS)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_matcher(
+    cls: type,
+    use_embeddings: bool,
+    embedding_model: str,
+    embedding_threshold: float,
+) -> SemanticMatcher:
+    """Build (once) the shared matcher behind :meth:`SemanticMatcher.get`."""
+    return cls(
+        use_embeddings=use_embeddings,
+        embedding_model=embedding_model,
+        embedding_threshold=embedding_threshold,
+    )
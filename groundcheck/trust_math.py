@@ -27,13 +27,8 @@ import math
 import re
 import logging
 
-# Optional numpy import with pure-Python fallback
-try:
-    import numpy as np
-    _NUMPY_AVAILABLE = True
-except ImportError:
-    np = None  # type: ignore
-    _NUMPY_AVAILABLE = False
+# numpy is optional (pure-Python fallback) and imported on first use
+from .utils import optional_numpy
 
 logger = logging.getLogger(__name__)
 
@@ -325,15 +320,16 @@ class CRTMath:
             return 0.0
 
         # Convert to list-like if needed
-        a_seq: Sequence[float] = a if not _NUMPY_AVAILABLE else a
-        b_seq: Sequence[float] = b if not _NUMPY_AVAILABLE else b
+        a_seq: Sequence[float] = a
+        b_seq: Sequence[float] = b
 
         if len(a_seq) == 0 or len(b_seq) == 0:
             return 0.0
         if len(a_seq) != len(b_seq):
             return 0.0
 
-        if _NUMPY_AVAILABLE:
+        np = optional_numpy()
+        if np is not None:
             a_arr = np.asarray(a, dtype=float)
             b_arr = np.asarray(b, dtype=float)
             norm_a = np.linalg.norm(a_arr)
@@ -516,7 +512,8 @@ class CRTMath:
                     return 0.95
 
         # Softmax over retrieval scores
-        if _NUMPY_AVAILABLE:
+        np = optional_numpy()
+        if np is not None:
             scores_array = np.array(retrieval_scores)
             exp_scores = np.exp(scores_array - np.max(scores_array))
             weights = exp_scores / np.sum(exp_scores)
@@ -529,7 +526,7 @@ class CRTMath:
         alignment = 0.0
         for i, mem in enumerate(retrieved_memories):
             sim = self.similarity(output_vector, mem["vector"])
-            w = weights[i] if _NUMPY_AVAILABLE else weights[i]
+            w = weights[i]
             alignment += float(w) * sim
 
         return alignment
@@ -1176,7 +1173,8 @@ def encode_vector(text: str, encoder=None) -> Any:
     # Convert each byte to a float in [-1, 1] range
     raw = [(float(b) - 127.5) / 127.5 for b in hash_bytes[:32]]
 
-    if _NUMPY_AVAILABLE:
+    np = optional_numpy()
+    if np is not None:
         vector = np.array(raw, dtype=np.float64)
         norm = np.linalg.norm(vector)
         if norm > 0:
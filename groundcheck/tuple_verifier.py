@@ -19,6 +19,7 @@ from typing import List, Optional, Set, Tuple, Dict, Any
 
 from .types import Memory, VerificationReport
 from .verifier import GroundCheck
+from .utils import is_similar
 
 logger = logging.getLogger(__name__)
 
@@ -305,9 +306,7 @@ class TupleGroundCheck(GroundCheck):
             return True, "substring"
         
         # Fuzzy string matching
-        from difflib import SequenceMatcher
-        ratio = SequenceMatcher(None, claimed_norm, memory_norm).ratio()
-        if ratio >= 0.85:
+        if is_similar(claimed_norm, memory_norm, 0.85):
             return True, "fuzzy"
         
         # Semantic similarity (if embeddings available)
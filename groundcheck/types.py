@@ -1,10 +1,14 @@
 """Type definitions for GroundCheck library."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
+# dataclass(slots=True) needs Python 3.10; 3.9 keeps a regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Memory:
     """A memory or retrieved context item.
     
@@ -14,6 +18,10 @@ class Memory:
         trust: Trust score between 0.0 and 1.0 (default: 1.0)
         metadata: Optional additional metadata
         timestamp: Optional Unix timestamp (seconds since epoch)
+    
+    Memories are created in bulk for every retrieval, so on Python 3.10+
+    the class uses ``__slots__``: no per-instance ``__dict__`` and faster
+    attribute reads. Fields stay mutable.
     """
     id: str
     text: str
@@ -118,3 +126,12 @@ class VerificationReport:
     contradiction_details: List['ContradictionDetail'] = field(default_factory=list)
     requires_disclosure: bool = False
     expected_disclosure: Optional[str] = None
+    
+    @property
+    def hallucination_set(self) -> FrozenSet[str]:
+        """Hallucinated values as a frozenset, for repeated membership tests.
+        
+        ``hallucinations`` stays an ordered list; build this view once and
+        reuse it rather than calling ``in`` on the list many times.
+        """
+        return frozenset(self.hallucinations)
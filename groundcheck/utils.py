@@ -2,8 +2,31 @@
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Set
+from difflib import SequenceMatcher
+from typing import Optional, Sequence, Set
+
+# rapidfuzz is optional (``pip install groundcheck[fast]``); difflib is the fallback
+try:
+    from rapidfuzz import fuzz as _fuzz, process as _process
+except ImportError:
+    _fuzz = None
+    _process = None
+
+
+@functools.lru_cache(maxsize=None)
+def optional_numpy():
+    """Return the numpy module, or None when it is not installed.
+    
+    numpy is imported on first use rather than at module import, so
+    ``import groundcheck`` and regex-only verification never pay for it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 def normalize_text(text: str) -> str:
@@ -18,6 +41,74 @@ def normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", (text or "").strip()).lower()
 
 
+# rapidfuzz's ratio is 2*LCS/(len(a)+len(b)), an upper bound on difflib's
+# ratio (difflib's matching blocks form a common subsequence). It can only
+# rule pairs out; difflib always has the final say, so installing the
+# extra never changes a verdict. The slack absorbs float rounding.
+_PREFILTER_SLACK = 1e-6
+
+
+def similarity_ratio(a: str, b: str) -> float:
+    """Return difflib's 0.0-1.0 similarity ratio between two strings.
+    
+    Args:
+        a: First string
+        b: Second string
+        
+    Returns:
+        Similarity ratio
+    """
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def is_similar(a: str, b: str, threshold: float) -> bool:
+    """Return whether ``similarity_ratio(a, b) >= threshold``.
+    
+    With rapidfuzz installed, pairs its compiled ratio already puts below
+    the threshold are rejected without running difflib.
+    
+    Args:
+        a: First string
+        b: Second string
+        threshold: Minimum similarity ratio (0.0-1.0)
+        
+    Returns:
+        True if the strings are at least *threshold* similar
+    """
+    if _fuzz is not None and _fuzz.ratio(a, b) / 100.0 < threshold - _PREFILTER_SLACK:
+        return False
+    return SequenceMatcher(None, a, b).ratio() >= threshold
+
+
+def first_similar(query: str, choices: Sequence[str], threshold: float) -> Optional[int]:
+    """Return the index of the first choice whose similarity to *query* exceeds *threshold*.
+    
+    With rapidfuzz every choice is prefiltered in one compiled call and
+    only the survivors are scored with difflib; otherwise every choice is
+    scored with difflib in order.
+    
+    Args:
+        query: String to compare
+        choices: Candidate strings, in priority order
+        threshold: Similarity ratio (0.0-1.0) a choice must exceed
+        
+    Returns:
+        Index of the earliest matching choice, or None
+    """
+    if _process is not None:
+        matches = _process.extract(
+            query, choices, scorer=_fuzz.ratio,
+            score_cutoff=(threshold - _PREFILTER_SLACK) * 100, limit=None,
+        )
+        candidates = sorted(index for _, _, index in matches)
+    else:
+        candidates = range(len(choices))
+    for index in candidates:
+        if SequenceMatcher(None, query, choices[index]).ratio() > threshold:
+            return index
+    return None
+
+
 def extract_memory_claim_phrases() -> Set[str]:
     """Get set of phrases that indicate memory claims.
     
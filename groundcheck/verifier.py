@@ -1,8 +1,8 @@
 """Core grounding verification logic for GroundCheck."""
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 import re
-from difflib import SequenceMatcher
+import threading
 
 from .types import Memory, VerificationReport, ExtractedFact
 from .fact_extractor import extract_fact_slots, split_compound_values
@@ -11,7 +11,9 @@ from .utils import (
     normalize_text,
     has_memory_claim,
     create_memory_claim_regex,
-    parse_fact_from_memory_text
+    parse_fact_from_memory_text,
+    is_similar,
+    first_similar
 )
 
 # Mapping of regex slot names → knowledge slot names they semantically cover.
@@ -53,6 +55,10 @@ class GroundCheck:
         >>> result = verifier.verify("You work at Amazon", memories)
         >>> print(result.passed)  # False
         >>> print(result.hallucinations)  # ["Amazon"]
+    
+    An instance may be shared between threads: its only mutable state is
+    the bounded per-memory fact cache, whose entries are immutable and
+    whose writes and evictions are serialized by a lock.
     """
     
     # Fact slots where multiple values are DEFINITELY contradictory.
@@ -116,6 +122,9 @@ class GroundCheck:
     # Only memories below 0.75 are considered unreliable noise
     MINIMUM_TRUST_FOR_DISCLOSURE = 0.75
     
+    # Memories whose extracted facts are kept between verify() calls
+    MEMORY_CACHE_SIZE = 4096
+    
     def __init__(self, neural: bool = False):
         """Initialize the GroundCheck verifier.
         
@@ -130,6 +139,11 @@ class GroundCheck:
         self.memory_claim_regex = create_memory_claim_regex()
         self.neural = neural
         self.semantic_threshold = 0.85  # Similarity threshold for paraphrases
+        # (memory id, memory text) -> supported (slot, normalized value)
+        # pairs; oldest entries are evicted first
+        self._memory_fact_cache: Dict[Tuple[str, str], Tuple[Tuple[str, str], ...]] = {}
+        # Guards cache writes and eviction; lookups need no lock
+        self._memory_fact_lock = threading.Lock()
         
         # Initialize hybrid extractor (graceful fallback if neural unavailable)
         self.hybrid_extractor = None
@@ -149,7 +163,7 @@ class GroundCheck:
         if neural:
             try:
                 from .semantic_matcher import SemanticMatcher
-                self.semantic_matcher = SemanticMatcher(
+                self.semantic_matcher = SemanticMatcher.get(
                     use_embeddings=True,
                     embedding_threshold=0.85
                 )
@@ -242,8 +256,7 @@ class GroundCheck:
                 return True
             
             # Fuzzy similarity match
-            similarity = SequenceMatcher(None, claimed_norm, supported_norm).ratio()
-            if similarity >= threshold:
+            if is_similar(claimed_norm, supported_norm, threshold):
                 return True
             
             # Term overlap check (for phrases)
@@ -317,12 +330,14 @@ class GroundCheck:
         from .types import ContradictionDetail
         
         # Group memories by fact slot (using both regex and two-tier extraction).
+        # Each slot keeps parallel columns (values, memory_ids, timestamps,
+        # trust_scores) that become a ContradictionDetail as-is.
         # De-duplicate (slot, memory_id, normalized_value) so hybrid extraction
         # paths do not double-count the same contradiction value.
-        slot_to_facts = defaultdict(list)
+        slot_columns: Dict[str, Tuple[list, list, list, list]] = {}
         seen_facts = defaultdict(set)
 
-        def _add_fact(slot: str, value: str, memory: Memory, tier: str, confidence: Optional[float] = None) -> None:
+        def _add_fact(slot: str, value: str, memory: Memory) -> None:
             norm_value = self._normalize_value(value)
             if not norm_value:
                 return
@@ -330,16 +345,14 @@ class GroundCheck:
             if key in seen_facts[slot]:
                 return
             seen_facts[slot].add(key)
-            fact_payload = {
-                'value': norm_value,
-                'memory_id': memory.id,
-                'timestamp': memory.timestamp,
-                'trust': memory.trust,
-                'tier': tier,
-            }
-            if confidence is not None:
-                fact_payload['confidence'] = confidence
-            slot_to_facts[slot].append(fact_payload)
+            columns = slot_columns.get(slot)
+            if columns is None:
+                columns = slot_columns[slot] = ([], [], [], [])
+            values, memory_ids, timestamps, trust_scores = columns
+            values.append(norm_value)
+            memory_ids.append(memory.id)
+            timestamps.append(memory.timestamp)
+            trust_scores.append(memory.trust)
         
         for memory in retrieved_memories:
             # Use TwoTierFactSystem if available for enhanced fact extraction
@@ -349,7 +362,7 @@ class GroundCheck:
                     
                     # Process hard facts (Tier A) — ALL slots, not just known-exclusive
                     for slot, fact in result.hard_facts.items():
-                        _add_fact(slot, fact.normalized, memory, tier='hard')
+                        _add_fact(slot, fact.normalized, memory)
                     
                     # Process open tuples (Tier B) with high confidence
                     for tuple_fact in result.open_tuples:
@@ -357,13 +370,7 @@ class GroundCheck:
                             attr = tuple_fact.attribute
                             # Safely get normalized_value with fallback to value
                             normalized = getattr(tuple_fact, 'normalized_value', None) or tuple_fact.value
-                            _add_fact(
-                                attr,
-                                normalized,
-                                memory,
-                                tier='open',
-                                confidence=float(tuple_fact.confidence),
-                            )
+                            _add_fact(attr, normalized, memory)
                 except Exception as e:
                     # Fall back to regex-only extraction
                     import logging
@@ -375,17 +382,21 @@ class GroundCheck:
             facts = extract_fact_slots(memory.text)
             for slot, fact in facts.items():
                 # Track ALL extracted slots — dynamic contradiction detection
-                _add_fact(slot, fact.normalized, memory, tier='regex')
+                _add_fact(slot, fact.normalized, memory)
         
         # Find slots with multiple different values
         contradictions = []
-        for slot, facts in slot_to_facts.items():
+        for slot, (values, memory_ids, timestamps, trust_scores) in slot_columns.items():
+            # A single fact cannot contradict anything
+            if len(values) < 2:
+                continue
+
             # Skip explicitly additive slots
             if slot in self.ADDITIVE_SLOTS:
                 continue
 
             # Get unique values (normalized)
-            unique_values = set(f['value'] for f in facts)
+            unique_values = set(values)
             
             if len(unique_values) > 1:
                 # For dynamically-discovered slots (not in KNOWN_EXCLUSIVE_SLOTS),
@@ -405,19 +416,7 @@ class GroundCheck:
                     except Exception:
                         pass  # Fall through to slot-based detection
 
-                # Contradiction detected!
-                # Build aligned lists to ensure values, memory_ids, timestamps, and trust_scores match
-                values = []
-                memory_ids = []
-                timestamps = []
-                trust_scores = []
-                
-                for fact in facts:
-                    values.append(fact['value'])
-                    memory_ids.append(fact['memory_id'])
-                    timestamps.append(fact['timestamp'])
-                    trust_scores.append(fact['trust'])
-                
+                # Contradiction detected! The columns are already aligned.
                 contradiction = ContradictionDetail(
                     slot=slot,
                     values=values,
@@ -543,6 +542,61 @@ class GroundCheck:
         
         return disclosure
     
+    def _memory_fact_values(self, memory: Memory) -> Tuple[Tuple[str, str], ...]:
+        """Return the (slot, normalized value) pairs *memory* supports.
+        
+        Results are cached by memory id and text, so a memory that comes
+        back unchanged in later verify() calls is not re-parsed; editing
+        its text simply misses the cache.
+        """
+        key = (memory.id, memory.text)
+        cached = self._memory_fact_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        pairs = []
+        # Try parsing structured FACT: format
+        parsed = parse_fact_from_memory_text(memory.text)
+        if parsed:
+            slot, value = parsed
+            pairs.append((slot, normalize_text(value)))
+        
+        # Also extract facts from memory text
+        memory_facts = extract_fact_slots(memory.text)
+        for slot, fact in memory_facts.items():
+            # Split compound values in memories too
+            for val in split_compound_values(str(fact.value)):
+                val_norm = self._normalize_value(val)
+                if val_norm:
+                    pairs.append((slot, val_norm))
+        
+        cached = tuple(pairs)
+        cache = self._memory_fact_cache
+        with self._memory_fact_lock:
+            cache[key] = cached
+            while len(cache) > self.MEMORY_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        return cached
+    
+    def _index_memory_facts(
+        self,
+        retrieved_memories: List[Memory]
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, Dict[str, str]]]:
+        """Collect the normalized fact values the memories support.
+        
+        Returns:
+            (values by slot, memory id by slot and value)
+        """
+        memory_facts_by_slot: Dict[str, Set[str]] = {}
+        memory_id_by_slot_value: Dict[str, Dict[str, str]] = {}
+        
+        for memory in retrieved_memories:
+            for slot, value_norm in self._memory_fact_values(memory):
+                memory_facts_by_slot.setdefault(slot, set()).add(value_norm)
+                memory_id_by_slot_value.setdefault(slot, {})[value_norm] = memory.id
+        
+        return memory_facts_by_slot, memory_id_by_slot_value
+    
     def verify(
         self,
         generated_text: str,
@@ -583,6 +637,16 @@ class GroundCheck:
             if slot not in facts_extracted and slot not in _covered:
                 facts_extracted[slot] = fact
         
+        # Nothing to ground (small talk, questions): skip indexing the
+        # memories, but still report the contradictions found among them.
+        if not facts_extracted:
+            return VerificationReport(
+                original=generated_text,
+                passed=True,
+                confidence=1.0,
+                contradiction_details=contradictions
+            )
+        
         # Build grounding map and collect hallucinations
         hallucinations = []
         out_of_scope = []
@@ -592,29 +656,17 @@ class GroundCheck:
         contradicted_claims = []
         
         # Parse supported facts from memories
-        memory_facts_by_slot: Dict[str, Set[str]] = {}
-        memory_id_by_slot_value: Dict[str, Dict[str, str]] = {}
-        memory_trust_by_id: Dict[str, float] = {m.id: m.trust for m in retrieved_memories}
-        
-        for memory in retrieved_memories:
-            # Try parsing structured FACT: format
-            parsed = parse_fact_from_memory_text(memory.text)
-            if parsed:
-                slot, value = parsed
-                value_norm = normalize_text(value)
-                memory_facts_by_slot.setdefault(slot, set()).add(value_norm)
-                memory_id_by_slot_value.setdefault(slot, {})[value_norm] = memory.id
-            
-            # Also extract facts from memory text
-            memory_facts = extract_fact_slots(memory.text)
-            for slot, fact in memory_facts.items():
-                # Split compound values in memories too
-                fact_values = split_compound_values(str(fact.value))
-                for val in fact_values:
-                    val_norm = self._normalize_value(val)
-                    if val_norm:
-                        memory_facts_by_slot.setdefault(slot, set()).add(val_norm)
-                        memory_id_by_slot_value.setdefault(slot, {})[val_norm] = memory.id
+        memory_facts_by_slot, memory_id_by_slot_value = self._index_memory_facts(
+            retrieved_memories
+        )
+        # Trust is only consulted for contradicted slots, so the lookup
+        # tables are skipped entirely when the memories agree.
+        contradiction_by_slot: Dict[str, 'ContradictionDetail'] = {}
+        for contradiction in contradictions:
+            contradiction_by_slot.setdefault(contradiction.slot, contradiction)
+        memory_trust_by_id: Dict[str, float] = (
+            {m.id: m.trust for m in retrieved_memories} if contradictions else {}
+        )
         
         # Check each extracted fact against memories
         for slot, fact in facts_extracted.items():
@@ -670,14 +722,11 @@ class GroundCheck:
                     # exists in a much higher-trust memory, reject the grounding.
                     # This prevents a 0.3-trust "Java" from being accepted when a
                     # 0.95-trust "Python" exists for the same slot.
-                    supporting_trust = memory_trust_by_id.get(memory_id, 1.0) if memory_id else 1.0
-                    slot_contradiction = next(
-                        (c for c in contradictions if c.slot == support_slot),
-                        None
-                    )
+                    slot_contradiction = contradiction_by_slot.get(support_slot)
                     
                     trust_overridden = False
                     if slot_contradiction and val_norm in slot_contradiction.values:
+                        supporting_trust = memory_trust_by_id.get(memory_id, 1.0) if memory_id else 1.0
                         # Find the highest trust among *other* values for this slot
                         for other_val, other_mid in memory_id_by_slot_value.get(support_slot, {}).items():
                             if other_val != val_norm:
@@ -812,6 +861,48 @@ class GroundCheck:
             expected_disclosure=expected_disclosure
         )
     
+    def verify_batch(
+        self,
+        generated_texts: List[str],
+        retrieved_memories: List[Memory],
+        mode: str = "strict"
+    ) -> List[VerificationReport]:
+        """Verify several generated texts against the same memories.
+        
+        Equivalent to calling :meth:`verify` on each text, except that in
+        neural mode every claim that needs an embedding comparison is
+        encoded together with its candidate values in one model call up
+        front, instead of one forward pass per text.
+        
+        Args:
+            generated_texts: The texts to verify
+            retrieved_memories: List of Memory objects shared by all texts
+            mode: Verification mode - "strict" or "permissive"
+            
+        Returns:
+            One VerificationReport per text, in order
+        """
+        if self.semantic_matcher is not None and self.semantic_matcher.use_embeddings:
+            memory_facts_by_slot, _ = self._index_memory_facts(retrieved_memories)
+            queries = []
+            for text in generated_texts:
+                if not text or not text.strip():
+                    continue
+                for slot, fact in self.extract_claims(text).items():
+                    slot_l = slot.lower()
+                    supported_values = memory_facts_by_slot.get(slot_l)
+                    if not supported_values:
+                        continue
+                    for val in split_compound_values(str(fact.value)):
+                        if self._normalize_value(val):
+                            queries.append((val, supported_values, slot_l))
+            self.semantic_matcher.prefetch_embeddings(queries)
+        
+        return [
+            self.verify(text, retrieved_memories, mode=mode)
+            for text in generated_texts
+        ]
+    
     def extract_claims(self, text: str) -> Dict[str, ExtractedFact]:
         """Extract factual claims from text.
         
@@ -847,34 +938,9 @@ class GroundCheck:
         Returns:
             Supporting Memory if found, None otherwise
         """
-        claim_norm = self._normalize_value(str(claim.value))
-        
-        for memory in memories:
-            # Parse structured facts from memory
-            parsed = parse_fact_from_memory_text(memory.text)
-            if parsed:
-                slot, value = parsed
-                if slot == claim.slot:
-                    # Use fuzzy matching for structured facts
-                    if self._is_value_supported(str(claim.value), {value}, slot=slot):
-                        return memory
-            
-            # Extract facts from memory text
-            memory_facts = extract_fact_slots(memory.text)
-            if claim.slot in memory_facts:
-                memory_fact = memory_facts[claim.slot]
-                # Use fuzzy matching
-                memory_values = split_compound_values(str(memory_fact.value))
-                if self._is_value_supported(str(claim.value), set(memory_values), slot=claim.slot):
-                    return memory
-            
-            # Fallback: fuzzy text matching in memory text
-            memory_norm = self._normalize_value(memory.text)
-            if claim_norm and (claim_norm in memory_norm or 
-                              SequenceMatcher(None, claim_norm, memory_norm).ratio() > 0.6):
-                return memory
-        
-        return None
+        return self._find_support_indexed(
+            claim, memories, self._index_memories(memories), [None] * len(memories)
+        )
     
     def build_grounding_map(
         self,
@@ -891,15 +957,90 @@ class GroundCheck:
             Dictionary mapping claim values to memory IDs
         """
         grounding_map = {}
+        # Index the memories once for all claims
+        by_slot = self._index_memories(memories)
+        memory_norms: List[Optional[str]] = [None] * len(memories)
         
         for slot, claim in claims.items():
-            supporting_memory = self.find_support(claim, memories)
+            supporting_memory = self._find_support_indexed(claim, memories, by_slot, memory_norms)
             if supporting_memory:
                 grounding_map[str(claim.value)] = supporting_memory.id
         
         return grounding_map
     
+    def _index_memories(self, memories: List[Memory]) -> Dict[str, List[Tuple[int, Set[str]]]]:
+        """Bucket the memories' fact values by slot.
+        
+        Returns:
+            Slot -> (memory position, candidate values) pairs in memory order.
+            A structured FACT: line and the regex facts of the same memory
+            are separate entries, matched separately as before.
+        """
+        by_slot: Dict[str, List[Tuple[int, Set[str]]]] = {}
+        for pos, memory in enumerate(memories):
+            parsed = parse_fact_from_memory_text(memory.text)
+            if parsed:
+                slot, value = parsed
+                by_slot.setdefault(slot, []).append((pos, {value}))
+            for slot, fact in extract_fact_slots(memory.text).items():
+                values = set(split_compound_values(str(fact.value)))
+                by_slot.setdefault(slot, []).append((pos, values))
+        return by_slot
+    
+    def _find_support_indexed(
+        self,
+        claim: ExtractedFact,
+        memories: List[Memory],
+        by_slot: Dict[str, List[Tuple[int, Set[str]]]],
+        memory_norms: List[Optional[str]]
+    ) -> Optional[Memory]:
+        """:meth:`find_support` over a prebuilt :meth:`_index_memories` index.
+        
+        Returns the first memory, in list order, that supports the claim
+        through its slot facts or through fuzzy matching of its whole text.
+        ``memory_norms`` caches normalized memory texts across claims.
+        """
+        claim_norm = self._normalize_value(str(claim.value))
         
+        # Earliest memory whose facts for this slot support the claim
+        slot_pos = len(memories)
+        for pos, values in by_slot.get(claim.slot, ()):
+            if self._is_value_supported(str(claim.value), values, slot=claim.slot):
+                slot_pos = pos
+                break
+        
+        # Fallback: fuzzy text matching in the memories before it. The
+        # cheap substring scan runs first, then every memory before its hit
+        # is scored against the claim in one batch.
+        if claim_norm and slot_pos:
+            for pos in range(slot_pos):
+                if memory_norms[pos] is None:
+                    memory_norms[pos] = self._normalize_value(memories[pos].text)
+            norms = memory_norms[:slot_pos]
+            text_pos = next(
+                (pos for pos, norm in enumerate(norms) if claim_norm in norm), slot_pos
+            )
+            fuzzy_pos = first_similar(claim_norm, norms[:text_pos], 0.6)
+            slot_pos = text_pos if fuzzy_pos is None else fuzzy_pos
+        
+        return memories[slot_pos] if slot_pos < len(memories) else None
+
+    def detect_contradictions(self, memories: List[Memory]) -> List['ContradictionDetail']:
+        """Detect contradictions among memories without verifying any text.
+
+        Memories are grouped by fact slot in a single pass, so this is much
+        cheaper than calling ``verify()`` on the concatenated memory text
+        just to read ``contradiction_details``.
+
+        Args:
+            memories: List of memories to analyze
+
+        Returns:
+            List of ContradictionDetail objects, one per contradicted slot
+        """
+        return self._detect_contradictions(memories)
+
+
     def _calculate_confidence(
         self,
         all_facts: Dict[str, ExtractedFact],
@@ -11,8 +11,9 @@ Usage:
 import argparse
 import json
 import logging
+import sqlite3
 import sys
-from typing import Optional
+from typing import List, Optional
 
 from mcp.server import FastMCP
 
@@ -26,6 +27,16 @@ except ImportError:
 
 from .storage import MemoryStore
 
+# orjson is optional; it serializes tool results several times faster
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = True) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    def _dumps(obj, indent: bool = True) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
 logger = logging.getLogger("groundcheck-mcp")
 
 # Global state
@@ -42,7 +53,8 @@ mcp = FastMCP(
         "user's latest message as the 'context' parameter — this automatically "
         "extracts and stores facts without needing a separate groundcheck_store call. "
         "Use groundcheck_store only for explicit corrections or important facts the "
-        "auto-extractor might miss. "
+        "auto-extractor might miss; use groundcheck_store_batch to store several "
+        "such facts in one call. "
         "Use groundcheck_verify before sending responses that reference stored facts. "
         "Use groundcheck_list to browse stored memories. "
         "Use groundcheck_delete to remove outdated or incorrect memories. "
@@ -102,6 +114,43 @@ def _report_to_dict(report: VerificationReport) -> dict:
     }
 
 
+def _store_and_check(texts, source: str, thread_id: str, ns: str):
+    """Store *texts* in one batch and check the thread for contradictions.
+
+    Returns ``(new_memories, facts_per_text, all_memories, contradictions)``.
+    """
+    store = _get_store()
+    verifier = _get_verifier()
+
+    # Store the new memories
+    new_mems = store.store_many(texts, thread_id=thread_id, source=source, namespace=ns)
+
+    # Get all memories for contradiction check (INCLUDING the new ones)
+    all_memories = store.get_all(thread_id=thread_id, namespace=ns)
+
+    # Extract facts from the new texts
+    facts_per_text = [extract_fact_slots(text) for text in texts]
+
+    # Detect contradictions across ALL memories (the verifier compares memories
+    # against each other on mutually exclusive slots)
+    contradictions = []
+    if len(all_memories) > 1 and any(facts_per_text):
+        # Group all memories by slot in one pass; no need to run the full
+        # verification pipeline over the concatenated memory text
+        contradictions = [
+            {
+                "slot": c.slot,
+                "values": c.values,
+                "most_trusted_value": c.most_trusted_value,
+                "most_recent_value": c.most_recent_value,
+                "action": "Ask user to confirm which is current",
+            }
+            for c in verifier.detect_contradictions(all_memories)
+        ]
+
+    return new_mems, facts_per_text, all_memories, contradictions
+
+
 @mcp.tool()
 def groundcheck_store(
     text: str,
@@ -124,37 +173,11 @@ def groundcheck_store(
             Leave empty to use the server's default namespace.
     """
     ns = namespace or _default_namespace
-    store = _get_store()
-    verifier = _get_verifier()
-
-    # Store the new memory
-    new_mem = store.store(text=text, thread_id=thread_id, source=source, namespace=ns)
-
-    # Get all memories for contradiction check (INCLUDING the new one)
-    all_memories = store.get_all(thread_id=thread_id, namespace=ns)
-    
-    # Extract facts from the new text
-    new_facts = extract_fact_slots(text)
-    
-    # Detect contradictions across ALL memories (the verifier compares memories
-    # against each other on mutually exclusive slots)
-    contradictions = []
-    if len(all_memories) > 1 and new_facts:
-        # Verify combined text against all memories — this triggers
-        # _detect_contradictions which compares memories cross-wise
-        combined = " ".join(m.text for m in all_memories)
-        report = verifier.verify(combined, all_memories, mode="permissive")
-        if report.contradiction_details:
-            contradictions = [
-                {
-                    "slot": c.slot,
-                    "values": c.values,
-                    "most_trusted_value": c.most_trusted_value,
-                    "most_recent_value": c.most_recent_value,
-                    "action": "Ask user to confirm which is current",
-                }
-                for c in report.contradiction_details
-            ]
+    new_mems, facts_per_text, all_memories, contradictions = _store_and_check(
+        [text], source, thread_id, ns,
+    )
+    new_mem = new_mems[0]
+    new_facts = facts_per_text[0]
 
     result = {
         "stored": True,
@@ -169,7 +192,65 @@ def groundcheck_store(
         "has_contradiction": len(contradictions) > 0,
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
+
+
+@mcp.tool()
+def groundcheck_store_batch(
+    texts: List[str],
+    source: str = "user",
+    thread_id: str = "default",
+    namespace: str = "",
+) -> str:
+    """Store several user facts at once with a single contradiction check.
+    
+    Prefer this over repeated groundcheck_store calls when the user states
+    multiple facts in one message. All facts share the same source,
+    thread, and namespace.
+    
+    Args:
+        texts: The facts to store (e.g. ['User works at Microsoft', 'User lives in Seattle'])
+        source: Source of the facts — user|document|code|inferred. Affects trust score.
+        thread_id: Thread/conversation ID for memory isolation.
+        namespace: Project scope. Use 'global' for personal user facts
+            (name, preferences) that should be available in every project.
+            Leave empty to use the server's default namespace.
+    """
+    ns = namespace or _default_namespace
+    texts = [t for t in texts if t and t.strip()]
+    if not texts:
+        return _dumps({
+            "stored": False,
+            "error": "Provide at least one non-empty fact to store.",
+        })
+
+    try:
+        new_mems, facts_per_text, all_memories, contradictions = _store_and_check(
+            texts, source, thread_id, ns,
+        )
+    except sqlite3.Error as e:
+        return _dumps({"stored": False, "error": f"Could not store facts: {e}"})
+
+    result = {
+        "stored": True,
+        "count": len(new_mems),
+        "memories": [
+            {
+                "memory_id": mem.id,
+                "text": mem.text,
+                "trust": mem.trust,
+                "facts_extracted": {k: v.value for k, v in facts.items()},
+            }
+            for mem, facts in zip(new_mems, facts_per_text)
+        ],
+        "source": source,
+        "namespace": ns,
+        "total_memories": len(all_memories),
+        "contradictions": contradictions,
+        "has_contradiction": len(contradictions) > 0,
+    }
+
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -210,6 +291,7 @@ def groundcheck_check(
             # Check existing memories to avoid storing duplicates
             existing = store.get_all(thread_id=thread_id, namespace=ns)
             existing_texts_lower = {m.text.lower() for m in existing}
+            existing_facts = [extract_fact_slots(m.text) for m in existing]
             
             for slot, fact in extracted.items():
                 # Build a storable sentence from the fact
@@ -219,12 +301,10 @@ def groundcheck_check(
                 if fact_text.lower() not in existing_texts_lower:
                     # Check if any existing memory already covers this slot
                     # with the same value (avoid near-duplicates)
-                    already_known = False
-                    for mem in existing:
-                        mem_facts = extract_fact_slots(mem.text)
-                        if slot in mem_facts and mem_facts[slot].normalized == fact.normalized:
-                            already_known = True
-                            break
+                    already_known = any(
+                        slot in mem_facts and mem_facts[slot].normalized == fact.normalized
+                        for mem_facts in existing_facts
+                    )
                     
                     if not already_known:
                         stored = store.store(
@@ -238,7 +318,8 @@ def groundcheck_check(
                             "memory_id": stored.id,
                         }
 
-    # ── Standard memory query ──
+    # ── Standard memory query (runs after auto-learning, so new facts
+    # are already included) ──
     memories = store.query(
         query=query, thread_id=thread_id,
         namespace=ns, include_global=include_global,
@@ -253,26 +334,16 @@ def groundcheck_check(
             "auto_learned": auto_learned,
             "note": "No memories stored for this thread yet.",
         }
-        return json.dumps(result, indent=2)
-    
-    # Re-query if we just learned something (so new facts appear in results)
-    if auto_learned:
-        memories = store.query(
-            query=query, thread_id=thread_id,
-            namespace=ns, include_global=include_global,
-        )
+        return _dumps(result)
 
     # Check for internal contradictions among retrieved memories
-    combined_text = " ".join(m.text for m in memories)
-    report = verifier.verify(combined_text, memories, mode="permissive")
+    contradiction_details = verifier.detect_contradictions(memories)
 
     # Trust reinforcement: retrieved memories get a small boost
-    for m in memories:
-        try:
-            new_trust = min(1.0, m.trust + 0.01)
-            store.update_trust(m.id, new_trust)
-        except Exception:
-            pass
+    try:
+        store.reinforce([m.id for m in memories], delta=0.01)
+    except Exception:
+        pass
 
     result = {
         "found": len(memories),
@@ -295,11 +366,11 @@ def groundcheck_check(
                 "most_trusted_value": c.most_trusted_value,
                 "most_recent_value": c.most_recent_value,
             }
-            for c in report.contradiction_details
+            for c in contradiction_details
         ],
     }
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -336,7 +407,7 @@ def groundcheck_verify(
             "note": "No memories to verify against. Passing by default.",
             "confidence": 0.0,
         }
-        return json.dumps(result, indent=2)
+        return _dumps(result)
 
     report = verifier.verify(draft, memories, mode=mode)
     result = _report_to_dict(report)
@@ -348,7 +419,7 @@ def groundcheck_verify(
             len(report.hallucinations), thread_id,
         )
 
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -396,7 +467,7 @@ def groundcheck_list(
             for m in memories
         ],
     }
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -421,34 +492,34 @@ def groundcheck_delete(
         confirm: Must be True to actually perform the deletion.
     """
     if not confirm:
-        return json.dumps({
+        return _dumps({
             "error": "Set confirm=True to actually delete. This is a safety check.",
             "deleted": 0,
-        })
+        }, indent=False)
 
     store = _get_store()
 
     if memory_id:
         store.delete(memory_id)
-        return json.dumps({"deleted": 1, "memory_id": memory_id})
+        return _dumps({"deleted": 1, "memory_id": memory_id}, indent=False)
 
     if thread_id:
         ns = namespace or None
         count = store.clear_thread(thread_id, namespace=ns)
-        return json.dumps({
+        return _dumps({
             "deleted": count,
             "thread_id": thread_id,
             "namespace": namespace or "all",
-        })
+        }, indent=False)
 
     if namespace:
         count = store.clear_namespace(namespace)
-        return json.dumps({"deleted": count, "namespace": namespace})
+        return _dumps({"deleted": count, "namespace": namespace}, indent=False)
 
-    return json.dumps({
+    return _dumps({
         "error": "Provide memory_id, thread_id, or namespace to specify what to delete.",
         "deleted": 0,
-    })
+    }, indent=False)
 
 
 def main():
@@ -3,6 +3,7 @@
 import json
 import sqlite3
 import time
+import uuid
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -49,6 +50,7 @@ class MemoryStore:
         """)
         self._conn.commit()
         self._migrate_add_namespace()
+        self._ensure_indexes()
     
     def _migrate_add_namespace(self) -> None:
         """Add namespace column if it doesn't exist (v0.4 → v0.5 migration)."""
@@ -58,11 +60,23 @@ class MemoryStore:
             self._conn.execute(
                 "ALTER TABLE memories ADD COLUMN namespace TEXT NOT NULL DEFAULT 'default'"
             )
-            self._conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_memories_namespace ON memories(namespace)"
-            )
             self._conn.commit()
     
+    def _ensure_indexes(self) -> None:
+        """Create indexes that depend on the namespace column.
+        
+        Every read filters on ``thread_id`` plus ``namespace`` and the
+        namespace-wide deletes filter on ``namespace`` alone, so both get
+        an index seek instead of a table scan.
+        """
+        self._conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_memories_namespace
+                ON memories(namespace);
+            CREATE INDEX IF NOT EXISTS idx_memories_thread_namespace
+                ON memories(thread_id, namespace);
+        """)
+        self._conn.commit()
+    
     def store(
         self,
         text: str,
@@ -89,6 +103,26 @@ class MemoryStore:
             code: 0.80
             inferred: 0.40
         """
+        return self.store_many(
+            [text], thread_id=thread_id, source=source, trust=trust,
+            metadata=metadata, namespace=namespace,
+        )[0]
+    
+    def store_many(
+        self,
+        texts: List[str],
+        thread_id: str = "default",
+        source: str = "user",
+        trust: Optional[float] = None,
+        metadata: Optional[Dict] = None,
+        namespace: str = "default",
+    ) -> List[Memory]:
+        """Store several memories with one INSERT batch and one commit.
+        
+        Takes the same arguments as :meth:`store`, applied to every text.
+        The batch is atomic: either every text is stored or none is.
+        Returns the new memories in input order.
+        """
         trust_defaults = {
             "user": 0.70,
             "document": 0.60,
@@ -99,25 +133,44 @@ class MemoryStore:
             trust = trust_defaults.get(source, 0.50)
         
         ts = int(time.time())
-        mem_id = f"mem_{namespace}_{thread_id}_{ts}_{hash(text) % 10000:04d}"
-        
         meta_json = json.dumps(metadata) if metadata else None
         
-        self._conn.execute(
-            """INSERT INTO memories
-               (id, thread_id, text, trust, source, timestamp, metadata, namespace)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (mem_id, thread_id, text, trust, source, ts, meta_json, namespace),
-        )
-        self._conn.commit()
+        # Every row in a batch shares ts, so the suffix must be unique per
+        # row, not derived from the text (duplicates would collide).
+        rows = [
+            (
+                f"mem_{namespace}_{thread_id}_{ts}_{uuid.uuid4().hex[:12]}",
+                thread_id, text, trust, source, ts, meta_json, namespace,
+            )
+            for text in texts
+        ]
+        # Commits on success and rolls back on error, so a failed batch
+        # never leaves half its rows for the next commit to persist.
+        with self._conn:
+            self._conn.executemany(
+                """INSERT INTO memories
+                   (id, thread_id, text, trust, source, timestamp, metadata, namespace)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
         
-        return Memory(
-            id=mem_id,
-            text=text,
-            trust=trust,
-            timestamp=ts,
-            metadata={"source": source, "namespace": namespace, **(metadata or {})},
-        )
+        return [
+            Memory(
+                id=row[0],
+                text=row[2],
+                trust=trust,
+                timestamp=ts,
+                metadata={"source": source, "namespace": namespace, **(metadata or {})},
+            )
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _scope(thread_id: str, namespace: str, include_global: bool):
+        """Build the WHERE clause and parameters shared by scoped reads."""
+        if include_global and namespace != "global":
+            return "thread_id = ? AND namespace IN (?, 'global')", (thread_id, namespace)
+        return "thread_id = ? AND namespace = ?", (thread_id, namespace)
     
     def query(
         self,
@@ -138,24 +191,15 @@ class MemoryStore:
                 from the ``"global"`` namespace so user-level facts
                 are always available regardless of which project is active.
         """
-        if include_global and namespace != "global":
-            rows = self._conn.execute(
-                """SELECT id, text, trust, timestamp, metadata, namespace
-                   FROM memories
-                   WHERE thread_id = ? AND namespace IN (?, 'global')
-                   ORDER BY trust DESC, timestamp DESC
-                   LIMIT ?""",
-                (thread_id, namespace, limit),
-            ).fetchall()
-        else:
-            rows = self._conn.execute(
-                """SELECT id, text, trust, timestamp, metadata, namespace
-                   FROM memories
-                   WHERE thread_id = ? AND namespace = ?
-                   ORDER BY trust DESC, timestamp DESC
-                   LIMIT ?""",
-                (thread_id, namespace, limit),
-            ).fetchall()
+        where, params = self._scope(thread_id, namespace, include_global)
+        rows = self._conn.execute(
+            f"""SELECT id, text, trust, timestamp, metadata, namespace
+               FROM memories
+               WHERE {where}
+               ORDER BY trust DESC, timestamp DESC
+               LIMIT ?""",
+            (*params, limit),
+        ).fetchall()
         
         memories = []
         for row in rows:
@@ -198,6 +242,22 @@ class MemoryStore:
         )
         self._conn.commit()
     
+    def reinforce(self, memory_ids: List[str], delta: float = 0.01) -> None:
+        """Raise the trust of several memories in a single UPDATE.
+        
+        Trust is capped at 1.0. Used for retrieval reinforcement, where
+        issuing one UPDATE per retrieved memory would scale with the
+        result size.
+        """
+        if not memory_ids:
+            return
+        placeholders = ", ".join("?" for _ in memory_ids)
+        self._conn.execute(
+            f"UPDATE memories SET trust = MIN(1.0, trust + ?) WHERE id IN ({placeholders})",
+            (delta, *memory_ids),
+        )
+        self._conn.commit()
+    
     def delete(self, memory_id: str) -> None:
         """Delete a specific memory."""
         self._conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
@@ -236,6 +296,25 @@ class MemoryStore:
         ).fetchall()
         return [row["namespace"] for row in rows]
     
+    def distinct_namespaces(
+        self,
+        thread_id: str = "default",
+        namespace: str = "default",
+        include_global: bool = True,
+    ) -> List[str]:
+        """Return the namespaces that :meth:`query` would draw memories from.
+        
+        Uses the same scope as :meth:`query` but only reads the namespace
+        labels, so callers that need label metadata don't have to load
+        every memory.
+        """
+        where, params = self._scope(thread_id, namespace, include_global)
+        rows = self._conn.execute(
+            f"SELECT DISTINCT namespace FROM memories WHERE {where} ORDER BY namespace",
+            params,
+        ).fetchall()
+        return [row["namespace"] for row in rows]
+    
     def close(self) -> None:
         """Close the database connection."""
         self._conn.close()
@@ -0,0 +1,77 @@
+"""Shared pytest configuration for the GroundCheck test suite.
+
+The suite is xdist-safe: fixtures only share immutable inputs or
+verifiers whose caches are lock-protected, so ``pytest -n auto`` is the
+standard way to run it. Tests that load the sentence-transformers model
+are pinned to one ``xdist_group`` so that, under ``--dist loadgroup``,
+only a single worker pays the model load. ``pytest -m "not neural"``
+skips them altogether for a fast edit-test loop.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+NEURAL_GROUP = "neural"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-embed-cache",
+        action="store_true",
+        help="do not reuse embeddings saved under .pytest_cache by earlier runs",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "neural: test loads the sentence-transformers embedding model"
+    )
+    config.addinivalue_line(
+        "markers", "verifier: core GroundCheck verifier tests (tests/test_verifier.py)"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run every test of the group on one xdist worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Shared executor for tests that dispatch verify() calls concurrently."""
+    with ThreadPoolExecutor() as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def verify_cached():
+    """Memoized ``verify`` for tests that only read the report.
+
+    Identical ``(verifier, text, memories, mode)`` calls across tests reuse
+    the first report, so callers must not mutate what they get back.
+    """
+    cache = {}
+
+    def verify(verifier, text, memories, mode="strict"):
+        key = (
+            verifier,
+            text,
+            tuple((m.id, m.text, m.trust, m.timestamp) for m in memories),
+            mode,
+        )
+        report = cache.get(key)
+        if report is None:
+            report = cache[key] = verifier.verify(text, memories, mode=mode)
+        return report
+
+    return verify
+
+
+# Runs before the built-in -m deselection, so tests that only use the
+# neural_verifier fixture are also dropped by ``-m "not neural"``.
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        if "neural_verifier" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.neural)
+        if item.get_closest_marker("neural"):
+            item.add_marker(pytest.mark.xdist_group(NEURAL_GROUP))
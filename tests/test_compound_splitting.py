@@ -144,3 +144,9 @@ def test_filters_empty_values():
     """Test that empty values are filtered out."""
     result = split_compound_values("Python,,,JavaScript,,Ruby")
     assert result == ["Python", "JavaScript", "Ruby"]
+
+
+def test_repeated_conjunctions():
+    """Test that a run of conjunctions is treated as one separator."""
+    result = split_compound_values("Python, Ruby, and and Go")
+    assert result == ["Python", "Ruby", "Go"]
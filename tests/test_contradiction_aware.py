@@ -175,6 +175,26 @@ class TestContradictionEdgeCases:
         assert len(contradictions) == 1
         assert len(contradictions[0].values) == 3
     
+    def test_contradiction_columns_stay_aligned(self):
+        """Test that values, ids, timestamps and trust line up per fact."""
+        verifier = GroundCheck()
+        memories = [
+            Memory(id="m1", text="User works at Microsoft", trust=0.6, timestamp=100),
+            Memory(id="m2", text="User lives in Seattle", trust=0.7, timestamp=200),
+            Memory(id="m3", text="User works at Amazon", trust=0.9, timestamp=300),
+            Memory(id="m4", text="User works at Microsoft", trust=0.8, timestamp=400),
+        ]
+        
+        contradictions = verifier._detect_contradictions(memories)
+        
+        assert len(contradictions) == 1
+        c = contradictions[0]
+        assert list(zip(c.values, c.memory_ids, c.timestamps, c.trust_scores)) == [
+            ("microsoft", "m1", 100, 0.6),
+            ("amazon", "m3", 300, 0.9),
+            ("microsoft", "m4", 400, 0.8),
+        ]
+    
     def test_trust_weighted_contradiction_resolution(self):
         """Test that high-trust memory is preferred in contradictions."""
         verifier = GroundCheck()
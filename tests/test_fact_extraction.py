@@ -393,3 +393,76 @@ def test_extract_hobby_compound():
     assert "hobby" in facts
     # Should capture the compound value
     assert "hiking" in facts["hobby"].value.lower()
+
+
+def test_triggered_groups_prefilter():
+    """Test the keyword prefilter that gates the profile extractor groups."""
+    from groundcheck.fact_extractor import _triggered_groups
+
+    assert _triggered_groups("The sky is blue") == set()
+    assert _triggered_groups("I graduated from MIT") == {"education"}
+    # Overlapping keywords from different groups are all reported
+    assert _triggered_groups("My wife is an expert in Go with a Master's degree") == {
+        "education", "personal", "professional",
+    }
+    # Non-ASCII text takes the IGNORECASE scan and agrees with the ASCII path
+    assert _triggered_groups("Ma WIFE est née à Paris") == {"personal"}
+    facts = extract_fact_slots("I studied Physics at Stanford and my phone is 555-123-4567")
+    assert facts["school"].value == "Stanford"
+    assert "phone" in facts
+
+
+def test_tech_groups_prefilter():
+    """Test the vocabulary scan that gates the technical extractor blocks."""
+    from groundcheck.fact_extractor import _tech_groups
+
+    assert _tech_groups("The sky is blue") == set()
+    assert _tech_groups("We are using PostgreSQL, deployed on AWS") == {"database", "cloud"}
+    # Non-ASCII text takes the regex path and still finds every block
+    assert _tech_groups("Café runs on Ubuntu and we use pytest") == {"os", "testing"}
+    facts = extract_fact_slots("Our stack is Django, running Python 3.11 on Heroku")
+    assert facts["framework"].value == "Django"
+    assert facts["python_version"].value == "Python 3.11"
+    assert facts["cloud"].value == "Heroku"
+
+
+def test_extract_fact_slots_returns_fresh_dict():
+    """Test that cached extraction still hands each caller its own dict."""
+    first = extract_fact_slots("My name is Alice")
+    first["extra"] = first["name"]
+    second = extract_fact_slots("My name is Alice")
+    assert "extra" not in second
+    assert second["name"] is first["name"]
+
+
+def test_dynamic_slot_names_are_interned():
+    """Test that slot names built from matched text are interned."""
+    import sys
+
+    facts = extract_fact_slots("FACT: build_tool = bazel")
+    slot = next(iter(facts))
+    assert slot is sys.intern("".join(["build", "_tool"]))
+    assert facts[slot].slot is slot
+
+
+def test_numeric_patterns_gated_on_digits():
+    """Test that number-bound patterns skip digit-free text but see any digit."""
+    assert "age" not in extract_fact_slots("I am thirty years old")
+    # The gate uses the same Unicode \d as the patterns themselves
+    assert extract_fact_slots("I am ٣٢ years old")["age"].value == "٣٢"
+    assert extract_fact_slots("The timeout is 30s")["timeout"].value == "30s"
+
+
+def test_word_gated_patterns():
+    """Test that shape-specific patterns only run when their key word occurs."""
+    from groundcheck.fact_extractor import _WORK_AT_RE
+
+    assert _WORK_AT_RE.search("The weather is nice today") is None
+    assert _WORK_AT_RE.search("I WORK AT Google").group(1) == "Google"
+    # Non-ASCII text bypasses the word check
+    assert _WORK_AT_RE.search("Café chat: I work at Google").group(1) == "Google"
+    assert list(_WORK_AT_RE.finditer("nothing here")) == []
+    assert extract_fact_slots("I think tabs are better than spaces")["opinion"]
+    # Contractions split into word tokens ("I'm" -> "i", "m")
+    assert extract_fact_slots("I'm vegan")["diet"].value == "vegan"
+    assert extract_fact_slots("FACT: favorite_tool = Vim")["favorite_tool"].value == "Vim"
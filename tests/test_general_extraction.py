@@ -260,6 +260,17 @@ class TestGeneralKnowledgeExtraction:
         assert "max_memory" in facts
         assert "16gb" in facts["max_memory"].normalized
 
+    def test_clause_verb_dispatch(self):
+        from groundcheck.fact_extractor import _clause_patterns
+
+        assert _clause_patterns("hello there friend") == set()
+        assert _clause_patterns("The cache IS set to 512mb") == {1, 2, 7}
+        # "needs" can start both a requirement and a "needs to be" clause
+        assert _clause_patterns("the api needs to be fast") == {4, 6}
+        assert _clause_patterns("ttl == 30") == {9}
+        # Non-ASCII clauses take the regex path with the same result
+        assert _clause_patterns("the café IS set to 512mb") == {1, 2, 7}
+
 
 # ── Structured FACT: format accepts any key ──────────────────────────────────
 
@@ -5,6 +5,12 @@ from groundcheck.neural_extractor import HybridFactExtractor, NeuralExtractionRe
 from groundcheck.semantic_matcher import SemanticMatcher
 
 
+@pytest.fixture(scope="module")
+def matcher():
+    """Shared embedding-free matcher; matchers keep no per-call state."""
+    return SemanticMatcher.get(use_embeddings=False)
+
+
 class TestHybridExtractor:
     """Test hybrid fact extraction."""
     
@@ -45,6 +51,7 @@ class TestHybridExtractor:
         # Should stay regex even with low confidence
         assert result.method == "regex"
     
+    @pytest.mark.neural
     def test_neural_extraction_graceful_fallback(self):
         """Test graceful fallback when transformers not available."""
         # Even if neural is enabled, it should work without transformers
@@ -59,39 +66,34 @@ class TestHybridExtractor:
 class TestSemanticMatcher:
     """Test semantic matching functionality."""
     
-    def test_exact_match(self):
+    def test_exact_match(self, matcher):
         """Test exact string matching."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("Microsoft", {"Microsoft"})
         assert is_match
         assert method == "exact"
         assert matched == "Microsoft"
     
-    def test_case_insensitive_match(self):
+    def test_case_insensitive_match(self, matcher):
         """Test case-insensitive matching."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("microsoft", {"Microsoft"})
         assert is_match
         assert method in ["exact", "fuzzy"]
     
-    def test_fuzzy_match(self):
+    def test_fuzzy_match(self, matcher):
         """Test fuzzy matching with slight variations."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("Seattle", {"Seattle, WA"})
         assert is_match
         # Should match via substring or fuzzy
         assert method in ["fuzzy", "substring"]
     
-    def test_substring_match(self):
+    def test_substring_match(self, matcher):
         """Test substring matching."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("Microsoft", {"Microsoft Corporation"})
         assert is_match
         assert method == "substring"
     
-    def test_synonym_match_employer(self):
+    def test_synonym_match_employer(self, matcher):
         """Test synonym matching for employer slot."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "works for Google",
             {"employed by Google"},
@@ -103,9 +105,8 @@ class TestSemanticMatcher:
         assert isinstance(is_match, bool)
         assert method in ["exact", "fuzzy", "substring", "synonym", "none"]
     
-    def test_synonym_match_location(self):
+    def test_synonym_match_location(self, matcher):
         """Test synonym matching for location slot."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "lives in Seattle",
             {"resides in Seattle"},
@@ -114,21 +115,20 @@ class TestSemanticMatcher:
         # Similar to above - may not match perfectly but should not crash
         assert isinstance(is_match, bool)
     
-    def test_no_match(self):
+    def test_no_match(self, matcher):
         """Test when values don't match."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("Microsoft", {"Google"})
         assert not is_match
         assert method == "none"
         assert matched is None
     
-    def test_normalization(self):
+    def test_normalization(self, matcher):
         """Test text normalization."""
-        matcher = SemanticMatcher(use_embeddings=False)
         # Test with articles
         is_match, method, matched = matcher.is_match("the Microsoft", {"Microsoft"})
         assert is_match
     
+    @pytest.mark.neural
     def test_embedding_match(self):
         """Test embedding-based matching with proper cosine similarity."""
         try:
@@ -44,6 +44,7 @@ class TestNeuralParameter:
         assert v.neural is False
 
     @requires_neural
+    @pytest.mark.neural
     def test_neural_true_creates_matcher(self):
         v = GroundCheck(neural=True)
         assert v.semantic_matcher is not None
@@ -82,6 +83,7 @@ class TestRegexOnlyBaseline:
 
 
 @requires_neural
+@pytest.mark.neural
 class TestNeuralParaphraseDetection:
     """End-to-end tests proving embedding similarity catches paraphrases
     that regex and fuzzy matching miss."""
@@ -154,6 +156,7 @@ class TestNeuralParaphraseDetection:
 
 
 @requires_neural
+@pytest.mark.neural
 class TestNeuralContradictionDetection:
     """Tests confirming NLI-based contradiction refinement works through verify()."""
 
@@ -190,6 +193,7 @@ class TestNeuralContradictionDetection:
 
 
 @requires_neural
+@pytest.mark.neural
 class TestMatcherStrategyAttribution:
     """Verify which matching strategy fires for different paraphrase types."""
 
@@ -1,91 +1,143 @@
 """Tests for semantic matcher functionality."""
 
 import pytest
-from groundcheck.semantic_matcher import SemanticMatcher
+from groundcheck.semantic_matcher import SemanticMatcher, _normalize_batch
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    """Shared embedding-free matcher; matchers keep no per-call state."""
+    return SemanticMatcher.get(use_embeddings=False)
 
 
 class TestSemanticMatcherNormalization:
     """Test text normalization in SemanticMatcher."""
     
-    def test_normalize_basic(self):
+    def test_normalize_basic(self, matcher):
         """Test basic text normalization."""
-        matcher = SemanticMatcher(use_embeddings=False)
         normalized = matcher._normalize("Hello World")
         assert normalized == "hello world"
     
-    def test_normalize_articles(self):
+    def test_normalize_articles(self, matcher):
         """Test that articles are removed."""
-        matcher = SemanticMatcher(use_embeddings=False)
         normalized = matcher._normalize("the Microsoft")
         assert normalized == "microsoft"
         
         normalized = matcher._normalize("a company")
         assert normalized == "company"
     
-    def test_normalize_whitespace(self):
+    def test_normalize_whitespace(self, matcher):
         """Test whitespace normalization."""
-        matcher = SemanticMatcher(use_embeddings=False)
         normalized = matcher._normalize("multiple   spaces")
         assert normalized == "multiple spaces"
     
-    def test_normalize_empty(self):
+    def test_normalize_empty(self, matcher):
         """Test normalizing empty string."""
-        matcher = SemanticMatcher(use_embeddings=False)
         normalized = matcher._normalize("")
         assert normalized == ""
+    
+    def test_normalize_abbreviations(self, matcher):
+        """Test that whole-word abbreviations are expanded."""
+        assert matcher._normalize("NYC") == "new york city"
+        assert matcher._normalize("Ph.D. from MIT") == "ph d from massachusetts institute of technology"
+        assert matcher._normalize("used") == "used"
+    
+    def test_normalize_interns_short_values(self, matcher):
+        """Test that equal short normalized values share one object."""
+        assert matcher._normalize("Microsoft") is matcher._normalize("  MICROSOFT!")
+    
+    def test_normalize_batch_matches_single(self, matcher):
+        """Test that batch normalization equals per-text normalization."""
+        texts = ["Works at Microsoft", "the NYC office", "", "  Based in  LA ", "Ph.D."] * 20
+        assert _normalize_batch(texts) == [matcher._normalize(t) for t in texts]
 
 
 class TestSemanticMatcherFuzzy:
     """Test fuzzy matching."""
     
-    def test_fuzzy_exact(self):
+    def test_fuzzy_exact(self, matcher):
         """Test fuzzy match with identical strings."""
-        matcher = SemanticMatcher(use_embeddings=False)
         assert matcher._fuzzy_match("test", "test")
     
-    def test_fuzzy_similar(self):
+    def test_fuzzy_similar(self, matcher):
         """Test fuzzy match with similar strings."""
-        matcher = SemanticMatcher(use_embeddings=False)
         assert matcher._fuzzy_match("hello", "hallo", threshold=0.8)
     
-    def test_fuzzy_different(self):
+    def test_fuzzy_different(self, matcher):
         """Test fuzzy match with different strings."""
-        matcher = SemanticMatcher(use_embeddings=False)
         assert not matcher._fuzzy_match("hello", "world")
+    
+    def test_similarity_ratio_bounds(self):
+        """Test the shared ratio helper regardless of backend."""
+        from groundcheck.utils import similarity_ratio
+        assert similarity_ratio("seattle", "seattle") == 1.0
+        assert similarity_ratio("abc", "xyz") == 0.0
+        assert 0.8 <= similarity_ratio("hello", "hallo") < 1.0
+
+    def test_first_similar_returns_earliest(self):
+        """Test that the batched fuzzy scan picks the first choice over the threshold."""
+        from groundcheck.utils import first_similar
+        choices = ["world", "hallo", "hello", "help"]
+        assert first_similar("hello", choices, 0.6) == 1
+        assert first_similar("hello", choices, 0.99) == 2
+        assert first_similar("xyz", choices, 0.6) is None
+        assert first_similar("hello", [], 0.6) is None
+
+    @pytest.mark.parametrize("backend", ["rapidfuzz", "difflib"])
+    def test_fuzzy_verdicts_follow_difflib(self, backend, monkeypatch):
+        """Test that installing rapidfuzz never changes a fuzzy verdict."""
+        from groundcheck import utils
+        if backend == "rapidfuzz":
+            if utils._fuzz is None:
+                pytest.skip("rapidfuzz not installed")
+        else:
+            monkeypatch.setattr(utils, "_fuzz", None)
+            monkeypatch.setattr(utils, "_process", None)
+        # rapidfuzz's Indel ratio puts both pairs over the threshold; difflib does not
+        assert not utils.is_similar("ebeeeee", "eeeee e", 0.85)
+        assert utils.first_similar("edbcdb", ["cdbedb", "edbcdb"], 0.6) == 1
+        assert utils.is_similar("seattle", "seatle", 0.85)
+        assert utils.first_similar("hello", ["world", "hallo"], 0.6) == 1
+    
+    def test_optional_numpy_resolves_once(self):
+        """Test that the lazy numpy lookup returns the module (or None) and caches it."""
+        import importlib.util
+        from groundcheck.utils import optional_numpy
+        np = optional_numpy()
+        if importlib.util.find_spec("numpy") is None:
+            assert np is None
+        else:
+            assert np.__name__ == "numpy"
+        assert optional_numpy() is np
 
 
 class TestSemanticMatcherSynonyms:
     """Test synonym matching."""
     
-    def test_synonym_match_employer_works_at(self):
+    def test_synonym_match_employer_works_at(self, matcher):
         """Test employer synonyms with 'works at'."""
-        matcher = SemanticMatcher(use_embeddings=False)
         result = matcher._synonym_match("works at", "employed by", "employer")
         assert result
     
-    def test_synonym_match_employer_variations(self):
+    def test_synonym_match_employer_variations(self, matcher):
         """Test various employer synonym variations."""
-        matcher = SemanticMatcher(use_embeddings=False)
         
         # Test pairs from the synonym list
         assert matcher._synonym_match("works at", "works for", "employer")
         assert matcher._synonym_match("employed by", "employed at", "employer")
     
-    def test_synonym_match_location(self):
+    def test_synonym_match_location(self, matcher):
         """Test location synonyms."""
-        matcher = SemanticMatcher(use_embeddings=False)
         assert matcher._synonym_match("lives in", "resides in", "location")
         assert matcher._synonym_match("lives in", "based in", "location")
     
-    def test_synonym_match_occupation(self):
+    def test_synonym_match_occupation(self, matcher):
         """Test occupation synonyms."""
-        matcher = SemanticMatcher(use_embeddings=False)
         assert matcher._synonym_match("software engineer", "software developer", "occupation")
         assert matcher._synonym_match("software engineer", "programmer", "occupation")
     
-    def test_synonym_no_match_different_slots(self):
+    def test_synonym_no_match_different_slots(self, matcher):
         """Test that synonyms don't match across different slots."""
-        matcher = SemanticMatcher(use_embeddings=False)
         # These aren't in the synonym list
         result = matcher._synonym_match("random1", "random2", "employer")
         assert not result
@@ -94,17 +146,15 @@ class TestSemanticMatcherSynonyms:
 class TestSemanticMatcherIntegration:
     """Test full is_match functionality."""
     
-    def test_is_match_exact(self):
+    def test_is_match_exact(self, matcher):
         """Test exact matching through is_match."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match("test", {"test", "other"})
         assert is_match
         assert method == "exact"
         assert matched in ["test", "other"]
     
-    def test_is_match_substring(self):
+    def test_is_match_substring(self, matcher):
         """Test substring matching."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "Microsoft",
             {"Microsoft Corporation", "Google"}
@@ -112,9 +162,8 @@ class TestSemanticMatcherIntegration:
         assert is_match
         assert method in ["exact", "substring"]
     
-    def test_is_match_no_match(self):
+    def test_is_match_no_match(self, matcher):
         """Test when there's no match."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "Apple",
             {"Microsoft", "Google"}
@@ -123,9 +172,8 @@ class TestSemanticMatcherIntegration:
         assert method == "none"
         assert matched is None
     
-    def test_is_match_with_slot_context(self):
+    def test_is_match_with_slot_context(self, matcher):
         """Test matching with slot context for synonyms."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "works at",
             {"employed by"},
@@ -134,15 +182,20 @@ class TestSemanticMatcherIntegration:
         assert is_match
         assert method == "synonym"
     
-    def test_is_match_multiple_candidates(self):
+    def test_is_match_multiple_candidates(self, matcher):
         """Test matching against multiple candidates."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "Seattle",
             {"New York", "Seattle", "Boston"}
         )
         assert is_match
         assert matched == "Seattle"
+    
+    def test_is_match_prefers_strongest_strategy(self, matcher):
+        """Test that an exact candidate wins over earlier weaker ones."""
+        for candidates in (["Seatle", "Seattle"], ["Seattle", "Seatle"]):
+            is_match, method, matched = matcher.is_match("Seattle", set(candidates))
+            assert (is_match, method, matched) == (True, "exact", "Seattle")
 
 
 class TestSemanticMatcherEmbeddings:
@@ -154,9 +207,26 @@ class TestSemanticMatcherEmbeddings:
         # Model should not be loaded yet
         assert matcher._model is None
     
-    def test_embedding_disabled_fallback(self):
+    def test_cheap_match_never_loads_model(self, monkeypatch):
+        """Test that a match found before the embedding stage skips the model."""
+        matcher = SemanticMatcher(use_embeddings=True)
+        
+        def fail():
+            raise AssertionError("embedding model loaded for a cheap match")
+        
+        monkeypatch.setattr(matcher, "_get_embedding_model", fail)
+        assert matcher.is_match("Microsoft", {"Microsoft"}) == (True, "exact", "Microsoft")
+        assert matcher.is_match("Microsoft", {"Microsoft Corporation"})[1] == "substring"
+        assert matcher._model is None
+    
+    def test_get_returns_shared_instance(self):
+        """Test that get() shares one matcher per configuration."""
+        shared = SemanticMatcher.get(use_embeddings=False)
+        assert SemanticMatcher.get(use_embeddings=False) is shared
+        assert SemanticMatcher.get(use_embeddings=False, embedding_threshold=0.9) is not shared
+    
+    def test_embedding_disabled_fallback(self, matcher):
         """Test that matcher works when embeddings are disabled."""
-        matcher = SemanticMatcher(use_embeddings=False)
         is_match, method, matched = matcher.is_match(
             "Microsoft",
             {"Microsoft Corporation"}
@@ -175,3 +245,154 @@ class TestSemanticMatcherEmbeddings:
         )
         # Should still match via exact match
         assert is_match
+
+
+class _StubEncoder:
+    """Stand-in for a SentenceTransformer that records each encode() batch."""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.batches = []
+    
+    def encode(self, texts, normalize_embeddings=False, convert_to_numpy=True):
+        np = pytest.importorskip("numpy")
+        self.batches.append(list(texts))
+        emb = np.array([self.vectors[t] for t in texts], dtype=np.float32)
+        if normalize_embeddings:
+            emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+        return emb
+
+
+class TestSemanticMatcherEmbeddingBatch:
+    """Test the embedding stage against a stub encoder."""
+    
+    VECTORS = {
+        "Big Apple": [1.0, 0.1, 0.0],
+        "New York": [0.9, 0.1, 0.0],
+        "Boston": [0.0, 1.0, 0.0],
+        "Chicago": [0.0, 0.0, 1.0],
+    }
+    
+    @pytest.fixture
+    def stub_matcher(self, monkeypatch):
+        pytest.importorskip("numpy")
+        matcher = SemanticMatcher(use_embeddings=True)
+        encoder = _StubEncoder(self.VECTORS)
+        monkeypatch.setattr(matcher, "_get_embedding_model", lambda: encoder)
+        return matcher, encoder
+    
+    def test_candidates_encoded_in_one_batch(self, stub_matcher):
+        matcher, encoder = stub_matcher
+        is_match, method, matched = matcher.is_match(
+            "Big Apple", {"Boston", "New York", "Chicago"}
+        )
+        assert (is_match, method, matched) == (True, "embedding", "New York")
+        assert len(encoder.batches) == 1
+        assert encoder.batches[0][0] == "Big Apple"
+        assert sorted(encoder.batches[0][1:]) == ["Boston", "Chicago", "New York"]
+    
+    def test_below_threshold_is_no_match(self, stub_matcher):
+        matcher, _ = stub_matcher
+        is_match, method, matched = matcher.is_match("Big Apple", {"Boston", "Chicago"})
+        assert (is_match, method, matched) == (False, "none", None)
+    
+    def test_repeated_candidates_hit_cache(self, stub_matcher):
+        matcher, encoder = stub_matcher
+        matcher.is_match("Big Apple", {"Boston", "New York"})
+        matcher.is_match("Big Apple", {"Boston", "New York"})
+        assert len(encoder.batches) == 1
+        
+        matcher.is_match("Big Apple", {"Boston", "Chicago"})
+        assert encoder.batches[-1] == ["Chicago"]
+    
+    def test_prefetch_encodes_all_queries_in_one_batch(self, stub_matcher):
+        matcher, encoder = stub_matcher
+        matcher.prefetch_embeddings([
+            ("Big Apple", {"Boston", "New York"}, "location"),
+            ("Chicago", {"Chicago"}, "location"),  # exact match, never embedded
+        ])
+        assert len(encoder.batches) == 1
+        assert sorted(encoder.batches[0]) == ["Big Apple", "Boston", "New York"]
+        
+        assert matcher.is_match("Big Apple", {"Boston", "New York"}) == (True, "embedding", "New York")
+        assert len(encoder.batches) == 1
+    
+    def test_cache_is_bounded(self, stub_matcher):
+        matcher, encoder = stub_matcher
+        matcher.embedding_cache_size = 2
+        matcher.is_match("Big Apple", {"Boston", "Chicago"})
+        assert len(matcher._embedding_cache) == 2
+    
+    def test_cache_stores_half_precision(self, stub_matcher):
+        np = pytest.importorskip("numpy")
+        matcher, _ = stub_matcher
+        matcher.is_match("Big Apple", {"New York"})
+        assert all(vec.dtype == np.float16 for vec in matcher._embedding_cache.values())
+        assert matcher._encode(None, ["Big Apple"]).dtype == np.float32
+    
+    def test_int8_cache_keeps_scores_close(self, stub_matcher, monkeypatch, tmp_path):
+        np = pytest.importorskip("numpy")
+        import groundcheck.semantic_matcher as sm
+        monkeypatch.setattr(sm, "_INT8_CACHE", True)
+        matcher, _ = stub_matcher
+        assert matcher.is_match("Big Apple", {"New York"}) == (True, "embedding", "New York")
+        assert all(vec.dtype == np.int8 for vec in matcher._embedding_cache.values())
+        assert matcher.similarity("Big Apple", "New York") == pytest.approx(0.99994, abs=1e-2)
+        
+        path = tmp_path / "embeddings.npz"
+        matcher.save_embedding_cache(path)
+        monkeypatch.setattr(sm, "_INT8_CACHE", False)
+        fresh = SemanticMatcher(use_embeddings=True)
+        monkeypatch.setattr(fresh, "_get_embedding_model", lambda: _StubEncoder(self.VECTORS))
+        assert fresh.load_embedding_cache(path) == 2
+        assert all(vec.dtype == np.float16 for vec in fresh._embedding_cache.values())
+    
+    def test_similarity_is_cosine_of_cached_embeddings(self, stub_matcher):
+        matcher, encoder = stub_matcher
+        assert matcher.similarity("Big Apple", "New York") == pytest.approx(0.99994, abs=1e-3)
+        assert matcher.similarity("Boston", "Chicago") == pytest.approx(0.0)
+        matcher.similarity("New York", "Big Apple")
+        assert len(encoder.batches) == 2
+    
+    def test_embedding_cache_round_trips_through_disk(self, stub_matcher, tmp_path, monkeypatch):
+        matcher, encoder = stub_matcher
+        matcher.is_match("Big Apple", {"Boston", "New York"})
+        path = tmp_path / "embeddings.npz"
+        assert matcher.save_embedding_cache(path) == 3
+        
+        fresh = SemanticMatcher(use_embeddings=True)
+        monkeypatch.setattr(fresh, "_get_embedding_model", lambda: encoder)
+        assert fresh.load_embedding_cache(path) == 3
+        assert fresh.is_match("Big Apple", {"Boston", "New York"}) == (True, "embedding", "New York")
+        assert len(encoder.batches) == 1
+        
+        other_model = SemanticMatcher(use_embeddings=True, embedding_model="other-model")
+        monkeypatch.setattr(other_model, "_get_embedding_model", lambda: encoder)
+        assert other_model.load_embedding_cache(path) == 0
+        assert fresh.load_embedding_cache(tmp_path / "missing.npz") == 0
+    
+    def test_embedding_cache_keyed_by_loaded_backend(self, stub_matcher, tmp_path, monkeypatch):
+        import groundcheck.semantic_matcher as sm
+        matcher, encoder = stub_matcher
+        # ONNX was requested but the load fell back to torch.
+        monkeypatch.setattr(sm, "_USE_ONNX", True)
+        matcher.is_match("Big Apple", {"New York"})
+        path = tmp_path / "embeddings.npz"
+        assert matcher.save_embedding_cache(path) == 2
+        
+        onnx_encoder = _StubEncoder(self.VECTORS)
+        onnx_encoder.backend = "onnx"
+        onnx_matcher = SemanticMatcher(use_embeddings=True)
+        monkeypatch.setattr(onnx_matcher, "_get_embedding_model", lambda: onnx_encoder)
+        assert onnx_matcher.load_embedding_cache(path) == 0
+        
+        torch_matcher = SemanticMatcher(use_embeddings=True)
+        monkeypatch.setattr(torch_matcher, "_get_embedding_model", lambda: encoder)
+        assert torch_matcher.load_embedding_cache(path) == 2
+    
+    def test_embedding_cache_needs_a_model(self, stub_matcher, tmp_path):
+        matcher, _ = stub_matcher
+        matcher.is_match("Big Apple", {"New York"})
+        path = tmp_path / "embeddings.npz"
+        matcher.save_embedding_cache(path)
+        assert SemanticMatcher(use_embeddings=False).load_embedding_cache(path) == 0